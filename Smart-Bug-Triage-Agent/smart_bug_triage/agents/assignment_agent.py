@@ -13,7 +13,10 @@ from ..api.jira_client import JiraAPIClient
 from ..message_queue.consumer import MessageConsumer, MessageHandler
 from ..message_queue.publisher import MessagePublisher
 from ..message_queue.serialization import MessageType
-from ..models.common import CategorizedBug, DeveloperProfile, DeveloperStatus, Assignment
+from ..models.common import (
+    CategorizedBug, DeveloperProfile, DeveloperStatus, Assignment,
+    AvailabilityStatus, BugReport, BugCategory, Priority
+)
 from ..models.database import (
     Bug, Developer, DeveloperStatus as DBDeveloperStatus, 
     Assignment as DBAssignment, AssignmentFeedback
@@ -52,7 +55,7 @@ class AssignmentMessageHandler(MessageHandler):
         self.assignment_agent = assignment_agent
         self.logger = logging.getLogger(__name__)
     
-    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: str) -> bool:
+    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: int) -> bool:
         """Handle categorized bug messages for assignment.
         
         Args:
@@ -244,8 +247,6 @@ class AssignmentAgent(Agent):
         try:
             # This would typically involve deserializing the message data
             # For now, we'll assume the data structure matches our model
-            from ..models.common import BugReport, BugCategory, Priority
-            
             bug_report_data = data.get('bug_report', {})
             bug_report = BugReport(
                 id=bug_report_data['id'],
@@ -315,7 +316,6 @@ class AssignmentAgent(Agent):
                     ).first()
                     
                     if db_status:
-                        from ..models.common import AvailabilityStatus
                         status = DeveloperStatus(
                             developer_id=dev.id,
                             current_workload=db_status.current_workload,
@@ -12,7 +12,9 @@ from .base import Agent
 from ..api.github_client import GitHubAPIClient, GitHubIssue
 from ..api.jira_client import JiraAPIClient, JiraIssue
 from ..api.webhook_receiver import WebhookReceiver, WebhookEvent
-from ..message_queue.connection import MessageQueueConnection
+from ..message_queue.connection import (
+    MessageQueueConnection, get_shared_connection, release_shared_connection
+)
 from ..message_queue.publisher import MessagePublisher
 from ..models.common import BugReport
 from ..config.settings import SystemConfig
@@ -122,9 +124,11 @@ class ListenerAgent(Agent):
             if self.webhook_thread and self.webhook_thread.is_alive():
                 self.webhook_thread.join(timeout=10)
             
-            # Close message queue connection
+            # Publish anything still batched, then close the connection
+            if self.publisher:
+                self.publisher.close()
             if self.mq_connection:
-                self.mq_connection.disconnect()
+                release_shared_connection(self.mq_connection)
             
             self.status = "stopped"
             self.log_info("Listener Agent stopped successfully")
@@ -191,7 +195,7 @@ class ListenerAgent(Agent):
     def _initialize_message_queue(self) -> bool:
         """Initialize message queue connection and publisher."""
         try:
-            self.mq_connection = MessageQueueConnection(self.system_config.message_queue)
+            self.mq_connection = get_shared_connection(self.system_config.message_queue)
             
             if not self.mq_connection.connect():
                 self.log_error("Failed to connect to message queue")
@@ -35,7 +35,7 @@ class BugTriageHandler(MessageHandler):
         self.triage_agent = triage_agent
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
     
-    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: str) -> bool:
+    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: int) -> bool:
         """Handle incoming bug report messages.
         
         Args:
@@ -132,6 +132,7 @@ class TriageAgent(Agent):
                 "notifications": "notifications_queue"
             })
         )
+        # Its own connection, not the shared one: the consumer drives its I/O loop
         self.mq_connection = MessageQueueConnection(mq_config)
         
         # Message queue components
@@ -223,7 +224,9 @@ class TriageAgent(Agent):
             if self.consumer:
                 self.consumer.stop_consuming()
             
-            # Close connections
+            # Publish anything still batched, then close connections
+            if self.publisher:
+                self.publisher.close()
             if self.mq_connection:
                 self.mq_connection.disconnect()
             
@@ -1,10 +1,23 @@
 """Configuration settings and environment management."""
 
 import os
-from typing import Dict, Any, Optional, List
+import sys
+from typing import Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 import json
 import logging
+from operator import attrgetter
+from functools import cached_property
+
+
+def _parse_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated env value into a tuple of interned, non-empty items."""
+    return tuple(sys.intern(item.strip()) for item in value.split(',') if item.strip())
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an env flag the way the settings always have: only 'true' is true."""
+    return value.lower() == 'true'
 
 
 @dataclass
@@ -47,6 +60,40 @@ class MessageQueueConfig:
         "assignments": "assignments_queue",
         "notifications": "notifications_queue"
     })
+    channel_pool_size: int = 8  # Pre-opened channels shared by publish/admin operations
+    heartbeat_send: float = 60.0  # heartbeat unit in seconds; the idle timeout is this x heartbeat_fail_multiplier
+    heartbeat_fail_multiplier: int = 3  # negotiated idle timeout in heartbeat_send units; pika sends a heartbeat every half of it
+    blocked_connection_timeout: float = 300.0  # seconds to wait while the broker blocks publishing
+    retry_delays: Tuple[int, ...] = (300, 900, 3600)  # seconds before the 1st, 2nd, 3rd+ DLQ retry
+    wire_format: str = "json"  # or "msgpack" (needs msgspec); consumers read both
+    
+    # Derived names, computed on first use; queue_names must be final by then
+    
+    @cached_property
+    def dlx_name(self) -> str:
+        """Name of the dead letter exchange."""
+        return f"{self.exchange_name}.dlx"
+    
+    @cached_property
+    def routing_map(self) -> Dict[str, Tuple[str, str, str, str]]:
+        """Map queue key to (queue_name, dlq_name, routing_key, failed_routing_key)."""
+        return {
+            queue_key: (
+                queue_name,
+                f"{queue_name}.dlq",
+                f"bug_triage.{queue_key}",
+                f"{queue_name}.failed"
+            )
+            for queue_key, queue_name in self.queue_names.items()
+        }
+    
+    @cached_property
+    def retry_routes(self) -> Tuple[Tuple[str, int], ...]:
+        """(retry exchange and queue name, delay in seconds) for each of retry_delays."""
+        return tuple(
+            (f"{self.exchange_name}.retry.{delay}s", delay)
+            for delay in self.retry_delays
+        )
 
 
 @dataclass
@@ -101,9 +148,9 @@ class DeveloperDiscoveryConfig:
     min_contributions: int = 5
     lookback_months: int = 6
     github_organization: str = ""
-    github_repositories: List[str] = field(default_factory=list)
+    github_repositories: Tuple[str, ...] = field(default_factory=tuple)
     github_repo_pattern: str = ""
-    jira_projects: List[str] = field(default_factory=list)
+    jira_projects: Tuple[str, ...] = field(default_factory=tuple)
     jira_project_pattern: str = ""
 
 
@@ -143,6 +190,81 @@ class NotificationConfig:
     confirmation_timeout: int = 300  # 5 minutes
 
 
+# (env var, SystemConfig section, attribute, cast) applied in order by SystemConfig.from_env
+_ENV_SPEC: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    # Database configuration
+    ('DB_HOST', 'database', 'host', str),
+    ('DB_PORT', 'database', 'port', int),
+    ('DB_NAME', 'database', 'database', str),
+    ('DB_USERNAME', 'database', 'username', str),
+    ('DB_PASSWORD', 'database', 'password', str),
+    
+    # API configuration
+    ('GITHUB_TOKEN', 'api', 'github_token', str),
+    ('JIRA_URL', 'api', 'jira_url', str),
+    ('JIRA_USERNAME', 'api', 'jira_username', str),
+    ('JIRA_TOKEN', 'api', 'jira_token', str),
+    ('SLACK_TOKEN', 'api', 'slack_token', str),
+    ('SLACK_WEBHOOK_URL', 'api', 'slack_webhook_url', str),
+    
+    # Notification configuration
+    ('NOTIFICATIONS_ENABLED', 'notifications', 'enabled', _env_bool),
+    ('EMAIL_NOTIFICATIONS_ENABLED', 'notifications', 'email_enabled', _env_bool),
+    ('SMTP_HOST', 'notifications', 'smtp_host', str),
+    ('SMTP_PORT', 'notifications', 'smtp_port', int),
+    ('SMTP_USERNAME', 'notifications', 'smtp_username', str),
+    ('SMTP_PASSWORD', 'notifications', 'smtp_password', str),
+    ('EMAIL_FROM_ADDRESS', 'notifications', 'email_from_address', str),
+    ('SLACK_NOTIFICATIONS_ENABLED', 'notifications', 'slack_enabled', _env_bool),
+    ('SLACK_BOT_TOKEN', 'notifications', 'slack_bot_token', str),
+    ('SLACK_WEBHOOK_URL', 'notifications', 'slack_webhook_url', str),
+    ('SLACK_DEFAULT_CHANNEL', 'notifications', 'slack_default_channel', str),
+    
+    # Message queue configuration
+    ('RABBITMQ_HOST', 'message_queue', 'host', str),
+    ('RABBITMQ_PORT', 'message_queue', 'port', int),
+    ('RABBITMQ_USERNAME', 'message_queue', 'username', str),
+    ('RABBITMQ_PASSWORD', 'message_queue', 'password', str),
+    ('RABBITMQ_WIRE_FORMAT', 'message_queue', 'wire_format', str),
+    
+    # Logging configuration
+    ('LOG_LEVEL', 'logging', 'level', str),
+    ('LOG_FILE_PATH', 'logging', 'file_path', str),
+    
+    # Agent configuration
+    ('DEVELOPER_AGENT_UPDATE_INTERVAL', 'agents', 'developer_agent_update_interval', int),
+    ('DEVELOPER_AGENT_MAX_RETRIES', 'agents', 'developer_agent_max_retries', int),
+    ('DEVELOPER_AGENT_RETRY_DELAY', 'agents', 'developer_agent_retry_delay', int),
+    ('DEVELOPER_AGENT_HEALTH_CHECK_INTERVAL', 'agents', 'developer_agent_health_check_interval', int),
+    
+    # Performance tracking configuration
+    ('PERFORMANCE_TRACKING_ENABLED', 'performance', 'enabled', _env_bool),
+    ('PERFORMANCE_LOOKBACK_DAYS', 'performance', 'lookback_days', int),
+    ('SKILL_CONFIDENCE_LOOKBACK_DAYS', 'performance', 'skill_confidence_lookback_days', int),
+    
+    # Calendar integration configuration
+    ('CALENDAR_INTEGRATION_ENABLED', 'calendar', 'enabled', _env_bool),
+    ('CALENDAR_PROVIDER', 'calendar', 'provider', str),
+    ('GOOGLE_CALENDAR_CREDENTIALS_PATH', 'calendar', 'google_credentials_path', str),
+    ('OUTLOOK_CLIENT_ID', 'calendar', 'outlook_client_id', str),
+    ('OUTLOOK_CLIENT_SECRET', 'calendar', 'outlook_client_secret', str),
+    ('OUTLOOK_TENANT_ID', 'calendar', 'outlook_tenant_id', str),
+    
+    # Developer discovery configuration
+    ('DEVELOPER_DISCOVERY_ENABLED', 'developer_discovery', 'enabled', _env_bool),
+    ('DEVELOPER_DISCOVERY_INTERVAL', 'developer_discovery', 'discovery_interval', int),
+    ('DEVELOPER_MIN_CONTRIBUTIONS', 'developer_discovery', 'min_contributions', int),
+    ('DEVELOPER_LOOKBACK_MONTHS', 'developer_discovery', 'lookback_months', int),
+    ('GITHUB_ORGANIZATION', 'developer_discovery', 'github_organization', str),
+    ('GITHUB_REPO_PATTERN', 'developer_discovery', 'github_repo_pattern', str),
+    ('JIRA_PROJECT_PATTERN', 'developer_discovery', 'jira_project_pattern', str),
+    
+    # Comma-separated lists
+    ('GITHUB_REPOSITORIES', 'developer_discovery', 'github_repositories', _parse_csv),
+    ('JIRA_PROJECTS', 'developer_discovery', 'jira_projects', _parse_csv),
+)
+
+
 @dataclass
 class SystemConfig:
     """Main system configuration."""
@@ -160,81 +282,12 @@ class SystemConfig:
     def from_env(cls) -> 'SystemConfig':
         """Create configuration from environment variables."""
         config = cls()
+        env = os.environ
         
-        # Database configuration
-        config.database.host = os.getenv('DB_HOST', config.database.host)
-        config.database.port = int(os.getenv('DB_PORT', str(config.database.port)))
-        config.database.database = os.getenv('DB_NAME', config.database.database)
-        config.database.username = os.getenv('DB_USERNAME', config.database.username)
-        config.database.password = os.getenv('DB_PASSWORD', config.database.password)
-        
-        # API configuration
-        config.api.github_token = os.getenv('GITHUB_TOKEN', config.api.github_token)
-        config.api.jira_url = os.getenv('JIRA_URL', config.api.jira_url)
-        config.api.jira_username = os.getenv('JIRA_USERNAME', config.api.jira_username)
-        config.api.jira_token = os.getenv('JIRA_TOKEN', config.api.jira_token)
-        config.api.slack_token = os.getenv('SLACK_TOKEN', config.api.slack_token)
-        config.api.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL', config.api.slack_webhook_url)
-        
-        # Notification configuration
-        config.notifications.enabled = os.getenv('NOTIFICATIONS_ENABLED', 'true').lower() == 'true'
-        config.notifications.email_enabled = os.getenv('EMAIL_NOTIFICATIONS_ENABLED', 'true').lower() == 'true'
-        config.notifications.smtp_host = os.getenv('SMTP_HOST', config.notifications.smtp_host)
-        config.notifications.smtp_port = int(os.getenv('SMTP_PORT', str(config.notifications.smtp_port)))
-        config.notifications.smtp_username = os.getenv('SMTP_USERNAME', config.notifications.smtp_username)
-        config.notifications.smtp_password = os.getenv('SMTP_PASSWORD', config.notifications.smtp_password)
-        config.notifications.email_from_address = os.getenv('EMAIL_FROM_ADDRESS', config.notifications.email_from_address)
-        config.notifications.slack_enabled = os.getenv('SLACK_NOTIFICATIONS_ENABLED', 'true').lower() == 'true'
-        config.notifications.slack_bot_token = os.getenv('SLACK_BOT_TOKEN', config.notifications.slack_bot_token)
-        config.notifications.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL', config.notifications.slack_webhook_url)
-        config.notifications.slack_default_channel = os.getenv('SLACK_DEFAULT_CHANNEL', config.notifications.slack_default_channel)
-        
-        # Message queue configuration
-        config.message_queue.host = os.getenv('RABBITMQ_HOST', config.message_queue.host)
-        config.message_queue.port = int(os.getenv('RABBITMQ_PORT', str(config.message_queue.port)))
-        config.message_queue.username = os.getenv('RABBITMQ_USERNAME', config.message_queue.username)
-        config.message_queue.password = os.getenv('RABBITMQ_PASSWORD', config.message_queue.password)
-        
-        # Logging configuration
-        config.logging.level = os.getenv('LOG_LEVEL', config.logging.level)
-        config.logging.file_path = os.getenv('LOG_FILE_PATH', config.logging.file_path)
-        
-        # Agent configuration
-        config.agents.developer_agent_update_interval = int(os.getenv('DEVELOPER_AGENT_UPDATE_INTERVAL', str(config.agents.developer_agent_update_interval)))
-        config.agents.developer_agent_max_retries = int(os.getenv('DEVELOPER_AGENT_MAX_RETRIES', str(config.agents.developer_agent_max_retries)))
-        config.agents.developer_agent_retry_delay = int(os.getenv('DEVELOPER_AGENT_RETRY_DELAY', str(config.agents.developer_agent_retry_delay)))
-        config.agents.developer_agent_health_check_interval = int(os.getenv('DEVELOPER_AGENT_HEALTH_CHECK_INTERVAL', str(config.agents.developer_agent_health_check_interval)))
-        
-        # Performance tracking configuration
-        config.performance.enabled = os.getenv('PERFORMANCE_TRACKING_ENABLED', 'true').lower() == 'true'
-        config.performance.lookback_days = int(os.getenv('PERFORMANCE_LOOKBACK_DAYS', str(config.performance.lookback_days)))
-        config.performance.skill_confidence_lookback_days = int(os.getenv('SKILL_CONFIDENCE_LOOKBACK_DAYS', str(config.performance.skill_confidence_lookback_days)))
-        
-        # Calendar integration configuration
-        config.calendar.enabled = os.getenv('CALENDAR_INTEGRATION_ENABLED', 'true').lower() == 'true'
-        config.calendar.provider = os.getenv('CALENDAR_PROVIDER', config.calendar.provider)
-        config.calendar.google_credentials_path = os.getenv('GOOGLE_CALENDAR_CREDENTIALS_PATH', config.calendar.google_credentials_path)
-        config.calendar.outlook_client_id = os.getenv('OUTLOOK_CLIENT_ID', config.calendar.outlook_client_id)
-        config.calendar.outlook_client_secret = os.getenv('OUTLOOK_CLIENT_SECRET', config.calendar.outlook_client_secret)
-        config.calendar.outlook_tenant_id = os.getenv('OUTLOOK_TENANT_ID', config.calendar.outlook_tenant_id)
-        
-        # Developer discovery configuration
-        config.developer_discovery.enabled = os.getenv('DEVELOPER_DISCOVERY_ENABLED', 'true').lower() == 'true'
-        config.developer_discovery.discovery_interval = int(os.getenv('DEVELOPER_DISCOVERY_INTERVAL', str(config.developer_discovery.discovery_interval)))
-        config.developer_discovery.min_contributions = int(os.getenv('DEVELOPER_MIN_CONTRIBUTIONS', str(config.developer_discovery.min_contributions)))
-        config.developer_discovery.lookback_months = int(os.getenv('DEVELOPER_LOOKBACK_MONTHS', str(config.developer_discovery.lookback_months)))
-        config.developer_discovery.github_organization = os.getenv('GITHUB_ORGANIZATION', config.developer_discovery.github_organization)
-        config.developer_discovery.github_repo_pattern = os.getenv('GITHUB_REPO_PATTERN', config.developer_discovery.github_repo_pattern)
-        config.developer_discovery.jira_project_pattern = os.getenv('JIRA_PROJECT_PATTERN', config.developer_discovery.jira_project_pattern)
-        
-        # Parse comma-separated lists
-        github_repos = os.getenv('GITHUB_REPOSITORIES', '')
-        if github_repos:
-            config.developer_discovery.github_repositories = [repo.strip() for repo in github_repos.split(',')]
-        
-        jira_projects = os.getenv('JIRA_PROJECTS', '')
-        if jira_projects:
-            config.developer_discovery.jira_projects = [project.strip() for project in jira_projects.split(',')]
+        for env_key, section, attr, cast in _ENV_SPEC:
+            raw = env.get(env_key)
+            if raw is not None:
+                setattr(getattr(config, section), attr, cast(raw))
         
         return config
     
@@ -282,24 +335,19 @@ class SystemConfig:
             logging.error(f"Invalid JSON in configuration file {config_path}: {e}")
             return cls.from_env()
     
-    def validate(self) -> bool:
-        """Validate configuration settings."""
-        errors = []
-        
-        # Validate required API tokens
-        if not self.api.github_token:
-            errors.append("GitHub token is required")
+    def validate(self, fail_fast: bool = False) -> bool:
+        """Validate configuration settings.
         
-        # Validate database settings
-        if not self.database.host:
-            errors.append("Database host is required")
-        
-        if not self.database.database:
-            errors.append("Database name is required")
+        Args:
+            fail_fast: Stop at the first failing rule instead of collecting all errors
+        """
+        errors = []
         
-        # Validate message queue settings
-        if not self.message_queue.host:
-            errors.append("Message queue host is required")
+        for probe, message in _VALIDATORS:
+            if not probe(self):
+                errors.append(message)
+                if fail_fast:
+                    break
         
         if errors:
             for error in errors:
@@ -309,6 +357,18 @@ class SystemConfig:
         return True
 
 
+# (probe, error message) pairs checked by SystemConfig.validate, in order
+_VALIDATORS = (
+    # Required API tokens
+    (attrgetter('api.github_token'), "GitHub token is required"),
+    # Database settings
+    (attrgetter('database.host'), "Database host is required"),
+    (attrgetter('database.database'), "Database name is required"),
+    # Message queue settings
+    (attrgetter('message_queue.host'), "Message queue host is required"),
+)
+
+
 class Settings:
     """Main settings class for the application."""
     
@@ -78,21 +78,28 @@ def status(ctx):
         
         status_info = check_migration_status(db_manager)
         
-        click.echo("📊 Database Migration Status:")
-        click.echo(f"   Total migrations: {status_info['total_migrations']}")
-        click.echo(f"   Applied: {len(status_info['applied_migrations'])}")
-        click.echo(f"   Pending: {len(status_info['pending_migrations'])}")
-        click.echo(f"   Up to date: {'✅' if status_info['up_to_date'] else '❌'}")
+        # Plain markers when redirected so log files stay ASCII
+        tty = click.get_text_stream('stdout').isatty()
+        ok_mark, bad_mark, pending_mark = ('✅', '❌', '⏳') if tty else ('[OK]', '[NO]', '[PENDING]')
+        
+        lines = [
+            "📊 Database Migration Status:" if tty else "Database Migration Status:",
+            f"   Total migrations: {status_info['total_migrations']}",
+            f"   Applied: {len(status_info['applied_migrations'])}",
+            f"   Pending: {len(status_info['pending_migrations'])}",
+            f"   Up to date: {ok_mark if status_info['up_to_date'] else bad_mark}",
+        ]
         
         if status_info['applied_migrations']:
-            click.echo("\n📋 Applied migrations:")
-            for migration in status_info['applied_migrations']:
-                click.echo(f"   ✅ {migration}")
+            lines.append("\n📋 Applied migrations:" if tty else "\nApplied migrations:")
+            lines.extend(f"   {ok_mark} {migration}" for migration in status_info['applied_migrations'])
         
         if status_info['pending_migrations']:
-            click.echo("\n⏳ Pending migrations:")
-            for migration in status_info['pending_migrations']:
-                click.echo(f"   ⏳ {migration}")
+            lines.append("\n⏳ Pending migrations:" if tty else "\nPending migrations:")
+            lines.extend(f"   {pending_mark} {migration}" for migration in status_info['pending_migrations'])
+        
+        # One write for the whole report instead of one per migration
+        click.echo("\n".join(lines))
                 
     except Exception as e:
         click.echo(f"❌ Failed to check status: {e}")
@@ -3,27 +3,53 @@
 import os
 import logging
 from contextlib import contextmanager
-from typing import Generator, Optional
-from sqlalchemy import create_engine, Engine, event
+from functools import lru_cache
+from typing import Generator, Optional, Union
+from sqlalchemy import create_engine, Engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError
 
+from ..config.settings import DatabaseConfig
 from ..models.database import Base
 
 logger = logging.getLogger(__name__)
 
+# Liveness probe statement, built once and reused by every health check
+_HEALTH_QUERY = text("SELECT 1")
+
+# Shared, never-mutated bind parameters for raw queries called without params
+_EMPTY_PARAMS: dict = {}
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
     
-    def __init__(self, database_url: Optional[str] = None):
-        """Initialize database manager with connection URL."""
+    def __init__(self, database_url: Optional[Union[str, DatabaseConfig]] = None):
+        """Initialize database manager with a connection URL or database config.
+        
+        Args:
+            database_url: Connection URL, or a DatabaseConfig supplying both the
+                connection settings and the pool sizing
+        """
+        if isinstance(database_url, DatabaseConfig):
+            self.config = database_url
+            database_url = self._url_from_config(database_url)
+        else:
+            self.config = DatabaseConfig()
         self.database_url = database_url or self._get_database_url()
         self.engine: Optional[Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
         self._initialized = False
     
+    @staticmethod
+    def _url_from_config(config: DatabaseConfig) -> str:
+        """Build a PostgreSQL URL from a DatabaseConfig."""
+        return (
+            f"postgresql://{config.username}:{config.password}"
+            f"@{config.host}:{config.port}/{config.database}"
+        )
+    
     def _get_database_url(self) -> str:
         """Get database URL from environment variables."""
         # Try different environment variable names
@@ -55,8 +81,9 @@ class DatabaseManager:
             self.engine = create_engine(
                 self.database_url,
                 poolclass=QueuePool,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=self.config.pool_size,
+                max_overflow=self.config.max_overflow,
+                pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
                 pool_pre_ping=True,  # Verify connections before use
                 pool_recycle=3600,   # Recycle connections every hour
                 echo=os.getenv('DB_ECHO', 'false').lower() == 'true'
@@ -84,7 +111,7 @@ class DatabaseManager:
             logger.info("Database manager initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
     
     def create_tables(self) -> None:
@@ -96,7 +123,7 @@ class DatabaseManager:
             Base.metadata.create_all(bind=self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
-            logger.error(f"Failed to create database tables: {e}")
+            logger.error("Failed to create database tables: %s", e)
             raise
     
     def drop_tables(self) -> None:
@@ -108,7 +135,7 @@ class DatabaseManager:
             Base.metadata.drop_all(bind=self.engine)
             logger.info("Database tables dropped successfully")
         except Exception as e:
-            logger.error(f"Failed to drop database tables: {e}")
+            logger.error("Failed to drop database tables: %s", e)
             raise
     
     @contextmanager
@@ -123,7 +150,7 @@ class DatabaseManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Database session error: {e}")
+            logger.error("Database session error: %s", e)
             raise
         finally:
             session.close()
@@ -138,11 +165,10 @@ class DatabaseManager:
         """Check if database connection is healthy."""
         try:
             with self.get_session() as session:
-                from sqlalchemy import text
-                session.execute(text("SELECT 1"))
+                session.execute(_HEALTH_QUERY)
             return True
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             return False
     
     def close(self) -> None:
@@ -152,28 +178,40 @@ class DatabaseManager:
             logger.info("Database connections closed")
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+class _Registry:
+    """Holder for the process-wide database manager.
+    
+    Callers always resolve the manager through this class, so rebinding it in
+    ``init_database`` is visible everywhere instead of only to later importers.
+    """
+    current: DatabaseManager = DatabaseManager()
+
+
+def __getattr__(name: str):
+    """Keep ``connection.db_manager`` readable as an alias of the registry."""
+    if name == 'db_manager':
+        return _Registry.current
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db_session() -> Generator[Session, None, None]:
     """Dependency function for getting database sessions."""
-    with db_manager.get_session() as session:
+    with _Registry.current.get_session() as session:
         yield session
 
 
 def init_database(database_url: Optional[str] = None) -> None:
     """Initialize the database with optional custom URL."""
-    global db_manager
     if database_url:
-        db_manager = DatabaseManager(database_url)
-    db_manager.initialize()
-    db_manager.create_tables()
+        _Registry.current = DatabaseManager(database_url)
+    manager = _Registry.current
+    manager.initialize()
+    manager.create_tables()
 
 
 def get_database_manager() -> DatabaseManager:
     """Get the global database manager instance."""
-    return db_manager
+    return _Registry.current
 
 
 class DatabaseError(Exception):
@@ -197,29 +235,39 @@ def handle_db_exceptions(func):
         try:
             return func(*args, **kwargs)
         except DisconnectionError as e:
-            logger.error(f"Database disconnection error in {func.__name__}: {e}")
+            logger.error("Database disconnection error in %s: %s", func.__name__, e)
             raise ConnectionError(f"Database connection lost: {e}")
         except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemy error in {func.__name__}: {e}")
+            logger.error("SQLAlchemy error in %s: %s", func.__name__, e)
             raise DatabaseError(f"Database operation failed: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {e}")
+            logger.error("Unexpected error in %s: %s", func.__name__, e)
             raise
     return wrapper
 
 
 # Utility functions for common database operations
+@lru_cache(maxsize=256)
+def _compiled(query: str):
+    """Return a cached TextClause for a raw SQL string."""
+    return text(query)
+
+
 @handle_db_exceptions
 def execute_query(query: str, params: Optional[dict] = None) -> list:
     """Execute a raw SQL query and return results."""
-    with db_manager.get_session() as session:
-        result = session.execute(query, params or {})
+    with _Registry.current.get_session() as session:
+        result = session.execute(
+            _compiled(query), params if params is not None else _EMPTY_PARAMS
+        )
         return result.fetchall()
 
 
 @handle_db_exceptions
 def execute_update(query: str, params: Optional[dict] = None) -> int:
     """Execute an update/insert/delete query and return affected rows."""
-    with db_manager.get_session() as session:
-        result = session.execute(query, params or {})
+    with _Registry.current.get_session() as session:
+        result = session.execute(
+            _compiled(query), params if params is not None else _EMPTY_PARAMS
+        )
         return result.rowcount
\ No newline at end of file
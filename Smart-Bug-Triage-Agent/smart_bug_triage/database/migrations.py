@@ -1,16 +1,35 @@
 """Database migration utilities and scripts."""
 
+import functools
+import hashlib
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Generator, Tuple
 from sqlalchemy import text, inspect
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from .connection import DatabaseManager, handle_db_exceptions
 from ..models.database import Base
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock id shared by every process running migrate_up against the same database
+MIGRATION_LOCK_KEY = 947321
+
+# Width of schema_migrations.version. VARCHAR stays: in PostgreSQL CHAR(n) stores the
+# same varlena and adds blank-padding work, so it is not faster for short keys
+MIGRATION_VERSION_LENGTH = 50
+
+# Marks checksums produced by BLAKE2b; older rows hold an unprefixed SHA-256 prefix
+CHECKSUM_PREFIX = 'b2:'
+
+
+def join_sql(statements: Sequence[str]) -> str:
+    """Join SQL statements into one multi-statement string."""
+    return ';\n'.join(stmt.strip().rstrip(';') for stmt in statements)
+
 
 class MigrationManager:
     """Manages database schema migrations."""
@@ -18,41 +37,131 @@ class MigrationManager:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self.migration_table = 'schema_migrations'
+        # Applied versions in apply order; loaded on first read and kept in sync
+        # by apply_migration/rollback_migration
+        self._applied_cache: Optional[List[str]] = None
+        self._migration_table_ready = False
+        
+        # Bookkeeping statements, built once per manager
+        self._insert_stmt = text(f"""
+        INSERT INTO {self.migration_table} (version, description, checksum)
+        VALUES (:version, :description, :checksum)
+        """)
+        self._delete_stmt = text(f"DELETE FROM {self.migration_table} WHERE version = :version")
+        self._select_versions_stmt = text(
+            f"SELECT version FROM {self.migration_table} ORDER BY applied_at"
+        )
+        self._select_checksums_stmt = text(
+            f"SELECT version, checksum FROM {self.migration_table}"
+        )
+    
+    @contextmanager
+    def _run_session(self, session: Optional[Session] = None) -> Generator[Session, None, None]:
+        """Yield the caller's session, or a fresh one committed on exit.
+        
+        Lets migrate_up/migrate_down pin one pooled connection for the whole run
+        while the individual helpers still work standalone.
+        """
+        if session is not None:
+            yield session
+            return
+        
+        try:
+            with self.db_manager.get_session() as new_session:
+                yield new_session
+        except Exception:
+            # The transaction rolled back (DDL included), so cached state may be stale
+            self._applied_cache = None
+            self._migration_table_ready = False
+            raise
     
-    def _ensure_migration_table(self) -> None:
+    def _ensure_migration_table(self, session: Optional[Session] = None) -> None:
         """Create migration tracking table if it doesn't exist."""
+        if self._migration_table_ready:
+            return
+        
         create_migration_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {self.migration_table} (
-            version VARCHAR(50) PRIMARY KEY,
+            version VARCHAR({MIGRATION_VERSION_LENGTH}) PRIMARY KEY,
             description TEXT,
             applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             checksum VARCHAR(64)
         );
         """
         
-        with self.db_manager.get_session() as session:
-            session.execute(text(create_migration_table_sql))
+        # Lets "ORDER BY applied_at" read in index order instead of seq-scan + sort
+        create_applied_at_index_sql = f"""
+        CREATE INDEX IF NOT EXISTS idx_{self.migration_table}_applied_at
+        ON {self.migration_table}(applied_at);
+        """
+        
+        with self._run_session(session) as session:
+            # A catalog read is cheaper than CREATE ... IF NOT EXISTS, which takes a lock
+            inspector = inspect(session.connection())
+            if not (
+                inspector.has_table(self.migration_table)
+                and any(
+                    index['name'] == f"idx_{self.migration_table}_applied_at"
+                    for index in inspector.get_indexes(self.migration_table)
+                )
+            ):
+                connection = session.connection()
+                connection.exec_driver_sql(create_migration_table_sql)
+                connection.exec_driver_sql(create_applied_at_index_sql)
+        
+        self._migration_table_ready = True
+    
+    def _load_applied(self, session: Optional[Session] = None) -> List[str]:
+        """Return the cached applied-version list, querying it on first use."""
+        if self._applied_cache is None:
+            with self._run_session(session) as session:
+                self._ensure_migration_table(session)
+                # scalars() streams the single column without building Row objects
+                self._applied_cache = session.execute(
+                    self._select_versions_stmt
+                ).scalars().all()
+        
+        return self._applied_cache
     
     @handle_db_exceptions
-    def get_applied_migrations(self) -> List[str]:
+    def get_applied_migrations(self, session: Optional[Session] = None) -> List[str]:
         """Get list of applied migration versions."""
-        self._ensure_migration_table()
+        return list(self._load_applied(session))
+    
+    @handle_db_exceptions
+    def verify_checksums(self, session: Optional[Session] = None) -> List[str]:
+        """Find applied migrations whose definition changed since they were applied.
         
-        with self.db_manager.get_session() as session:
-            result = session.execute(
-                text(f"SELECT version FROM {self.migration_table} ORDER BY applied_at")
-            )
-            return [row[0] for row in result.fetchall()]
+        Rows written before the switch to BLAKE2b hold the legacy SHA-256 value
+        and are compared in that format.
+        
+        Returns:
+            Versions whose stored checksum no longer matches, in apply order
+        """
+        with self._run_session(session) as session:
+            self._ensure_migration_table(session)
+            stored = dict(session.execute(self._select_checksums_stmt).all())
+        
+        modified = [
+            version for version, migration in _migrations_by_version().items()
+            if stored.get(version) and not migration.matches_checksum(stored[version])
+        ]
+        for version in modified:
+            logger.warning(f"Migration {version} was modified after it was applied")
+        return modified
     
     @handle_db_exceptions
-    def record_migration(self, version: str, description: str, checksum: str) -> None:
+    def record_migration(
+        self,
+        version: str,
+        description: str,
+        checksum: str,
+        session: Optional[Session] = None
+    ) -> None:
         """Record a migration as applied."""
-        with self.db_manager.get_session() as session:
+        with self._run_session(session) as session:
             session.execute(
-                text(f"""
-                INSERT INTO {self.migration_table} (version, description, checksum)
-                VALUES (:version, :description, :checksum)
-                """),
+                self._insert_stmt,
                 {
                     'version': version,
                     'description': description,
@@ -60,26 +169,52 @@ class MigrationManager:
                 }
             )
     
+    def _execute_script(
+        self,
+        session: Session,
+        statements: Sequence[str],
+        script: Optional[str] = None
+    ) -> None:
+        """Send a list of DDL statements to the server in as few round-trips as possible.
+        
+        PostgreSQL drivers accept a multi-statement string, so the whole list (or the
+        pre-joined ``script``) goes out in one call. SQLite only executes one statement
+        at a time, so it falls back to a loop; either way everything runs in the
+        caller's transaction.
+        
+        Statements are deliberately not fanned out over several connections: each
+        connection would need its own transaction, which would give up the
+        all-or-nothing apply of a migration run and the advisory lock held by it.
+        """
+        connection = session.connection()
+        if connection.dialect.name == 'sqlite':
+            for sql_statement in statements:
+                connection.exec_driver_sql(sql_statement)
+        else:
+            connection.exec_driver_sql(script if script is not None else join_sql(statements))
+    
     @handle_db_exceptions
-    def apply_migration(self, migration: 'Migration') -> None:
-        """Apply a single migration."""
+    def apply_migration(self, migration: 'Migration', session: Optional[Session] = None) -> None:
+        """Apply a single migration and record it in the same transaction."""
         logger.info(f"Applying migration {migration.version}: {migration.description}")
         
         try:
-            # Ensure migration table exists first
-            self._ensure_migration_table()
-            
-            with self.db_manager.get_session() as session:
+            with self._run_session(session) as session:
+                # Ensure migration table exists first
+                self._ensure_migration_table(session)
+                
                 # Execute migration SQL
-                for sql_statement in migration.up_sql:
-                    session.execute(text(sql_statement))
+                self._execute_script(session, migration.up_sql, migration.up_script)
                 
-            # Record migration in separate transaction
-            self.record_migration(
-                migration.version,
-                migration.description,
-                migration.checksum
-            )
+                # Record migration before the single commit
+                self.record_migration(
+                    migration.version,
+                    migration.description,
+                    migration.checksum,
+                    session=session
+                )
+                if self._applied_cache is not None:
+                    self._applied_cache.append(migration.version)
             
             logger.info(f"Migration {migration.version} applied successfully")
             
@@ -88,21 +223,22 @@ class MigrationManager:
             raise
     
     @handle_db_exceptions
-    def rollback_migration(self, migration: 'Migration') -> None:
+    def rollback_migration(self, migration: 'Migration', session: Optional[Session] = None) -> None:
         """Rollback a single migration."""
         logger.info(f"Rolling back migration {migration.version}: {migration.description}")
         
         try:
-            with self.db_manager.get_session() as session:
-                # Execute rollback SQL
-                for sql_statement in migration.down_sql:
-                    session.execute(text(sql_statement))
+            with self._run_session(session) as session:
+                # Execute rollback SQL in one round-trip where the driver allows it
+                self._execute_script(session, migration.down_sql, migration.down_script)
                 
                 # Remove migration record
                 session.execute(
-                    text(f"DELETE FROM {self.migration_table} WHERE version = :version"),
+                    self._delete_stmt,
                     {'version': migration.version}
                 )
+                if self._applied_cache is not None and migration.version in self._applied_cache:
+                    self._applied_cache.remove(migration.version)
             
             logger.info(f"Migration {migration.version} rolled back successfully")
             
@@ -110,49 +246,100 @@ class MigrationManager:
             logger.error(f"Failed to rollback migration {migration.version}: {e}")
             raise
     
-    def get_pending_migrations(self) -> List['Migration']:
-        """Get list of migrations that need to be applied."""
-        applied = set(self.get_applied_migrations())
-        all_migrations = get_all_migrations()
+    def _acquire_migration_lock(self, session: Session) -> None:
+        """Serialize concurrent migrate_up runs with a PostgreSQL advisory lock.
         
-        return [m for m in all_migrations if m.version not in applied]
-    
-    def migrate_up(self) -> None:
-        """Apply all pending migrations."""
-        pending = self.get_pending_migrations()
+        The lock is transaction-scoped, so it is held for the whole pinned-session
+        run and released by the final commit or rollback. Other dialects skip it.
+        """
+        if session.connection().dialect.name != 'postgresql':
+            return
         
-        if not pending:
-            logger.info("No pending migrations")
+        params = {'key': MIGRATION_LOCK_KEY}
+        if session.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), params).scalar():
             return
         
-        logger.info(f"Applying {len(pending)} pending migrations")
+        logger.info("Waiting for another process to finish migrations")
+        session.execute(text("SELECT pg_advisory_xact_lock(:key)"), params)
+        # The lock holder has most likely applied migrations meanwhile
+        self._applied_cache = None
+    
+    @handle_db_exceptions
+    def get_pending_migrations(self, session: Optional[Session] = None) -> List['Migration']:
+        """Get list of migrations that need to be applied."""
+        applied = frozenset(self._load_applied(session))
+        migrations_by_version = _migrations_by_version()
         
-        for migration in pending:
-            self.apply_migration(migration)
+        # Iterate the dict (not the set difference) so pending stays in apply order
+        return [
+            migration for version, migration in migrations_by_version.items()
+            if version not in applied
+        ]
+    
+    @handle_db_exceptions
+    def migrate_up(self) -> None:
+        """Apply all pending migrations on a single pinned session."""
+        with self._run_session() as session:
+            self._acquire_migration_lock(session)
+            self.verify_checksums(session)
+            pending = self.get_pending_migrations(session)
+            
+            if not pending:
+                logger.info("No pending migrations")
+                return
+            
+            logger.info(f"Applying {len(pending)} pending migrations")
+            
+            records = []
+            for migration in pending:
+                logger.info(
+                    "Applying migration %s: %s (%d bytes of SQL)",
+                    migration.version,
+                    migration.description,
+                    sum(map(len, migration.up_sql_bytes))
+                )
+                self._execute_script(session, migration.up_sql, migration.up_script)
+                records.append({
+                    'version': migration.version,
+                    'description': migration.description,
+                    'checksum': migration.checksum
+                })
+            
+            # One executemany for all bookkeeping rows, committed with the DDL
+            session.execute(
+                self._insert_stmt,
+                records
+            )
+            self._applied_cache.extend(record['version'] for record in records)
         
-        logger.info("All migrations applied successfully")
+        logger.info(
+            "All migrations applied successfully: %s",
+            ", ".join(record['version'] for record in records)
+        )
     
+    @handle_db_exceptions
     def migrate_down(self, target_version: Optional[str] = None) -> None:
-        """Rollback migrations to target version."""
-        applied = self.get_applied_migrations()
-        all_migrations = {m.version: m for m in get_all_migrations()}
-        
-        if target_version:
-            # Rollback to specific version
-            rollback_versions = []
-            for version in reversed(applied):
-                if version == target_version:
-                    break
-                rollback_versions.append(version)
-        else:
-            # Rollback all migrations
-            rollback_versions = list(reversed(applied))
-        
-        logger.info(f"Rolling back {len(rollback_versions)} migrations")
-        
-        for version in rollback_versions:
-            if version in all_migrations:
-                self.rollback_migration(all_migrations[version])
+        """Rollback migrations to target version on a single pinned session."""
+        with self._run_session() as session:
+            applied = self.get_applied_migrations(session)
+            all_migrations = _migrations_by_version()
+            
+            if target_version:
+                # Rollback to specific version
+                rollback_versions = []
+                for version in reversed(applied):
+                    if version == target_version:
+                        break
+                    rollback_versions.append(version)
+            else:
+                # Rollback all migrations
+                rollback_versions = list(reversed(applied))
+            
+            logger.info(f"Rolling back {len(rollback_versions)} migrations")
+            
+            for version in rollback_versions:
+                if version in all_migrations:
+                    self.rollback_migration(all_migrations[version], session=session)
         
         logger.info("Rollback completed successfully")
 
@@ -164,24 +351,82 @@ class Migration:
         self,
         version: str,
         description: str,
-        up_sql: List[str],
-        down_sql: List[str]
+        up_sql: Sequence[str],
+        down_sql: Sequence[str]
     ):
+        if len(version) > MIGRATION_VERSION_LENGTH:
+            # Fail at definition time, not at the bookkeeping insert after the DDL ran
+            raise ValueError(
+                f"Migration version {version!r} exceeds {MIGRATION_VERSION_LENGTH} characters"
+            )
         self.version = version
         self.description = description
-        self.up_sql = up_sql
-        self.down_sql = down_sql
-        self.checksum = self._calculate_checksum()
+        self.up_sql = tuple(up_sql)
+        self.down_sql = tuple(down_sql)
+    
+    @functools.cached_property
+    def up_script(self) -> str:
+        """All up statements joined for a single round-trip (e.g. a whole index group)."""
+        return join_sql(self.up_sql)
+    
+    @functools.cached_property
+    def down_script(self) -> str:
+        """All down statements joined for a single round-trip."""
+        return join_sql(self.down_sql)
+    
+    @functools.cached_property
+    def checksum(self) -> str:
+        """Checksum for migration integrity, computed on first access."""
+        return self._calculate_checksum()
     
     def _calculate_checksum(self) -> str:
-        """Calculate checksum for migration integrity."""
-        import hashlib
-        content = f"{self.version}{self.description}{''.join(self.up_sql)}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """Calculate checksum for migration integrity.
+        
+        Only change detection is needed, so BLAKE2b with an 8-byte digest replaces
+        SHA-256; the "b2:" prefix tells these apart from legacy SHA-256 rows.
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        self._feed_checksum(digest)
+        return CHECKSUM_PREFIX + digest.hexdigest()
+    
+    @functools.cached_property
+    def up_sql_bytes(self) -> Tuple[bytes, ...]:
+        """UTF-8 encoded up statements, encoded once for hashing and size reporting."""
+        return tuple(sql_statement.encode('utf-8') for sql_statement in self.up_sql)
+    
+    def _feed_checksum(self, digest) -> None:
+        """Hash the pieces incrementally; same digest as hashing the joined content."""
+        digest.update(self.version.encode())
+        digest.update(self.description.encode())
+        for sql_bytes in self.up_sql_bytes:
+            digest.update(sql_bytes)
+    
+    def matches_checksum(self, stored_checksum: str) -> bool:
+        """Check a stored checksum, accepting legacy unprefixed SHA-256 values."""
+        if stored_checksum.startswith(CHECKSUM_PREFIX):
+            return stored_checksum == self.checksum
+        
+        legacy = hashlib.sha256()
+        self._feed_checksum(legacy)
+        return stored_checksum == legacy.hexdigest()[:16]
+    
+    def release_buffers(self) -> None:
+        """Drop the joined scripts and encoded bytes derived from the SQL.
+        
+        They are only needed while migrating and are rebuilt on demand; the
+        (small) checksum is kept.
+        """
+        for name in ('up_script', 'down_script', 'up_sql_bytes'):
+            self.__dict__.pop(name, None)
 
 
+@functools.lru_cache(maxsize=None)
 def get_all_migrations() -> List[Migration]:
-    """Get all available migrations in order."""
+    """Get all available migrations in order.
+    
+    The list is built once per process and shared; callers must not mutate it.
+    Use ``get_all_migrations.cache_clear()`` to force a rebuild.
+    """
     return [
         Migration(
             version="001_initial_schema",
@@ -548,16 +793,38 @@ def get_all_migrations() -> List[Migration]:
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _migrations_by_version() -> Dict[str, Migration]:
+    """Index the cached migration list by version, preserving apply order."""
+    return {migration.version: migration for migration in get_all_migrations()}
+
+
+def _release_migration_buffers() -> None:
+    """Free per-run SQL copies once a long-running service has finished migrating."""
+    for migration in get_all_migrations():
+        migration.release_buffers()
+
+
 def run_migrations(db_manager: DatabaseManager) -> None:
-    """Run all pending migrations."""
+    """Run all pending migrations.
+    
+    Always reads the applied versions from schema_migrations, which is cheap
+    when there is nothing to apply.
+    """
     migration_manager = MigrationManager(db_manager)
-    migration_manager.migrate_up()
+    try:
+        migration_manager.migrate_up()
+    finally:
+        _release_migration_buffers()
 
 
 def rollback_migrations(db_manager: DatabaseManager, target_version: Optional[str] = None) -> None:
     """Rollback migrations to target version."""
     migration_manager = MigrationManager(db_manager)
-    migration_manager.migrate_down(target_version)
+    try:
+        migration_manager.migrate_down(target_version)
+    finally:
+        _release_migration_buffers()
 
 
 def check_migration_status(db_manager: DatabaseManager) -> Dict[str, Any]:
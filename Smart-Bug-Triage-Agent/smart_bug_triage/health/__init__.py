@@ -1,12 +1,17 @@
 """Health check module for Smart Bug Triage System."""
 
-from .health_server import HealthServer, HealthCheck
-from .checks import (
-    DatabaseHealthCheck,
-    MessageQueueHealthCheck,
-    APIHealthCheck,
-    AgentHealthCheck
-)
+import importlib
+
+# Public name -> submodule; imported on first attribute access (PEP 562) so that
+# importing the package does not pull in FastAPI, SQLAlchemy or pika up front.
+_LAZY = {
+    'HealthServer': '.health_server',
+    'HealthCheck': '.health_server',
+    'DatabaseHealthCheck': '.checks',
+    'MessageQueueHealthCheck': '.checks',
+    'APIHealthCheck': '.checks',
+    'AgentHealthCheck': '.checks',
+}
 
 __all__ = [
     'HealthServer',
@@ -15,4 +20,17 @@ __all__ = [
     'MessageQueueHealthCheck',
     'APIHealthCheck',
     'AgentHealthCheck'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,39 +1,55 @@
 """Health check implementations for various system components."""
 
+import os
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 from .health_server import HealthCheck, HealthStatus
-from smart_bug_triage.database.connection import DatabaseManager
-from smart_bug_triage.message_queue.connection import MessageQueueManager
-from smart_bug_triage.config.settings import SystemConfig
+
+if TYPE_CHECKING:
+    # Annotation-only: importing these at runtime would pull in SQLAlchemy and
+    # pika for every user of the health package
+    from smart_bug_triage.database.connection import DatabaseManager
+    from smart_bug_triage.message_queue.connection import MessageQueueManager
+
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    _HAS_PSUTIL = False
+
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+_MEMINFO_PATH = '/proc/meminfo'
 
 
 class DatabaseHealthCheck:
     """Health check for database connectivity."""
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: "DatabaseManager"):
         self.db_manager = db_manager
     
     def __call__(self) -> HealthCheck:
         """Perform database health check."""
+        now = datetime.now()
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Test basic connectivity
             is_healthy = self.db_manager.health_check()
             
             if is_healthy:
                 # Test query performance
-                query_time = time.time() - start_time
+                query_time = time.perf_counter() - start_time
                 
                 if query_time > 5.0:  # 5 second threshold
                     return HealthCheck(
                         name="database",
                         status=HealthStatus.DEGRADED,
                         message=f"Database responding slowly ({query_time:.2f}s)",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"query_time_seconds": query_time}
                     )
                 else:
@@ -41,7 +57,7 @@ class DatabaseHealthCheck:
                         name="database",
                         status=HealthStatus.HEALTHY,
                         message="Database connection healthy",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"query_time_seconds": query_time}
                     )
             else:
@@ -49,7 +65,7 @@ class DatabaseHealthCheck:
                     name="database",
                     status=HealthStatus.UNHEALTHY,
                     message="Database connection failed",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
         except Exception as e:
@@ -57,34 +73,35 @@ class DatabaseHealthCheck:
                 name="database",
                 status=HealthStatus.UNHEALTHY,
                 message=f"Database health check error: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
 
 
 class MessageQueueHealthCheck:
     """Health check for message queue connectivity."""
     
-    def __init__(self, mq_manager: MessageQueueManager):
+    def __init__(self, mq_manager: "MessageQueueManager"):
         self.mq_manager = mq_manager
     
     def __call__(self) -> HealthCheck:
         """Perform message queue health check."""
+        now = datetime.now()
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Test connection
             is_connected = self.mq_manager.is_connected()
             
             if is_connected:
                 # Test queue operations
-                connection_time = time.time() - start_time
+                connection_time = time.perf_counter() - start_time
                 
                 if connection_time > 3.0:  # 3 second threshold
                     return HealthCheck(
                         name="message_queue",
                         status=HealthStatus.DEGRADED,
                         message=f"Message queue responding slowly ({connection_time:.2f}s)",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"connection_time_seconds": connection_time}
                     )
                 else:
@@ -92,7 +109,7 @@ class MessageQueueHealthCheck:
                         name="message_queue",
                         status=HealthStatus.HEALTHY,
                         message="Message queue connection healthy",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"connection_time_seconds": connection_time}
                     )
             else:
@@ -100,7 +117,7 @@ class MessageQueueHealthCheck:
                     name="message_queue",
                     status=HealthStatus.UNHEALTHY,
                     message="Message queue connection failed",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
         except Exception as e:
@@ -108,7 +125,7 @@ class MessageQueueHealthCheck:
                 name="message_queue",
                 status=HealthStatus.UNHEALTHY,
                 message=f"Message queue health check error: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
 
 
@@ -121,12 +138,13 @@ class APIHealthCheck:
     
     def __call__(self) -> HealthCheck:
         """Perform API health check."""
+        now = datetime.now()
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Test API connectivity
             is_available = self.test_func()
-            api_time = time.time() - start_time
+            api_time = time.perf_counter() - start_time
             
             if is_available:
                 if api_time > 10.0:  # 10 second threshold for external APIs
@@ -134,7 +152,7 @@ class APIHealthCheck:
                         name=f"api_{self.api_name}",
                         status=HealthStatus.DEGRADED,
                         message=f"{self.api_name} API responding slowly ({api_time:.2f}s)",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"response_time_seconds": api_time}
                     )
                 else:
@@ -142,7 +160,7 @@ class APIHealthCheck:
                         name=f"api_{self.api_name}",
                         status=HealthStatus.HEALTHY,
                         message=f"{self.api_name} API healthy",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         details={"response_time_seconds": api_time}
                     )
             else:
@@ -150,7 +168,7 @@ class APIHealthCheck:
                     name=f"api_{self.api_name}",
                     status=HealthStatus.UNHEALTHY,
                     message=f"{self.api_name} API unavailable",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
         except Exception as e:
@@ -158,7 +176,7 @@ class APIHealthCheck:
                 name=f"api_{self.api_name}",
                 status=HealthStatus.UNHEALTHY,
                 message=f"{self.api_name} API health check error: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
 
 
@@ -171,6 +189,7 @@ class AgentHealthCheck:
     
     def __call__(self) -> HealthCheck:
         """Perform agent health check."""
+        now = datetime.now()
         try:
             # Check if agent is running and healthy
             if hasattr(self.agent_instance, 'is_healthy'):
@@ -185,14 +204,14 @@ class AgentHealthCheck:
                     name=f"agent_{self.agent_name}",
                     status=HealthStatus.HEALTHY,
                     message=f"{self.agent_name} agent healthy",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
             else:
                 return HealthCheck(
                     name=f"agent_{self.agent_name}",
                     status=HealthStatus.UNHEALTHY,
                     message=f"{self.agent_name} agent unhealthy",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
         except Exception as e:
@@ -200,52 +219,115 @@ class AgentHealthCheck:
                 name=f"agent_{self.agent_name}",
                 status=HealthStatus.UNHEALTHY,
                 message=f"{self.agent_name} agent health check error: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
 
 
 class SystemResourceHealthCheck:
     """Health check for system resources (memory, disk, etc.)."""
     
-    def __init__(self, memory_threshold_mb: int = 1000, disk_threshold_mb: int = 1000):
+    def __init__(
+        self,
+        memory_threshold_mb: int = 1000,
+        disk_threshold_mb: int = 1000,
+        disk_cache_ttl: float = 30.0
+    ):
         self.memory_threshold_mb = memory_threshold_mb
         self.disk_threshold_mb = disk_threshold_mb
+        # Compare raw byte counts; convert to MB only for the report
+        self._memory_threshold_bytes = memory_threshold_mb << 20
+        self._disk_threshold_bytes = disk_threshold_mb << 20
+        # Free disk space changes slowly, so it is re-read far less often than memory
+        self._mount = '/'
+        self._disk_cache_ttl = disk_cache_ttl
+        self._disk_cache: Optional[Tuple[float, int, int, int]] = None  # (expiry, free, used, total)
+        # On Linux, memory is read straight from /proc/meminfo and disk from
+        # os.statvfs, bypassing psutil
+        self._has_statvfs = hasattr(os, 'statvfs')
+    
+    def _memory_stats(self) -> Optional[Tuple[int, float]]:
+        """Return (available bytes, percent used) for system memory, None if unknown."""
+        # Opened per call: probes run concurrently on the health server's pool
+        try:
+            with open(_MEMINFO_PATH, 'rb') as f:
+                meminfo = f.read()
+        except OSError:
+            meminfo = b''
+        
+        total = available = None
+        for line in meminfo.split(b'\n'):
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) << 10
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1]) << 10
+                break
+        if total and available is not None:
+            return available, round((total - available) / total * 100, 1)
+        
+        if psutil is None:
+            return None
+        memory = psutil.virtual_memory()
+        return memory.available, memory.percent
+    
+    def _disk_stats(self) -> Tuple[int, int, int]:
+        """Return (free, used, total) bytes for the mount, cached for ``disk_cache_ttl``."""
+        cached = self._disk_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1], cached[2], cached[3]
+        
+        if self._has_statvfs:
+            st = os.statvfs(self._mount)
+            free = st.f_bavail * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            total = st.f_blocks * st.f_frsize
+        else:
+            disk = psutil.disk_usage(self._mount)
+            free, used, total = disk.free, disk.used, disk.total
+        
+        self._disk_cache = (time.monotonic() + self._disk_cache_ttl, free, used, total)
+        return free, used, total
     
     def __call__(self) -> HealthCheck:
         """Perform system resource health check."""
+        now = datetime.now()
+        memory_stats = self._memory_stats()
+        if memory_stats is None or (not _HAS_PSUTIL and not self._has_statvfs):
+            return HealthCheck(
+                name="system_resources",
+                status=HealthStatus.UNKNOWN,
+                message="psutil not available for resource monitoring",
+                timestamp=now
+            )
+        
         try:
-            import psutil
-            
             # Check memory usage
-            memory = psutil.virtual_memory()
-            memory_available_mb = memory.available / (1024 * 1024)
+            memory_available, memory_percent = memory_stats
             
             # Check disk usage
-            disk = psutil.disk_usage('/')
-            disk_free_mb = disk.free / (1024 * 1024)
+            disk_free, disk_used, disk_total = self._disk_stats()
             
             details = {
-                "memory_available_mb": round(memory_available_mb, 2),
-                "memory_percent_used": memory.percent,
-                "disk_free_mb": round(disk_free_mb, 2),
-                "disk_percent_used": round((disk.used / disk.total) * 100, 2)
+                "memory_available_mb": round(memory_available * _BYTES_TO_MB, 2),
+                "memory_percent_used": memory_percent,
+                "disk_free_mb": round(disk_free * _BYTES_TO_MB, 2),
+                "disk_percent_used": round((disk_used / disk_total) * 100, 2)
             }
             
             # Determine status
-            if memory_available_mb < self.memory_threshold_mb:
+            if memory_available < self._memory_threshold_bytes:
                 return HealthCheck(
                     name="system_resources",
                     status=HealthStatus.DEGRADED,
-                    message=f"Low memory: {memory_available_mb:.0f}MB available",
-                    timestamp=datetime.now(),
+                    message=f"Low memory: {memory_available * _BYTES_TO_MB:.0f}MB available",
+                    timestamp=now,
                     details=details
                 )
-            elif disk_free_mb < self.disk_threshold_mb:
+            elif disk_free < self._disk_threshold_bytes:
                 return HealthCheck(
                     name="system_resources",
                     status=HealthStatus.DEGRADED,
-                    message=f"Low disk space: {disk_free_mb:.0f}MB free",
-                    timestamp=datetime.now(),
+                    message=f"Low disk space: {disk_free * _BYTES_TO_MB:.0f}MB free",
+                    timestamp=now,
                     details=details
                 )
             else:
@@ -253,21 +335,14 @@ class SystemResourceHealthCheck:
                     name="system_resources",
                     status=HealthStatus.HEALTHY,
                     message="System resources healthy",
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     details=details
                 )
                 
-        except ImportError:
-            return HealthCheck(
-                name="system_resources",
-                status=HealthStatus.UNKNOWN,
-                message="psutil not available for resource monitoring",
-                timestamp=datetime.now()
-            )
         except Exception as e:
             return HealthCheck(
                 name="system_resources",
                 status=HealthStatus.UNHEALTHY,
                 message=f"System resource check error: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
\ No newline at end of file
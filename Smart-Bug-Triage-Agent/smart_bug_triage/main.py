@@ -3,11 +3,11 @@
 import sys
 import signal
 import asyncio
-import threading
-from typing import Optional
+from typing import List, Optional
 from smart_bug_triage.config.settings import SystemConfig
 from smart_bug_triage.utils.logging import setup_logging, get_logger
 from smart_bug_triage.health import HealthServer, DatabaseHealthCheck, MessageQueueHealthCheck
+from smart_bug_triage.health.health_server import install_uvloop
 
 
 class SmartBugTriageSystem:
@@ -32,23 +32,35 @@ class SmartBugTriageSystem:
         self.agents = {}
         self.running = False
         self.health_server = None
-        self.health_thread = None
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals gracefully."""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.stop()
     
-    def start(self) -> None:
-        """Start the smart bug triage system."""
+    async def start(self) -> None:
+        """Start the smart bug triage system and run until stopped."""
         self.logger.info("Starting Smart Bug Triage System...")
         
+        self._loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        
+        # Signals are delivered on the loop instead of interrupting a sleeping thread
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._signal_handler, sig)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler
+                signal.signal(
+                    sig,
+                    lambda signum, frame: self._loop.call_soon_threadsafe(self._signal_handler, signum)
+                )
+        
         try:
-            # Start health check server
+            # Start health check server on this loop
             self._start_health_server()
             
             # TODO: Initialize and start agents
@@ -57,14 +69,22 @@ class SmartBugTriageSystem:
             self.running = True
             self.logger.info("Smart Bug Triage System started successfully")
             
-            # Keep the main thread alive
-            while self.running:
-                import time
-                time.sleep(1)
+            # Block until stop() is called; no periodic wakeups
+            await self._shutdown_event.wait()
                 
         except Exception as e:
             self.logger.error(f"Failed to start system: {str(e)}")
             raise
+        finally:
+            await self._stop_background_tasks()
+    
+    async def _stop_background_tasks(self) -> None:
+        """Ask the tasks started on the system loop to finish and wait for them."""
+        # Also reached when start() fails, without stop() having run
+        if self.health_server:
+            self.health_server.stop()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
     
     def stop(self) -> None:
         """Stop the smart bug triage system."""
@@ -75,14 +95,20 @@ class SmartBugTriageSystem:
         # Stop health server
         if self.health_server:
             self.logger.info("Stopping health check server...")
+            self.health_server.stop()
         
         # TODO: Stop all agents gracefully
         # This will be implemented in subsequent tasks
         
+        # Wake start() immediately; stop() may be called from threads other than
+        # the loop's, and asyncio.Event is only safe to set from the loop itself
+        if self._shutdown_event is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._shutdown_event.set)
+        
         self.logger.info("Smart Bug Triage System stopped")
     
     def _start_health_server(self):
-        """Start the health check server in a separate thread."""
+        """Start the health check server as a task on the system event loop."""
         try:
             self.health_server = HealthServer(port=8000)
             
@@ -91,13 +117,9 @@ class SmartBugTriageSystem:
             # self.health_server.add_health_check("database", DatabaseHealthCheck(db_manager))
             # self.health_server.add_health_check("message_queue", MessageQueueHealthCheck(mq_manager))
             
-            # Start health server in separate thread
-            self.health_thread = threading.Thread(
-                target=self.health_server.run,
-                daemon=True,
-                name="HealthServer"
+            self._tasks.append(
+                self._loop.create_task(self.health_server.run_async(), name="HealthServer")
             )
-            self.health_thread.start()
             self.logger.info("Health check server started on port 8000")
             
         except Exception as e:
@@ -123,7 +145,8 @@ def main():
     
     try:
         system = SmartBugTriageSystem(args.config)
-        system.start()
+        install_uvloop()
+        asyncio.run(system.start())
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e:
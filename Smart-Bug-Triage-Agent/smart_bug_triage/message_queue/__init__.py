@@ -1,14 +1,18 @@
 """Message queue infrastructure for inter-agent communication."""
 
-from .connection import MessageQueueConnection
-from .publisher import MessagePublisher
+from .connection import MessageQueueConnection, get_shared_connection, release_shared_connection
+from .publisher import MessagePublisher, MessageBatcher, BatchConfig
 from .consumer import MessageConsumer
 from .serialization import MessageSerializer, MessageDeserializer
 from .dead_letter import DeadLetterHandler
 
 __all__ = [
     'MessageQueueConnection',
+    'get_shared_connection',
+    'release_shared_connection',
     'MessagePublisher', 
+    'MessageBatcher',
+    'BatchConfig',
     'MessageConsumer',
     'MessageSerializer',
     'MessageDeserializer',
@@ -1,9 +1,14 @@
 """RabbitMQ connection and channel management."""
 
+import dataclasses
+import functools
 import logging
+import queue
+import random
 import threading
 import time
-from typing import Optional, Dict, Any, Callable
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple, TypeVar
 from contextlib import contextmanager
 
 import pika
@@ -15,10 +20,76 @@ from ..config.settings import MessageQueueConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Topologies already declared by this process, keyed by _topology_key();
+# declarations are idempotent broker-side, so reconnects skip re-declaring them
+_DECLARED_TOPOLOGIES: Set[Tuple[Any, ...]] = set()
+_TOPOLOGY_LOCK = threading.Lock()
+
+# Interval of the I/O-loop timer that refreshes the per-queue counts health_check reports
+QUEUE_STATS_REFRESH_SECONDS = 4.0
+
+# Upper bound on a single reconnect backoff delay
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+# How long connect() fails fast after reconnect_with_backoff gives up
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 30.0
+
+# Longest single process_data_events slice on the thread driving the I/O loop,
+# i.e. from inside a connection callback, where pika does not let
+# process_data_events return early
+PROBE_POLL_SECONDS = 0.01
+
+# How often run_on_io_thread checks that the I/O thread it handed work to is
+# still running the loop
+IO_HANDOFF_POLL_SECONDS = 0.1
+
+# _shared_key(config) -> [connection, reference count]
+_SHARED_CONNECTIONS: Dict[Tuple[Any, ...], list] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def async_channel(channel: BlockingChannel) -> Any:
+    """Return the asynchronous pika channel a BlockingChannel wraps.
+    
+    Its methods send a frame and return without waiting for the reply, which
+    is what lets declares, publishes and probes be pipelined. The attribute
+    (``_impl``) is private to pika but unchanged across 1.x, the range
+    requirements.txt pins; this is the only place that reaches for it.
+    
+    Args:
+        channel: Open blocking channel
+        
+    Returns:
+        The pika.channel.Channel underneath
+        
+    Raises:
+        RuntimeError: If the installed pika does not expose the async channel
+    """
+    impl = getattr(channel, '_impl', None)
+    if impl is None:
+        raise RuntimeError(
+            f"pika {getattr(pika, '__version__', '?')} BlockingChannel has no async channel; "
+            "pipelined channel operations need pika 1.x"
+        )
+    return impl
+
+
+class ConnectionBusyError(RuntimeError):
+    """Raised when a thread tries to drive a connection another thread already drives."""
+
 
 class MessageQueueConnection:
     """Manages RabbitMQ connection and channel lifecycle."""
     
+    __slots__ = (
+        'config', '_connection', '_channel', '_lock', '_is_connected',
+        '_channel_pool', '_topology_key', '_generation',
+        '_exchange_verified_generation', '_breaker_open_until', '_queue_stats_cache',
+        '_io_lock', '_io_owner',
+    )
+    
     def __init__(self, config: MessageQueueConfig):
         """Initialize connection manager with configuration.
         
@@ -30,6 +101,25 @@ class MessageQueueConnection:
         self._channel: Optional[BlockingChannel] = None
         self._lock = threading.Lock()
         self._is_connected = False
+        # Pre-opened channels checked out per operation by acquire_channel();
+        # LIFO so the most recently used (warmest) channel is handed out first
+        self._channel_pool: queue.LifoQueue = queue.LifoQueue(maxsize=config.channel_pool_size)
+        self._topology_key = _topology_key(config)
+        # health_check caches; reset on channel errors and disconnect
+        # Bumped on every new broker connection; lets stale timers and cached
+        # exchange checks from an earlier connection be recognised
+        self._generation = 0
+        self._exchange_verified_generation = -1
+        # monotonic deadline before which connect() does not try the broker
+        self._breaker_open_until = 0.0
+        # (connection generation, per-queue stats) as last written by refresh_queue_stats()
+        # (generation, monotonic time of the probe, stats)
+        self._queue_stats_cache: Optional[Tuple[int, float, Dict[str, Dict[str, Any]]]] = None
+        # pika connections are not thread-safe: while a consumer runs the I/O
+        # loop it is the only thread using the connection, otherwise callers
+        # take turns under the lock (see run_on_io_thread)
+        self._io_lock = threading.RLock()
+        self._io_owner: Optional[threading.Thread] = None
         
     def connect(self) -> bool:
         """Establish connection to RabbitMQ server.
@@ -37,9 +127,13 @@ class MessageQueueConnection:
         Returns:
             True if connection successful, False otherwise
         """
+        if time.monotonic() < self._breaker_open_until:
+            return False  # Known outage; fail fast instead of another handshake
+        
         try:
             with self._lock:
-                if self._is_connected:
+                # The broker may have closed the socket since the flag was set
+                if self._is_connected and not self._connection.is_closed:
                     return True
                 
                 # Create connection parameters
@@ -53,16 +147,38 @@ class MessageQueueConnection:
                     port=self.config.port,
                     virtual_host=self.config.virtual_host,
                     credentials=credentials,
-                    heartbeat=600,
-                    blocked_connection_timeout=300
+                    # Negotiated idle timeout (180s by default): the peer is dead
+                    # after this long without traffic; pika sends its own
+                    # heartbeats every half of it, not every heartbeat_send
+                    heartbeat=int(self.config.heartbeat_send * self.config.heartbeat_fail_multiplier),
+                    blocked_connection_timeout=self.config.blocked_connection_timeout,
+                    # Also let the kernel drop a connection whose writes stay
+                    # unacknowledged, independent of heartbeats (Linux only)
+                    tcp_options={'TCP_USER_TIMEOUT': int(self.config.heartbeat_send * 1000 * 4)}
                 )
                 
                 # Establish connection
                 self._connection = pika.BlockingConnection(parameters)
                 self._channel = self._connection.channel()
                 
-                # Set up exchange and queues
-                self._setup_infrastructure()
+                # Set up exchange and queues, once per process and topology
+                with _TOPOLOGY_LOCK:
+                    if self._topology_key not in _DECLARED_TOPOLOGIES:
+                        self._setup_infrastructure()
+                        _DECLARED_TOPOLOGIES.add(self._topology_key)
+                
+                # Channels from a previous connection are dead; replace them
+                self._drain_channel_pool()
+                for _ in range(self.config.channel_pool_size):
+                    self._channel_pool.put_nowait(self._connection.channel())
+                
+                self._generation += 1
+                # Keep queue stats warm from the I/O loop, piggybacking on whichever
+                # thread drives it (e.g. a consumer), so health_check needs no I/O
+                self._connection.call_later(
+                    QUEUE_STATS_REFRESH_SECONDS,
+                    functools.partial(self._refresh_queue_stats, self._generation)
+                )
                 
                 self._is_connected = True
                 logger.info(f"Connected to RabbitMQ at {self.config.host}:{self.config.port}")
@@ -84,7 +200,9 @@ class MessageQueueConnection:
                 
                 self._connection = None
                 self._channel = None
+                self._drain_channel_pool()
                 self._is_connected = False
+                self._invalidate_health_cache()
                 logger.info("Disconnected from RabbitMQ")
                 
         except Exception as e:
@@ -96,10 +214,12 @@ class MessageQueueConnection:
         Returns:
             True if connected, False otherwise
         """
-        with self._lock:
-            return (self._is_connected and 
-                    self._connection and 
-                    not self._connection.is_closed)
+        # Lock-free: _is_connected is only changed under self._lock in connect()
+        # and disconnect(), and single attribute reads are atomic
+        if not self._is_connected:
+            return False
+        connection = self._connection
+        return connection is not None and not connection.is_closed
     
     def get_channel(self) -> Optional[BlockingChannel]:
         """Get the current channel.
@@ -113,103 +233,387 @@ class MessageQueueConnection:
         
         return self._channel
     
+    def open_channel(self) -> BlockingChannel:
+        """Open a channel outside the pool for a caller that keeps it for its lifetime.
+        
+        Consumers use this: deliveries must be acked on the channel they arrived
+        on, and their basic_qos/basic_consume state should not leak into the pool.
+        
+        Returns:
+            A newly opened channel
+        """
+        if not self.is_connected():
+            if not self.connect():
+                raise AMQPConnectionError("Could not establish channel")
+        
+        return self._connection.channel()
+    
+    def add_callback_threadsafe(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on the thread driving this connection's I/O.
+        
+        Args:
+            callback: Zero-argument callable, e.g. a channel's stop_consuming
+        """
+        connection = self._connection
+        if connection is not None and not connection.is_closed:
+            connection.add_callback_threadsafe(callback)
+    
+    def process_data_events(self, time_limit: float = 0) -> None:
+        """Service the connection's I/O for up to ``time_limit`` seconds.
+        
+        Returns early once a callback added with add_callback_threadsafe() has
+        run, which is how waiters on asynchronous replies are woken. On the
+        thread driving the I/O loop pika cannot return early, so the wait is
+        capped at PROBE_POLL_SECONDS there. Only call it from a function run
+        by run_on_io_thread().
+        
+        Args:
+            time_limit: Upper bound on the time spent waiting, in seconds
+        """
+        if self._io_owner is threading.current_thread():
+            time_limit = min(time_limit, PROBE_POLL_SECONDS)
+        self._connection.process_data_events(time_limit=time_limit)
+    
     @contextmanager
-    def channel_context(self):
-        """Context manager for safe channel operations."""
-        channel = self.get_channel()
-        if not channel:
-            raise AMQPConnectionError("Could not establish channel")
+    def driving_io(self):
+        """Mark the calling thread as the one running this connection's I/O loop.
+        
+        Used by consumers around start_consuming(). Inside the block,
+        run_on_io_thread() hands other threads' work to this thread instead of
+        letting them use the connection concurrently.
+        
+        Raises:
+            ConnectionBusyError: If another thread already drives this connection
+        """
+        current = threading.current_thread()
+        with self._io_lock:
+            owner = self._io_owner
+            if owner is not None and owner is not current:
+                raise ConnectionBusyError(
+                    f"Connection I/O is already driven by thread {owner.name}; "
+                    "consumers in different threads need their own connections"
+                )
+            self._io_owner = current
+        try:
+            yield
+        finally:
+            self._io_owner = None
+    
+    def io_thread(self) -> Optional[threading.Thread]:
+        """Return the thread inside driving_io(), or None if no thread drives the I/O loop."""
+        return self._io_owner
+    
+    def run_on_io_thread(self, fn: Callable[[], T]) -> T:
+        """Run ``fn`` where it may use this connection, and return its result.
+        
+        While a consumer drives the I/O loop, ``fn`` is posted to that thread
+        with add_callback_threadsafe() and the caller waits for it; otherwise
+        ``fn`` runs on the calling thread, holding the lock that keeps other
+        callers off the connection meanwhile. Exceptions from ``fn`` propagate.
+        
+        Args:
+            fn: Zero-argument callable that uses the connection
+            
+        Returns:
+            Whatever ``fn`` returns
+        """
+        current = threading.current_thread()
+        if self._io_owner is current:
+            return fn()
+        
+        while True:
+            with self._io_lock:
+                if self._io_owner is None:
+                    return fn()
+            
+            future: Future = Future()
+            
+            def run() -> None:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn())
+                    except BaseException as e:
+                        future.set_exception(e)
+            
+            connection = self._connection
+            self.add_callback_threadsafe(run)
+            while True:
+                try:
+                    return future.result(timeout=IO_HANDOFF_POLL_SECONDS)
+                except FutureTimeoutError:
+                    # The I/O thread stopped, or its connection was replaced,
+                    # before getting to it; try again
+                    stale = self._io_owner is None or self._connection is not connection
+                    if stale and future.cancel():
+                        break
+    
+    def wait_until(
+        self,
+        done: Callable[[], bool],
+        notified: threading.Condition,
+        timeout: float
+    ) -> bool:
+        """Wait up to ``timeout`` seconds for connection callbacks to make ``done()`` true.
+        
+        Callbacks only run while someone services the connection. While another
+        thread drives the I/O loop, this waits on ``notified``, which the callback
+        must notify after changing what ``done`` checks; otherwise it services
+        the connection itself through run_on_io_thread().
+        
+        Args:
+            done: Zero-argument predicate, safe to call from any thread
+            notified: Condition notified by the callbacks
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The last result of ``done()``
+        """
+        deadline = time.monotonic() + timeout
+        while not done():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            owner = self._io_owner
+            if owner is not None and owner is not threading.current_thread():
+                # Bounded so a consumer stopping meanwhile is noticed
+                with notified:
+                    notified.wait_for(done, min(remaining, IO_HANDOFF_POLL_SECONDS))
+            else:
+                self.run_on_io_thread(functools.partial(self.process_data_events, remaining))
+        return True
+    
+    def wake(self) -> None:
+        """Make a process_data_events() call in progress return early."""
+        self.add_callback_threadsafe(_noop)
+    
+    def call_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on the connection's I/O thread after ``delay`` seconds.
+        
+        Must be called from the I/O thread itself, e.g. from a delivery callback
+        or a function run by run_on_io_thread().
+        
+        Args:
+            delay: Delay in seconds
+            callback: Zero-argument callable
+        """
+        self._connection.call_later(delay, callback)
+    
+    @contextmanager
+    def acquire_channel(self):
+        """Check a channel out of the pool for the duration of one operation.
+        
+        A channel that errors is discarded rather than returned; the pool is
+        refilled lazily by opening a fresh channel when it runs empty.
+        """
+        if not self.is_connected():
+            if not self.connect():
+                raise AMQPConnectionError("Could not establish channel")
+        
+        try:
+            channel = self._channel_pool.get_nowait()
+        except queue.Empty:
+            channel = None
+        if channel is None or not channel.is_open:
+            channel = self._connection.channel()
         
         try:
             yield channel
         except AMQPChannelError as e:
             logger.error(f"Channel error: {e}")
-            # Try to reconnect
-            self._is_connected = False
+            self._invalidate_health_cache()
             raise
         except Exception as e:
             logger.error(f"Unexpected error in channel context: {e}")
             raise
+        finally:
+            self._release_channel(channel)
+    
+    def _release_channel(self, channel: BlockingChannel) -> None:
+        """Return a channel to the pool, closing it if it is surplus."""
+        if not channel.is_open:
+            return
+        try:
+            self._channel_pool.put_nowait(channel)
+        except queue.Full:
+            try:
+                channel.close()
+            except Exception:
+                pass
+    
+    def _drain_channel_pool(self) -> None:
+        """Empty the pool; used when the underlying connection goes away."""
+        while True:
+            try:
+                self._channel_pool.get_nowait()
+            except queue.Empty:
+                return
+    
+    def ensure_topology(self, force: bool = False) -> None:
+        """Declare the exchanges, queues and bindings for this connection.
+        
+        connect() already does this the first time a topology is seen in this
+        process; call this explicitly at bootstrap, or with ``force`` to
+        re-declare after the broker has been reset.
+        
+        Args:
+            force: Declare even if this topology was already declared
+        """
+        if not self.get_channel():
+            raise AMQPConnectionError("Could not establish channel")
+        
+        with _TOPOLOGY_LOCK:
+            if force or self._topology_key not in _DECLARED_TOPOLOGIES:
+                self.run_on_io_thread(self._setup_infrastructure)
+                _DECLARED_TOPOLOGIES.add(self._topology_key)
+    
+    def _invalidate_health_cache(self) -> None:
+        """Forget cached exchange/queue state so the next health check asks the broker."""
+        self._exchange_verified_generation = -1
+        self._queue_stats_cache = None
     
     def _setup_infrastructure(self) -> None:
-        """Set up exchange, queues, and bindings."""
+        """Set up exchange, queues, and bindings.
+        
+        Declarations are pipelined: BlockingChannel waits for every reply, but
+        its underlying async channel sends nowait frames when given no
+        completion callback. One blocking call at the end acts as a barrier, so
+        the whole topology costs about one round-trip instead of 4 per queue.
+        """
         if not self._channel:
             raise AMQPConnectionError("No channel available")
         
+        pipeline = async_channel(self._channel)
+        last_queue = None
+        
         # Declare exchange
-        self._channel.exchange_declare(
+        pipeline.exchange_declare(
             exchange=self.config.exchange_name,
             exchange_type='topic',
             durable=True
         )
         
         # Declare queues with dead letter exchange
-        dead_letter_exchange = f"{self.config.exchange_name}.dlx"
+        dead_letter_exchange = self.config.dlx_name
         
         # Declare dead letter exchange
-        self._channel.exchange_declare(
+        pipeline.exchange_declare(
             exchange=dead_letter_exchange,
             exchange_type='direct',
             durable=True
         )
         
         # Declare main queues
-        for queue_key, queue_name in self.config.queue_names.items():
+        for queue_name, dead_letter_queue, routing_key, failed_routing_key in self.config.routing_map.values():
             # Main queue with dead letter configuration
-            self._channel.queue_declare(
+            pipeline.queue_declare(
                 queue=queue_name,
                 durable=True,
                 arguments={
                     'x-dead-letter-exchange': dead_letter_exchange,
-                    'x-dead-letter-routing-key': f"{queue_name}.failed"
+                    'x-dead-letter-routing-key': failed_routing_key
                 }
             )
             
             # Dead letter queue
-            dead_letter_queue = f"{queue_name}.dlq"
-            self._channel.queue_declare(
+            pipeline.queue_declare(
                 queue=dead_letter_queue,
                 durable=True
             )
+            last_queue = dead_letter_queue
             
             # Bind dead letter queue
-            self._channel.queue_bind(
+            pipeline.queue_bind(
                 exchange=dead_letter_exchange,
                 queue=dead_letter_queue,
-                routing_key=f"{queue_name}.failed"
+                routing_key=failed_routing_key
             )
             
             # Bind main queue to exchange
-            routing_key = f"bug_triage.{queue_key}"
-            self._channel.queue_bind(
+            pipeline.queue_bind(
                 exchange=self.config.exchange_name,
                 queue=queue_name,
                 routing_key=routing_key
             )
         
+        # Delayed retry queues: a message published to one waits out the queue's
+        # TTL, then is dead-lettered to the main exchange under the routing key
+        # it was published with, i.e. back to its original queue
+        for retry_name, delay in self.config.retry_routes:
+            pipeline.exchange_declare(
+                exchange=retry_name,
+                exchange_type='fanout',
+                durable=True
+            )
+            pipeline.queue_declare(
+                queue=retry_name,
+                durable=True,
+                arguments={
+                    'x-message-ttl': delay * 1000,
+                    'x-dead-letter-exchange': self.config.exchange_name
+                }
+            )
+            pipeline.queue_bind(exchange=retry_name, queue=retry_name)
+            last_queue = retry_name
+        
+        # Barrier: the broker handles a channel's frames in order, so a reply to
+        # a passive declare of the last queue sent means everything above was
+        # applied; any failed nowait frame closes the channel first and
+        # surfaces here as a channel error instead
+        if last_queue is not None:
+            self._channel.queue_declare(queue=last_queue, passive=True)
+        else:
+            self._channel.exchange_declare(
+                exchange=self.config.exchange_name,
+                exchange_type='topic',
+                durable=True,
+                passive=True
+            )
+        
         logger.info("Message queue infrastructure set up successfully")
     
-    def reconnect_with_backoff(self, max_retries: int = 5, base_delay: float = 1.0) -> bool:
-        """Reconnect with exponential backoff.
+    def reconnect_with_backoff(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = RECONNECT_MAX_DELAY_SECONDS,
+        cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS
+    ) -> bool:
+        """Reconnect with decorrelated-jitter backoff.
+        
+        Random delays keep many clients from reconnecting in lockstep after a
+        broker restart. If every attempt fails, the circuit breaker opens and
+        connect() fails fast for ``cooldown`` seconds.
         
         Args:
             max_retries: Maximum number of retry attempts
             base_delay: Base delay in seconds
+            max_delay: Upper bound for a single delay in seconds
+            cooldown: How long the breaker stays open after giving up
             
         Returns:
             True if reconnection successful, False otherwise
         """
+        if self.breaker_remaining() > 0:
+            return False
+        
+        delay = base_delay
         for attempt in range(max_retries):
             if self.connect():
                 return True
             
-            delay = base_delay * (2 ** attempt)
-            logger.warning(f"Reconnection attempt {attempt + 1} failed, retrying in {delay}s")
+            delay = random.uniform(base_delay, min(max_delay, delay * 3))
+            logger.warning(f"Reconnection attempt {attempt + 1} failed, retrying in {delay:.1f}s")
             time.sleep(delay)
         
-        logger.error(f"Failed to reconnect after {max_retries} attempts")
+        self._breaker_open_until = time.monotonic() + cooldown
+        logger.error(f"Failed to reconnect after {max_retries} attempts; "
+                     f"not retrying for {cooldown}s")
         return False
     
+    def breaker_remaining(self) -> float:
+        """Seconds until the circuit breaker closes again; 0 if it is closed."""
+        return max(0.0, self._breaker_open_until - time.monotonic())
+    
     def health_check(self) -> Dict[str, Any]:
         """Perform health check on connection.
         
@@ -230,36 +634,246 @@ class MessageQueueConnection:
             if status['connected'] and self._channel:
                 status['channel_open'] = self._channel.is_open
                 
-                # Check if exchange exists by declaring it (idempotent)
-                try:
-                    self._channel.exchange_declare(
-                        exchange=self.config.exchange_name,
-                        exchange_type='topic',
-                        durable=True,
-                        passive=True  # Only check existence
-                    )
-                    status['exchange_exists'] = True
-                except Exception:
-                    status['exchange_exists'] = False
-                
-                # Check queues
-                for queue_key, queue_name in self.config.queue_names.items():
+                # The exchange is durable, so one successful passive declare per
+                # connection is enough unless a channel error resets it
+                if self._exchange_verified_generation != self._generation:
                     try:
-                        method = self._channel.queue_declare(
-                            queue=queue_name,
+                        self.run_on_io_thread(functools.partial(
+                            self._channel.exchange_declare,
+                            exchange=self.config.exchange_name,
+                            exchange_type='topic',
                             durable=True,
                             passive=True  # Only check existence
-                        )
-                        status['queues_exist'][queue_key] = {
-                            'exists': True,
-                            'message_count': method.method.message_count,
-                            'consumer_count': method.method.consumer_count
-                        }
+                        ))
+                        self._exchange_verified_generation = self._generation
                     except Exception:
-                        status['queues_exist'][queue_key] = {'exists': False}
+                        self._exchange_verified_generation = -1
+                status['exchange_exists'] = self._exchange_verified_generation == self._generation
+                
+                # Check queues
+                status['queues_exist'] = self._queue_stats()
         
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             status['error'] = str(e)
         
-        return status
\ No newline at end of file
+        return status
+    
+    def _queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the cached per-queue stats, probing if none are current.
+        
+        While a consumer drives the connection, the I/O-loop timer keeps the
+        counts fresh and health polls never probe. The timer only fires while
+        someone services the connection, so on one nobody drives the stats are
+        re-probed here once older than QUEUE_STATS_REFRESH_SECONDS.
+        """
+        cached = self._queue_stats_cache
+        if cached is not None and cached[0] == self._generation and (
+            self._io_owner is not None
+            or time.monotonic() - cached[1] < QUEUE_STATS_REFRESH_SECONDS
+        ):
+            return dict(cached[2])
+        
+        return self.refresh_queue_stats()
+    
+    def _refresh_queue_stats(self, generation: int) -> None:
+        """I/O-loop timer: re-probe queue counts and reschedule itself."""
+        if generation != self._generation or not self.is_connected():
+            return  # Timer from a previous connection
+        
+        try:
+            self.refresh_queue_stats()
+        finally:
+            self._connection.call_later(
+                QUEUE_STATS_REFRESH_SECONDS,
+                functools.partial(self._refresh_queue_stats, generation)
+            )
+    
+    def probe_queues(
+        self,
+        queue_names: List[str],
+        timeout: float = 5.0
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Passively declare several queues at once and return their counts.
+        
+        A channel runs one synchronous method at a time, so the declares are
+        spread over pooled channels, one each, and sent without waiting; the
+        replies are then collected together, for about one round-trip in total
+        instead of one per queue.
+        
+        Args:
+            queue_names: Queues to look up
+            timeout: Maximum time to wait for the broker's replies
+            
+        Returns:
+            Queue name to (message_count, consumer_count), or None for a queue
+            that does not exist or did not answer in time
+        """
+        if not self.is_connected():
+            if not self.connect():
+                raise AMQPConnectionError("Could not establish channel")
+        
+        return self.run_on_io_thread(functools.partial(self._probe_queues, queue_names, timeout))
+    
+    def _probe_queues(
+        self,
+        queue_names: List[str],
+        timeout: float
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """probe_queues() body; runs via run_on_io_thread()."""
+        results: Dict[str, Optional[Tuple[int, int]]] = dict.fromkeys(queue_names)
+        channels: List[BlockingChannel] = []
+        # Queues still awaiting a reply, and the channel each was sent on
+        pending: Dict[str, BlockingChannel] = {}
+        
+        def on_declare_ok(queue_name: str, method_frame) -> None:
+            method = method_frame.method
+            results[queue_name] = (method.message_count, method.consumer_count)
+            pending.pop(queue_name, None)
+            if not pending:
+                self.wake()
+        
+        try:
+            for queue_name in results:
+                try:
+                    channel = self._channel_pool.get_nowait()
+                except queue.Empty:
+                    channel = None
+                if channel is None or not channel.is_open:
+                    channel = self._connection.channel()
+                channels.append(channel)
+                pending[queue_name] = channel
+                # A missing queue closes its channel (404) instead of replying
+                async_channel(channel).queue_declare(
+                    queue=queue_name,
+                    passive=True,
+                    callback=functools.partial(on_declare_ok, queue_name)
+                )
+            
+            deadline = time.monotonic() + timeout
+            while any(channel.is_open for channel in pending.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.process_data_events(time_limit=remaining)
+        finally:
+            unanswered = set(map(id, pending.values()))
+            pending.clear()
+            for channel in channels:
+                if id(channel) not in unanswered:
+                    self._release_channel(channel)
+                elif channel.is_open:
+                    # A late reply must not reach whoever checks it out next
+                    try:
+                        channel.close()
+                    except Exception:
+                        pass
+        
+        return results
+    
+    def refresh_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Passively declare each queue for its counts and cache the result.
+        
+        The only writer of the stats health_check reports; call it from a
+        metrics scrape for up-to-date counts on connections without a consumer.
+        
+        Returns:
+            Dictionary of queue key to existence and message/consumer counts
+        """
+        return self.run_on_io_thread(self._declare_queue_stats)
+    
+    def _declare_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """refresh_queue_stats() body; runs via run_on_io_thread()."""
+        queues = {}
+        for queue_key, queue_name in self.config.queue_names.items():
+            try:
+                method = self._channel.queue_declare(
+                    queue=queue_name,
+                    durable=True,
+                    passive=True  # Only check existence
+                )
+                queues[queue_key] = {
+                    'exists': True,
+                    'message_count': method.method.message_count,
+                    'consumer_count': method.method.consumer_count
+                }
+            except Exception:
+                queues[queue_key] = {'exists': False}
+        
+        self._queue_stats_cache = (self._generation, time.monotonic(), queues)
+        return dict(queues)
+
+
+def _topology_key(config: MessageQueueConfig) -> Tuple[Any, ...]:
+    """Key a topology by broker, exchange and every queue, DLQ and retry route declared."""
+    return (
+        config.host,
+        config.port,
+        config.virtual_host,
+        config.exchange_name,
+        tuple(sorted(config.routing_map.values())),
+        config.retry_routes
+    )
+
+
+def _shared_key(config: MessageQueueConfig) -> Tuple[Any, ...]:
+    """Key connections by every config field, so only identical configs share one."""
+    key = []
+    for f in dataclasses.fields(config):
+        value = getattr(config, f.name)
+        if isinstance(value, dict):
+            value = tuple(sorted(value.items()))
+        elif isinstance(value, list):
+            value = tuple(value)
+        key.append(value)
+    return tuple(key)
+
+
+def get_shared_connection(config: MessageQueueConfig) -> MessageQueueConnection:
+    """Return the process-wide connection for a broker, creating it on first use.
+    
+    Publish-only agents in one process share a single TCP connection (and its
+    heartbeats) and multiplex over channels. Consumers need a connection of
+    their own, as only one thread can drive a connection's I/O loop (see
+    MessageQueueConnection.driving_io). Every call must be paired with
+    release_shared_connection().
+    
+    Args:
+        config: Message queue configuration
+        
+    Returns:
+        Shared connection manager (not necessarily connected yet)
+    """
+    key = _shared_key(config)
+    with _SHARED_LOCK:
+        entry = _SHARED_CONNECTIONS.get(key)
+        if entry is None:
+            entry = _SHARED_CONNECTIONS[key] = [MessageQueueConnection(config), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_shared_connection(connection: MessageQueueConnection) -> None:
+    """Drop one reference to a shared connection, closing it after the last one.
+    
+    Connections that did not come from get_shared_connection() are closed
+    immediately.
+    
+    Args:
+        connection: Connection previously returned by get_shared_connection()
+    """
+    with _SHARED_LOCK:
+        # By identity: the config's dicts may have been changed since
+        for key, entry in _SHARED_CONNECTIONS.items():
+            if entry[0] is connection:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _SHARED_CONNECTIONS[key]
+                break
+    
+    connection.disconnect()
+
+
+def _noop() -> None:
+    """Callback used only to wake a connection's process_data_events."""
@@ -1,30 +1,51 @@
 """Message consumer for receiving messages from queues."""
 
+import functools
 import logging
 import threading
 import time
-from typing import Callable, Optional, Dict, Any, List
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Set, Union
+from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 import pika
+from pika.adapters.blocking_connection import BlockingChannel
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-from .connection import MessageQueueConnection
+from .connection import ConnectionBusyError, MessageQueueConnection
 from .serialization import MessageDeserializer, MessageType, MessageValidator
 from ..config.settings import MessageQueueConfig
 
 
 logger = logging.getLogger(__name__)
 
+# Longest a handled delivery waits for its (cumulative) ack or dead-letter nack
+ACK_FLUSH_INTERVAL_SECONDS = 0.05
+
+# Marks MessageConsumer worker threads with the consumer they belong to
+_worker_state = threading.local()
+
 
 class MessageHandler(ABC):
-    """Abstract base class for message handlers."""
+    """Abstract base class for message handlers.
+    
+    Threading contract: handle_message runs on a MessageConsumer worker
+    thread, several at a time (up to the prefetch count), never on the thread
+    running the connection's I/O loop. Handlers must be thread-safe, must not
+    touch pika channels or connections directly, and may block. Publishing
+    through a MessagePublisher is safe, also on the consumer's own connection:
+    the publisher hands its channel work to the I/O thread with
+    MessageQueueConnection.run_on_io_thread().
+    """
     
     @abstractmethod
-    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: str) -> bool:
+    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: int) -> bool:
         """Handle a received message.
         
+        Called on a worker thread; see the class docstring.
+        
         Args:
             message_data: Deserialized message data
             message_type: Type of the message
@@ -45,29 +66,79 @@ class MessageHandler(ABC):
         pass
 
 
+class _ConsumeCounters:
+    """Per-consumer counters, bumped on every delivery.
+    
+    Slotted attributes instead of a dict, and a monotonic timestamp instead of
+    a datetime; get_consume_stats builds the reporting dict on demand.
+    """
+    __slots__ = ('total', 'ok', 'fail', 'last_ns')
+    
+    def __init__(self):
+        self.total = 0
+        self.ok = 0
+        self.fail = 0
+        self.last_ns = 0
+
+
 class MessageConsumer:
     """Base class for consuming messages from RabbitMQ queues."""
     
-    def __init__(self, connection: MessageQueueConnection, queue_name: str):
+    __slots__ = (
+        'connection', 'queue_name', 'config', '_handlers', '_is_consuming',
+        '_consumer_thread', '_channel', '_stop_event', '_executor',
+        '_inflight_tags', '_pending_acks', '_pending_nacks', '_ack_batch_size',
+        '_ack_timer_armed', '_single_get_timeout', '_counters', '_clock_anchor',
+        '_owns_connection', '_outstanding', '_stop_deadline',
+    )
+    
+    def __init__(
+        self,
+        connection: Union[MessageQueueConnection, MessageQueueConfig],
+        queue_name: str
+    ):
         """Initialize consumer with connection and queue.
         
         Args:
-            connection: Message queue connection instance
+            connection: Message queue connection instance, or a configuration
+                to open a connection of this consumer's own with
             queue_name: Name of the queue to consume from
         """
+        # Not the process-wide shared connection: only one thread can drive a
+        # connection's I/O loop, so each consumer needs its own
+        self._owns_connection = isinstance(connection, MessageQueueConfig)
+        if self._owns_connection:
+            connection = MessageQueueConnection(connection)
         self.connection = connection
         self.queue_name = queue_name
         self.config = connection.config
         self._handlers: Dict[MessageType, MessageHandler] = {}
         self._is_consuming = False
         self._consumer_thread: Optional[threading.Thread] = None
+        # Dedicated channel for consume/get and the acks for those deliveries;
+        # pooled channels are only used for queue admin calls
+        self._channel: Optional[BlockingChannel] = None
         self._stop_event = threading.Event()
-        self._consume_stats = {
-            'total_consumed': 0,
-            'successful_processed': 0,
-            'failed_processed': 0,
-            'last_consume_time': None
-        }
+        # Runs message handlers off the I/O thread; created per start_consuming()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Ack batching state, only touched on the I/O thread: tags handed to the
+        # pool and not yet finished, finished tags awaiting a cumulative ack, and
+        # failed tags awaiting a cumulative dead-letter nack
+        self._inflight_tags: Set[int] = set()
+        self._pending_acks: List[int] = []
+        self._pending_nacks: List[int] = []
+        self._ack_batch_size = 1
+        self._ack_timer_armed = False
+        # Deliveries handed to the pool and not yet finalized (I/O thread only),
+        # and when a stop gives up waiting for them
+        self._outstanding = 0
+        self._stop_deadline = 0.0
+        # inactivity_timeout of the channel's consume() generator used by
+        # consume_single_message; pika fixes it for the generator's lifetime
+        self._single_get_timeout: Optional[float] = None
+        self._counters = _ConsumeCounters()
+        # Wall-clock/monotonic pair used to turn last_ns back into a datetime
+        self._clock_anchor = (datetime.utcnow(), time.monotonic_ns())
     
     def register_handler(self, handler: MessageHandler) -> None:
         """Register a message handler for specific message types.
@@ -80,12 +151,20 @@ class MessageConsumer:
             self._handlers[message_type] = handler
             logger.info(f"Registered handler for message type: {message_type.value}")
     
-    def start_consuming(self, prefetch_count: int = 10, auto_ack: bool = False) -> bool:
+    def start_consuming(
+        self,
+        prefetch_count: int = 10,
+        auto_ack: bool = False,
+        blocking: bool = False
+    ) -> bool:
         """Start consuming messages from the queue.
         
         Args:
             prefetch_count: Number of messages to prefetch
             auto_ack: Whether to auto-acknowledge messages
+            blocking: Drive the connection's I/O on the calling thread until
+                stop_consuming() is called, from another thread, a handler or a
+                signal handler, instead of spawning a consumer thread
             
         Returns:
             True if consuming started successfully, False otherwise
@@ -94,16 +173,42 @@ class MessageConsumer:
             logger.warning("Consumer is already running")
             return True
         
+        owner = self.connection.io_thread()
+        if owner is not None:
+            logger.error(
+                f"Cannot consume from {self.queue_name}: its connection is already "
+                f"driven by thread {owner.name}; use a separate connection per consumer"
+            )
+            return False
+        
         try:
+            # One worker per prefetched message, so a full prefetch window runs in parallel
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(prefetch_count, 1),
+                thread_name_prefix=f"consumer-{self.queue_name}",
+                initializer=functools.partial(setattr, _worker_state, 'consumer', self)
+            )
+            self._ack_batch_size = max(prefetch_count // 2, 1)
+            self._stop_event.clear()
+            
+            if blocking:
+                self._is_consuming = True
+                logger.info(f"Consuming from queue on the calling thread: {self.queue_name}")
+                try:
+                    return self._consume_loop(prefetch_count, auto_ack)
+                finally:
+                    self._is_consuming = False
+            
             # Start consumer in separate thread
             self._consumer_thread = threading.Thread(
                 target=self._consume_loop,
                 args=(prefetch_count, auto_ack),
                 daemon=True
             )
+            # Set first: the thread clears it if it cannot take the connection
+            self._is_consuming = True
             self._consumer_thread.start()
             
-            self._is_consuming = True
             logger.info(f"Started consuming from queue: {self.queue_name}")
             return True
             
@@ -114,29 +219,46 @@ class MessageConsumer:
     def stop_consuming(self, timeout: float = 10.0) -> bool:
         """Stop consuming messages.
         
+        The consume loop stops taking deliveries, then waits up to ``timeout``
+        for running handlers and settles their deliveries before it exits.
+        Called from another thread, this waits for that too. Called on the
+        consuming thread itself (a signal handler in blocking mode) or from a
+        handler, it only requests the stop: waiting there would block the
+        threads the stop depends on.
+        
         Args:
             timeout: Maximum time to wait for consumer to stop
             
         Returns:
-            True if stopped successfully, False otherwise
+            True if stopped (or, from the consuming thread or a handler, asked
+            to stop) successfully, False otherwise
         """
         if not self._is_consuming:
             return True
         
         try:
-            # Signal stop
+            self._stop_deadline = time.monotonic() + timeout
             self._stop_event.set()
+            # Break the loop out of start_consuming(); pika channels may only be
+            # touched from the connection's own thread
+            self.connection.add_callback_threadsafe(self._cancel_consumer)
+            
+            thread = self._consumer_thread
+            current = threading.current_thread()
+            if (
+                thread is None
+                or current is thread
+                or current is self.connection.io_thread()
+                or getattr(_worker_state, 'consumer', None) is self
+            ):
+                return True
             
             # Wait for consumer thread to finish
-            if self._consumer_thread and self._consumer_thread.is_alive():
-                self._consumer_thread.join(timeout=timeout)
-                
-                if self._consumer_thread.is_alive():
-                    logger.warning("Consumer thread did not stop within timeout")
-                    return False
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning("Consumer thread did not stop within timeout")
+                return False
             
-            self._is_consuming = False
-            self._stop_event.clear()
             logger.info(f"Stopped consuming from queue: {self.queue_name}")
             return True
             
@@ -144,22 +266,83 @@ class MessageConsumer:
             logger.error(f"Error stopping consumer: {e}")
             return False
     
-    def _consume_loop(self, prefetch_count: int, auto_ack: bool) -> None:
+    def _cancel_consumer(self) -> None:
+        """Make channel.start_consuming() return; runs on the I/O thread."""
+        channel = self._channel
+        if channel is not None and channel.is_open:
+            channel.stop_consuming()
+    
+    def _drain_handlers(self) -> None:
+        """Wait for running handlers and settle their deliveries; runs on the I/O thread.
+        
+        Keeps servicing the connection meanwhile, so the handlers' results and
+        any channel work they hand to this thread still get through.
+        """
+        while self._outstanding:
+            remaining = self._stop_deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"{self._outstanding} handlers on {self.queue_name} still running at stop; "
+                    "their messages will be redelivered"
+                )
+                break
+            self.connection.process_data_events(time_limit=remaining)
+        self._flush_acks()
+    
+    @contextmanager
+    def _consumer_channel(self):
+        """Yield this consumer's own channel, reopening it if it was closed.
+        
+        Deliveries must be acked on the channel they arrived on, so consuming,
+        basic_get and ack/nack by delivery tag all share this channel.
+        """
+        channel = self._channel
+        if channel is None or not channel.is_open:
+            channel = self.connection.open_channel()
+            self._channel = channel
+            self._single_get_timeout = None
+        
+        try:
+            yield channel
+        except AMQPChannelError as e:
+            logger.error(f"Channel error: {e}")
+            self._channel = None
+            raise
+    
+    def _consume_loop(self, prefetch_count: int, auto_ack: bool) -> bool:
         """Main consuming loop running in separate thread.
         
         Args:
             prefetch_count: Number of messages to prefetch
             auto_ack: Whether to auto-acknowledge messages
+            
+        Returns:
+            False if another thread already drives the connection, True once stopped
         """
-        while not self._stop_event.is_set():
+        # Bound once for the life of the loop rather than looked up per pass
+        stopping = self._stop_event.is_set
+        # pika calls this with (channel, method, properties, body) per delivery;
+        # a partial skips the extra Python frame a nested wrapper would add
+        callback = functools.partial(self._handle_message, auto_ack=auto_ack)
+        
+        while not stopping():
             try:
-                with self.connection.channel_context() as channel:
+                # This thread runs the connection's I/O loop from here on; other
+                # threads' channel work is handed to it (run_on_io_thread)
+                with self.connection.driving_io(), self._consumer_channel() as channel:
+                    # Close a consume_single_message() generator first; its
+                    # deliveries would bypass the callback
+                    if self._single_get_timeout is not None:
+                        channel.cancel()
+                        self._single_get_timeout = None
+                    
                     # Set QoS
                     channel.basic_qos(prefetch_count=prefetch_count)
                     
-                    # Set up consumer
-                    def callback(ch, method, properties, body):
-                        self._handle_message(ch, method, properties, body, auto_ack)
+                    # Delivery tags restart on a new channel
+                    self._inflight_tags.clear()
+                    self._pending_acks = []
+                    self._pending_nacks = []
                     
                     # Start consuming
                     consumer_tag = channel.basic_consume(
@@ -170,35 +353,50 @@ class MessageConsumer:
                     
                     logger.info(f"Started consuming with tag: {consumer_tag}")
                     
-                    # Consume messages until stop signal
-                    while not self._stop_event.is_set():
-                        try:
-                            # Process messages with timeout
-                            self.connection._connection.process_data_events(time_limit=1.0)
-                        except Exception as e:
-                            logger.error(f"Error processing data events: {e}")
-                            break
-                    
-                    # Cancel consumer
-                    try:
+                    # Block on the socket until stop_consuming() schedules
+                    # channel.stop_consuming, which cancels the consumer; no
+                    # periodic wakeups while the queue is idle
+                    if not stopping():
+                        channel.start_consuming()
+                    else:
                         channel.basic_cancel(consumer_tag)
-                    except Exception as e:
-                        logger.warning(f"Error canceling consumer: {e}")
+                    
+                    if stopping():
+                        # Still driving the I/O loop, so handlers can finish
+                        self._drain_handlers()
                         
+            except ConnectionBusyError as e:
+                # Retrying cannot help while the other consumer runs
+                logger.error(f"Cannot consume from {self.queue_name}: {e}")
+                self._executor.shutdown(wait=False)
+                self._is_consuming = False
+                return False
+                
             except (AMQPConnectionError, AMQPChannelError) as e:
                 logger.error(f"Connection error in consume loop: {e}")
-                if not self._stop_event.is_set():
-                    # Try to reconnect
-                    time.sleep(5)
-                    self.connection.reconnect_with_backoff()
+                if not stopping():
+                    # Try to reconnect; if the breaker is open, sit out its cooldown
+                    self._stop_event.wait(5)
+                    if not self.connection.reconnect_with_backoff():
+                        self._stop_event.wait(self.connection.breaker_remaining())
                     
             except Exception as e:
                 logger.error(f"Unexpected error in consume loop: {e}")
-                if not self._stop_event.is_set():
-                    time.sleep(5)
+                if not stopping():
+                    self._stop_event.wait(5)
+        
+        self._executor.shutdown(wait=False)
+        self._is_consuming = False
+        if self._owns_connection:
+            self.connection.disconnect()
+        return True
     
     def _handle_message(self, channel, method, properties, body: bytes, auto_ack: bool) -> None:
-        """Handle a received message.
+        """Hand a received message to the worker pool.
+        
+        Runs on the connection's I/O thread, so it only dispatches: decoding,
+        validation and the handler run on ``self._executor``, and the ack/nack is
+        posted back to this thread by _finalize_message.
         
         Args:
             channel: Channel instance
@@ -209,11 +407,39 @@ class MessageConsumer:
         """
         delivery_tag = method.delivery_tag
         
+        # Update statistics
+        counters = self._counters
+        counters.total += 1
+        counters.last_ns = time.monotonic_ns()
+        
         try:
-            # Update statistics
-            self._consume_stats['total_consumed'] += 1
-            self._consume_stats['last_consume_time'] = datetime.utcnow()
+            future = self._executor.submit(self._process_message, body, delivery_tag)
+        except RuntimeError:
+            # Pool already shut down by stop_consuming(); let the broker redeliver
+            if not auto_ack:
+                self._reject_message(channel, delivery_tag, requeue=True)
+            return
+        
+        self._outstanding += 1
+        if not auto_ack:
+            self._inflight_tags.add(delivery_tag)
+        post = self.connection.add_callback_threadsafe
+        finalize = self._finalize_message
+        future.add_done_callback(
+            lambda f: post(functools.partial(finalize, channel, delivery_tag, f, auto_ack))
+        )
+    
+    def _process_message(self, body: bytes, delivery_tag: int) -> Optional[bool]:
+        """Decode, validate and handle a message on a worker thread.
+        
+        Args:
+            body: Message body
+            delivery_tag: Message delivery tag
             
+        Returns:
+            True to ack, False to nack and requeue, None to nack without requeue
+        """
+        try:
             # Deserialize message
             message_info = MessageDeserializer.deserialize(body)
             message_type = message_info['type']
@@ -222,33 +448,130 @@ class MessageConsumer:
             # Validate message
             if not MessageValidator.validate_message_envelope(message_info['raw_envelope']):
                 logger.error(f"Invalid message envelope for delivery tag {delivery_tag}")
-                self._reject_message(channel, delivery_tag, requeue=False)
-                return
+                return None
             
             # Find appropriate handler
             handler = self._handlers.get(message_type)
             if not handler:
                 logger.warning(f"No handler registered for message type: {message_type.value}")
-                self._reject_message(channel, delivery_tag, requeue=False)
-                return
+                return None
             
             # Process message
-            success = handler.handle_message(message_data, message_type, str(delivery_tag))
-            
-            if success:
-                self._consume_stats['successful_processed'] += 1
-                if not auto_ack:
-                    channel.basic_ack(delivery_tag=delivery_tag)
+            if handler.handle_message(message_data, message_type, delivery_tag):
                 logger.debug(f"Successfully processed message {delivery_tag}")
-            else:
-                self._consume_stats['failed_processed'] += 1
-                self._reject_message(channel, delivery_tag, requeue=True)
-                logger.warning(f"Handler failed to process message {delivery_tag}")
+                return True
+            
+            logger.warning(f"Handler failed to process message {delivery_tag}")
+            return False
                 
         except Exception as e:
             logger.error(f"Error handling message {delivery_tag}: {e}")
-            self._consume_stats['failed_processed'] += 1
-            self._reject_message(channel, delivery_tag, requeue=False)
+            return None
+    
+    def _finalize_message(self, channel, delivery_tag: int, future: Future, auto_ack: bool) -> None:
+        """Record the outcome of a processed message and ack/nack it.
+        
+        Scheduled onto the connection's I/O thread, the only thread allowed to
+        use the channel.
+        
+        Args:
+            channel: Channel the message was delivered on
+            delivery_tag: Message delivery tag
+            future: Completed _process_message future
+            auto_ack: Whether auto-acknowledgment is enabled
+        """
+        self._outstanding -= 1
+        outcome = future.result()
+        if outcome:
+            self._counters.ok += 1
+        else:
+            self._counters.fail += 1
+        
+        if auto_ack:
+            return
+        
+        # Tags from a channel that has since been replaced are not batched
+        batched = channel is self._channel
+        
+        if batched and outcome is not False:
+            # Acks and dead-letter nacks are settled in batches; only requeues
+            # go out one by one
+            self._inflight_tags.discard(delivery_tag)
+            pending = self._pending_acks if outcome else self._pending_nacks
+            pending.append(delivery_tag)
+            if len(pending) >= self._ack_batch_size:
+                self._flush_acks()
+            elif not self._ack_timer_armed:
+                self._ack_timer_armed = True
+                self.connection.call_later(ACK_FLUSH_INTERVAL_SECONDS, self._on_ack_timer)
+        elif outcome:
+            try:
+                channel.basic_ack(delivery_tag=delivery_tag)
+            except Exception as e:
+                logger.error(f"Error acknowledging message {delivery_tag}: {e}")
+        else:
+            if batched:
+                # Settle earlier outcomes first; the failed tag is still in
+                # flight here, so it caps the cumulative ack below itself
+                self._flush_acks()
+                self._inflight_tags.discard(delivery_tag)
+            self._reject_message(channel, delivery_tag, requeue=outcome is False)
+    
+    def _on_ack_timer(self) -> None:
+        """Flush pending acks and nacks when ACK_FLUSH_INTERVAL_SECONDS has elapsed."""
+        self._ack_timer_armed = False
+        self._flush_acks()
+    
+    def _flush_acks(self) -> None:
+        """Settle finished deliveries, with multiple=True frames where it is safe.
+        
+        A cumulative ack or nack covers every unsettled tag up to it, so acks
+        only reach below the lowest tag still in flight or awaiting a nack, and
+        nacks below the lowest tag still in flight; tags above those are settled
+        individually. Runs on the I/O thread.
+        """
+        acks = self._pending_acks
+        nacks = self._pending_nacks
+        if not acks and not nacks:
+            return
+        self._pending_acks = []
+        self._pending_nacks = []
+        
+        channel = self._channel
+        if channel is None or not channel.is_open:
+            return  # Unsettled deliveries are redelivered by the broker
+        
+        inflight = self._inflight_tags
+        try:
+            if acks:
+                self._settle(channel.basic_ack, acks, inflight.union(nacks))
+            if nacks:
+                self._settle(
+                    functools.partial(channel.basic_nack, requeue=False), nacks, inflight
+                )
+        except Exception as e:
+            logger.error(f"Error settling messages on {self.queue_name}: {e}")
+    
+    @staticmethod
+    def _settle(method: Callable[..., None], tags: List[int], unsettled: Set[int]) -> None:
+        """Send one cumulative frame for ``tags`` below ``unsettled``, then the rest.
+        
+        Args:
+            method: Bound basic_ack, or basic_nack with ``requeue`` applied
+            tags: Delivery tags to settle
+            unsettled: Tags that must not be covered by the cumulative frame
+        """
+        tags.sort()
+        if unsettled:
+            watermark = min(unsettled)
+            cumulative = [tag for tag in tags if tag < watermark]
+        else:
+            cumulative = tags
+        
+        if cumulative:
+            method(delivery_tag=cumulative[-1], multiple=True)
+        for tag in tags[len(cumulative):]:
+            method(delivery_tag=tag)
     
     def _reject_message(self, channel, delivery_tag: int, requeue: bool = False) -> None:
         """Reject a message.
@@ -258,6 +581,9 @@ class MessageConsumer:
             delivery_tag: Message delivery tag
             requeue: Whether to requeue the message
         """
+        if not channel.is_open:
+            # The broker already requeued everything unacked on this channel
+            return
         try:
             channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
         except Exception as e:
@@ -266,6 +592,9 @@ class MessageConsumer:
     def consume_single_message(self, timeout: float = 30.0) -> Optional[Dict[str, Any]]:
         """Consume a single message synchronously.
         
+        While a consumer thread drives the connection this is a basic_get on
+        that thread, which does not wait for a message to arrive.
+        
         Args:
             timeout: Maximum time to wait for a message
             
@@ -273,37 +602,63 @@ class MessageConsumer:
             Message information if received, None otherwise
         """
         try:
-            with self.connection.channel_context() as channel:
-                # Get a single message
-                method, properties, body = channel.basic_get(
-                    queue=self.queue_name,
-                    auto_ack=False
-                )
+            delivery = self.connection.run_on_io_thread(
+                functools.partial(self._get_single_message, timeout)
+            )
+            if delivery is None:
+                return None  # No message available
+            
+            method, body = delivery
+            try:
+                # Deserialize message
+                message_info = MessageDeserializer.deserialize(body)
                 
-                if method is None:
-                    return None  # No message available
+                # Add delivery information
+                message_info['delivery_tag'] = method.delivery_tag
+                message_info['redelivered'] = method.redelivered
+                
+                return message_info
+                
+            except Exception as e:
+                logger.error(f"Error deserializing single message: {e}")
+                # Reject the message
+                self.reject_message(method.delivery_tag, requeue=False)
+                return None
                 
-                try:
-                    # Deserialize message
-                    message_info = MessageDeserializer.deserialize(body)
-                    
-                    # Add delivery information
-                    message_info['delivery_tag'] = method.delivery_tag
-                    message_info['redelivered'] = method.redelivered
-                    
-                    return message_info
-                    
-                except Exception as e:
-                    logger.error(f"Error deserializing single message: {e}")
-                    # Reject the message
-                    channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-                    return None
-                    
         except Exception as e:
             logger.error(f"Error consuming single message: {e}")
             return None
     
-    def acknowledge_message(self, delivery_tag: str) -> bool:
+    def _get_single_message(self, timeout: float) -> Optional[tuple]:
+        """consume_single_message() channel work; runs via run_on_io_thread().
+        
+        Returns:
+            (method, body) of the message, or None if none arrived
+        """
+        with self._consumer_channel() as channel:
+            if self.connection.io_thread() is not None:
+                # Waiting here would stall the thread driving the connection
+                method, _, body = channel.basic_get(queue=self.queue_name, auto_ack=False)
+                return None if method is None else (method, body)
+            
+            # consume() keeps one basic_consume open across calls, so each poll
+            # reuses the consumer tag and any prefetched delivery instead of a
+            # basic_get round-trip. Prefetch 1: an idle poller must not hold
+            # the queue's other messages unacked
+            if self._single_get_timeout not in (None, timeout):
+                channel.cancel()
+                self._single_get_timeout = None
+            if self._single_get_timeout is None:
+                channel.basic_qos(prefetch_count=1)
+                self._single_get_timeout = timeout
+            method, _, body = next(channel.consume(
+                queue=self.queue_name,
+                auto_ack=False,
+                inactivity_timeout=timeout
+            ))
+            return None if method is None else (method, body)
+    
+    def acknowledge_message(self, delivery_tag: int) -> bool:
         """Acknowledge a message by delivery tag.
         
         Args:
@@ -312,15 +667,18 @@ class MessageConsumer:
         Returns:
             True if acknowledged successfully, False otherwise
         """
+        def ack() -> None:
+            with self._consumer_channel() as channel:
+                channel.basic_ack(delivery_tag=delivery_tag)
+        
         try:
-            with self.connection.channel_context() as channel:
-                channel.basic_ack(delivery_tag=int(delivery_tag))
-                return True
+            self.connection.run_on_io_thread(ack)
+            return True
         except Exception as e:
             logger.error(f"Error acknowledging message {delivery_tag}: {e}")
             return False
     
-    def reject_message(self, delivery_tag: str, requeue: bool = False) -> bool:
+    def reject_message(self, delivery_tag: int, requeue: bool = False) -> bool:
         """Reject a message by delivery tag.
         
         Args:
@@ -330,10 +688,13 @@ class MessageConsumer:
         Returns:
             True if rejected successfully, False otherwise
         """
+        def nack() -> None:
+            with self._consumer_channel() as channel:
+                channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+        
         try:
-            with self.connection.channel_context() as channel:
-                channel.basic_nack(delivery_tag=int(delivery_tag), requeue=requeue)
-                return True
+            self.connection.run_on_io_thread(nack)
+            return True
         except Exception as e:
             logger.error(f"Error rejecting message {delivery_tag}: {e}")
             return False
@@ -345,13 +706,15 @@ class MessageConsumer:
             Dictionary with queue information or None if error
         """
         try:
-            with self.connection.channel_context() as channel:
-                method = channel.queue_declare(queue=self.queue_name, passive=True)
-                return {
-                    'queue_name': self.queue_name,
-                    'message_count': method.method.message_count,
-                    'consumer_count': method.method.consumer_count
-                }
+            counts = self.connection.probe_queues([self.queue_name])[self.queue_name]
+            if counts is None:
+                logger.error(f"Error getting queue info: queue {self.queue_name} not found or did not respond")
+                return None
+            return {
+                'queue_name': self.queue_name,
+                'message_count': counts[0],
+                'consumer_count': counts[1]
+            }
         except Exception as e:
             logger.error(f"Error getting queue info: {e}")
             return None
@@ -362,11 +725,14 @@ class MessageConsumer:
         Returns:
             True if purged successfully, False otherwise
         """
+        def purge() -> int:
+            with self.connection.acquire_channel() as channel:
+                return channel.queue_purge(queue=self.queue_name).method.message_count
+        
         try:
-            with self.connection.channel_context() as channel:
-                method = channel.queue_purge(queue=self.queue_name)
-                logger.info(f"Purged {method.method.message_count} messages from queue {self.queue_name}")
-                return True
+            message_count = self.connection.run_on_io_thread(purge)
+            logger.info(f"Purged {message_count} messages from queue {self.queue_name}")
+            return True
         except Exception as e:
             logger.error(f"Error purging queue: {e}")
             return False
@@ -385,7 +751,20 @@ class MessageConsumer:
         Returns:
             Dictionary with consuming statistics
         """
-        stats = self._consume_stats.copy()
+        counters = self._counters
+        last_consume_time = None
+        if counters.last_ns:
+            anchor_time, anchor_ns = self._clock_anchor
+            last_consume_time = anchor_time + timedelta(
+                microseconds=(counters.last_ns - anchor_ns) // 1000
+            )
+        
+        stats = {
+            'total_consumed': counters.total,
+            'successful_processed': counters.ok,
+            'failed_processed': counters.fail,
+            'last_consume_time': last_consume_time
+        }
         
         # Calculate success rate
         total_processed = stats['successful_processed'] + stats['failed_processed']
@@ -398,9 +777,4 @@ class MessageConsumer:
     
     def reset_stats(self) -> None:
         """Reset consuming statistics."""
-        self._consume_stats = {
-            'total_consumed': 0,
-            'successful_processed': 0,
-            'failed_processed': 0,
-            'last_consume_time': None
-        }
\ No newline at end of file
+        self._counters = _ConsumeCounters()
\ No newline at end of file
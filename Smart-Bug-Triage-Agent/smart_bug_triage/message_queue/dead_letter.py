@@ -1,19 +1,44 @@
 """Dead letter queue handling for failed messages."""
 
 import logging
-import json
-from typing import Dict, Any, List, Optional, Callable
+import reprlib
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from .connection import MessageQueueConnection
 from .consumer import MessageConsumer, MessageHandler
 from .publisher import MessagePublisher
-from .serialization import MessageDeserializer, MessageType
+from .serialization import MessageDeserializer, MessageSerializer, MessageType, _json_dumps
 
 
 logger = logging.getLogger(__name__)
 
+# Most retries published together under one round of broker confirms, and how
+# long the first retry waits for others to join it
+RETRY_BATCH_SIZE = 50
+RETRY_BATCH_LINGER_SECONDS = 0.05
+
+# Bounded repr for logged payloads: walks at most a few levels and items, so a
+# huge payload costs no more to log than a small one
+_PAYLOAD_REPR = reprlib.Repr()
+_PAYLOAD_REPR.maxlevel = 3
+_PAYLOAD_REPR.maxdict = _PAYLOAD_REPR.maxlist = 20
+_PAYLOAD_REPR.maxstring = _PAYLOAD_REPR.maxother = 200
+
+# Routing key a retried message is republished with when it did not record one
+_DEFAULT_ROUTING_KEYS = MappingProxyType({
+    MessageType.BUG_REPORT: "bug_triage.new_bugs",
+    MessageType.CATEGORIZED_BUG: "bug_triage.triaged_bugs",
+    MessageType.ASSIGNMENT: "bug_triage.assignments",
+    MessageType.NOTIFICATION: "bug_triage.notifications",
+    MessageType.DEVELOPER_STATUS_UPDATE: "bug_triage.developer_status",
+    MessageType.SYSTEM_EVENT: "bug_triage.system_events"
+})
+
 
 @dataclass
 class FailedMessage:
@@ -32,6 +57,8 @@ class FailedMessage:
 class DeadLetterHandler(MessageHandler):
     """Handles messages in dead letter queues."""
     
+    _MAX_AGE = timedelta(hours=24)  # Don't retry messages that first failed longer ago
+    
     def __init__(self, connection: MessageQueueConnection, publisher: MessagePublisher):
         """Initialize dead letter handler.
         
@@ -44,9 +71,13 @@ class DeadLetterHandler(MessageHandler):
         self.config = connection.config
         self._retry_strategies: Dict[MessageType, Callable] = {}
         self._max_retry_attempts = 3
-        self._retry_delay_minutes = [5, 15, 60]  # Progressive delay
+        # Retries waiting to be published together: (exchange, routing key,
+        # body, future for the broker's confirm) per message
+        self._retry_buffer: List[Tuple[str, str, bytes, Future]] = []
+        self._retry_buffer_size = RETRY_BATCH_SIZE
+        self._retry_cond = threading.Condition()
     
-    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: str) -> bool:
+    def handle_message(self, message_data: Any, message_type: MessageType, delivery_tag: int) -> bool:
         """Handle a message from the dead letter queue.
         
         Args:
@@ -107,18 +138,19 @@ class DeadLetterHandler(MessageHandler):
             # Extract failure metadata (added by RabbitMQ or our system)
             failure_info = message_data.get('failure_info', {})
             
+            # Only fall back to the current time when a timestamp is missing
+            first_failed_at = failure_info.get('first_failed_at')
+            last_failed_at = failure_info.get('last_failed_at')
+            now = None if first_failed_at and last_failed_at else datetime.utcnow()
+            
             return FailedMessage(
                 original_queue=failure_info.get('original_queue', 'unknown'),
                 message_type=message_type,
                 message_data=message_data.get('original_data', message_data),
                 failure_reason=failure_info.get('reason', 'unknown'),
                 failure_count=failure_info.get('failure_count', 1),
-                first_failed_at=datetime.fromisoformat(
-                    failure_info.get('first_failed_at', datetime.utcnow().isoformat())
-                ),
-                last_failed_at=datetime.fromisoformat(
-                    failure_info.get('last_failed_at', datetime.utcnow().isoformat())
-                ),
+                first_failed_at=datetime.fromisoformat(first_failed_at) if first_failed_at else now,
+                last_failed_at=datetime.fromisoformat(last_failed_at) if last_failed_at else now,
                 original_routing_key=failure_info.get('original_routing_key', ''),
                 original_properties=failure_info.get('original_properties', {})
             )
@@ -136,35 +168,30 @@ class DeadLetterHandler(MessageHandler):
         Returns:
             True if message should be retried, False otherwise
         """
-        # Check if we have a custom retry strategy
-        strategy = self._retry_strategies.get(failed_message.message_type)
-        if strategy:
-            return strategy(failed_message)
+        # Check if we have a custom retry strategy; usually none are registered
+        if self._retry_strategies:
+            strategy = self._retry_strategies.get(failed_message.message_type)
+            if strategy:
+                return strategy(failed_message)
         
         # Default retry logic
         if failed_message.failure_count >= self._max_retry_attempts:
             logger.info(f"Message exceeded max retry attempts ({self._max_retry_attempts})")
             return False
         
-        # Check if enough time has passed since last failure
-        now = datetime.utcnow()
-        retry_delay_index = min(failed_message.failure_count - 1, len(self._retry_delay_minutes) - 1)
-        retry_delay = timedelta(minutes=self._retry_delay_minutes[retry_delay_index])
-        
-        if now - failed_message.last_failed_at < retry_delay:
-            logger.info(f"Not enough time passed for retry (need {retry_delay})")
-            return False
-        
-        # Check message age - don't retry very old messages
-        max_age = timedelta(hours=24)
-        if now - failed_message.first_failed_at > max_age:
+        # Check message age - don't retry very old messages. The delay before a
+        # retry is enforced by the broker through the retry queue's TTL
+        if datetime.utcnow() - failed_message.first_failed_at > self._MAX_AGE:
             logger.info("Message too old for retry")
             return False
         
         return True
     
     def _retry_message(self, failed_message: FailedMessage) -> bool:
-        """Retry a failed message by republishing it.
+        """Retry a failed message by republishing it through a delayed retry queue.
+        
+        The retry queue for this attempt holds the message for its delay, then
+        dead-letters it back to the main exchange under its original routing key.
         
         Args:
             failed_message: Failed message to retry
@@ -174,31 +201,34 @@ class DeadLetterHandler(MessageHandler):
         """
         try:
             # Update failure metadata
-            updated_data = failed_message.message_data.copy()
+            retry_attempt = failed_message.failure_count + 1
+            # The payload was decoded for this delivery alone, so it is annotated
+            # in place rather than copied
+            updated_data = failed_message.message_data
             if isinstance(updated_data, dict):
                 updated_data['failure_info'] = {
                     'original_queue': failed_message.original_queue,
                     'reason': failed_message.failure_reason,
-                    'failure_count': failed_message.failure_count + 1,
+                    'failure_count': retry_attempt,
                     'first_failed_at': failed_message.first_failed_at.isoformat(),
                     'last_failed_at': datetime.utcnow().isoformat(),
                     'original_routing_key': failed_message.original_routing_key,
                     'original_properties': failed_message.original_properties,
-                    'retry_attempt': failed_message.failure_count + 1
+                    'retry_attempt': retry_attempt
                 }
             
-            # Republish message to original routing key
+            # Republish message to original routing key, after a progressive delay
             routing_key = failed_message.original_routing_key or self._get_default_routing_key(failed_message.message_type)
+            retry_routes = self.config.retry_routes
+            retry_exchange, delay = retry_routes[min(failed_message.failure_count, len(retry_routes)) - 1]
             
-            success = self.publisher.publish_message(
-                message=updated_data,
-                message_type=failed_message.message_type,
-                routing_key=routing_key,
-                priority=1  # Lower priority for retries
+            body = MessageSerializer.serialize(
+                updated_data, failed_message.message_type, self.config.wire_format
             )
+            success = self._retry_messages_bulk(retry_exchange, routing_key, body)
             
             if success:
-                logger.info(f"Successfully retried message (attempt {failed_message.failure_count + 1})")
+                logger.info(f"Scheduled retry of message in {delay}s (attempt {retry_attempt})")
             else:
                 logger.error("Failed to republish message for retry")
             
@@ -208,6 +238,74 @@ class DeadLetterHandler(MessageHandler):
             logger.error(f"Error retrying message: {e}")
             return False
     
+    def _retry_messages_bulk(self, exchange: str, routing_key: str, body: bytes) -> bool:
+        """Publish a retry together with those of other in-flight DLQ messages.
+        
+        Handlers run concurrently on the consumer's worker pool. The first retry
+        to arrive waits up to RETRY_BATCH_LINGER_SECONDS, or until the buffer
+        holds ``_retry_buffer_size`` retries, then publishes everything buffered
+        with one round of confirms. The publisher hands the batch to the thread
+        driving the consumer's connection and waits for the confirms off it.
+        Every caller blocks until its own message is confirmed, so its delivery
+        is still acked only once the retry is safe.
+        
+        Args:
+            exchange: Retry exchange to publish to
+            routing_key: Original routing key of the message
+            body: Serialized message
+            
+        Returns:
+            True if the broker confirmed the retry, False otherwise
+        """
+        confirmed: Future = Future()
+        cond = self._retry_cond
+        with cond:
+            buffer = self._retry_buffer
+            buffer.append((exchange, routing_key, body, confirmed))
+            leader = len(buffer) == 1
+            if leader:
+                cond.wait_for(
+                    lambda: len(buffer) >= self._retry_buffer_size,
+                    RETRY_BATCH_LINGER_SECONDS
+                )
+                # Later retries start a new buffer
+                self._retry_buffer = []
+            elif len(buffer) == self._retry_buffer_size:
+                cond.notify()
+        
+        if leader:
+            self._publish_retry_batch(buffer)
+        return confirmed.result()
+    
+    def _publish_retry_batch(self, batch: List[Tuple[str, str, bytes, Future]]) -> None:
+        """Publish buffered retries and resolve each one's future.
+        
+        Retries are grouped by exchange and routing key, usually a single group
+        as a DLQ's messages share their original routing key.
+        
+        Args:
+            batch: Buffered (exchange, routing key, body, future) entries
+        """
+        groups: Dict[Tuple[str, str], List[Tuple[bytes, Future]]] = {}
+        for exchange, routing_key, body, confirmed in batch:
+            groups.setdefault((exchange, routing_key), []).append((body, confirmed))
+        
+        for (exchange, routing_key), entries in groups.items():
+            try:
+                result = self.publisher.publish_raw_batch(
+                    [body for body, _ in entries],
+                    routing_key,
+                    priority=1,  # Lower priority for retries
+                    exchange=exchange
+                )
+                outcomes = result['confirmed']
+            except Exception as e:
+                logger.error(f"Error publishing {len(entries)} retries to {exchange}: {e}")
+                outcomes = [False] * len(entries)
+            
+            for (_, confirmed), outcome in zip(entries, outcomes):
+                confirmed.set_result(outcome)
+    
     def _handle_permanently_failed_message(self, failed_message: FailedMessage) -> bool:
         """Handle a message that has permanently failed.
         
@@ -217,20 +315,23 @@ class DeadLetterHandler(MessageHandler):
         Returns:
             True if handled successfully, False otherwise
         """
+        # Resolved once and handed to the helpers below
+        message_type = failed_message.message_type.value
+        
         try:
             # Log permanent failure
             logger.error(
                 f"Message permanently failed after {failed_message.failure_count} attempts. "
-                f"Type: {failed_message.message_type.value}, "
+                f"Type: {message_type}, "
                 f"Reason: {failed_message.failure_reason}, "
                 f"First failed: {failed_message.first_failed_at}"
             )
             
             # Store in permanent failure log/database
-            self._store_permanent_failure(failed_message)
+            self._store_permanent_failure(failed_message, message_type)
             
             # Send alert for permanent failure
-            self._send_permanent_failure_alert(failed_message)
+            self._send_permanent_failure_alert(failed_message, message_type)
             
             return True
             
@@ -238,42 +339,48 @@ class DeadLetterHandler(MessageHandler):
             logger.error(f"Error handling permanently failed message: {e}")
             return False
     
-    def _store_permanent_failure(self, failed_message: FailedMessage) -> None:
+    def _store_permanent_failure(self, failed_message: FailedMessage, message_type: str) -> None:
         """Store permanently failed message for analysis.
         
         Args:
             failed_message: Failed message to store
+            message_type: Value of the failed message's type
         """
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+        
         try:
             # This would typically store in a database or file
             # For now, we'll log the details
             failure_record = {
                 'timestamp': datetime.utcnow().isoformat(),
-                'message_type': failed_message.message_type.value,
+                'message_type': message_type,
                 'original_queue': failed_message.original_queue,
                 'failure_reason': failed_message.failure_reason,
                 'failure_count': failed_message.failure_count,
                 'first_failed_at': failed_message.first_failed_at.isoformat(),
                 'last_failed_at': failed_message.last_failed_at.isoformat(),
-                'message_data': str(failed_message.message_data)[:1000]  # Truncate for logging
+                'message_data': _PAYLOAD_REPR.repr(failed_message.message_data)[:1000]  # Truncate for logging
             }
             
-            logger.error(f"PERMANENT_FAILURE: {json.dumps(failure_record, indent=2)}")
+            # One line, no indent: cheaper to encode and log aggregators parse it as is
+            logger.error(f"PERMANENT_FAILURE: {_json_dumps(failure_record, str).decode('utf-8')}")
             
         except Exception as e:
             logger.error(f"Error storing permanent failure: {e}")
     
-    def _send_permanent_failure_alert(self, failed_message: FailedMessage) -> None:
+    def _send_permanent_failure_alert(self, failed_message: FailedMessage, message_type: str) -> None:
         """Send alert for permanent message failure.
         
         Args:
             failed_message: Failed message to alert about
+            message_type: Value of the failed message's type
         """
         try:
             # Create alert message
             alert = {
                 'alert_type': 'permanent_message_failure',
-                'message_type': failed_message.message_type.value,
+                'message_type': message_type,
                 'failure_count': failed_message.failure_count,
                 'failure_reason': failed_message.failure_reason,
                 'timestamp': datetime.utcnow().isoformat()
@@ -294,16 +401,7 @@ class DeadLetterHandler(MessageHandler):
         Returns:
             Default routing key
         """
-        routing_key_map = {
-            MessageType.BUG_REPORT: "bug_triage.new_bugs",
-            MessageType.CATEGORIZED_BUG: "bug_triage.triaged_bugs",
-            MessageType.ASSIGNMENT: "bug_triage.assignments",
-            MessageType.NOTIFICATION: "bug_triage.notifications",
-            MessageType.DEVELOPER_STATUS_UPDATE: "bug_triage.developer_status",
-            MessageType.SYSTEM_EVENT: "bug_triage.system_events"
-        }
-        
-        return routing_key_map.get(message_type, "bug_triage.unknown")
+        return _DEFAULT_ROUTING_KEYS.get(message_type, "bug_triage.unknown")
     
     def get_dead_letter_queue_stats(self) -> Dict[str, Any]:
         """Get statistics for all dead letter queues.
@@ -314,21 +412,21 @@ class DeadLetterHandler(MessageHandler):
         stats = {}
         
         try:
-            with self.connection.channel_context() as channel:
-                for queue_key, queue_name in self.config.queue_names.items():
-                    dlq_name = f"{queue_name}.dlq"
+            dlq_names = {key: names[1] for key, names in self.config.routing_map.items()}
+            counts = self.connection.probe_queues(list(dlq_names.values()))
+            
+            for queue_key, dlq_name in dlq_names.items():
+                queue_counts = counts[dlq_name]
+                if queue_counts is None:
+                    logger.warning(f"Could not get stats for DLQ {dlq_name}")
+                    stats[queue_key] = {'error': f"Queue {dlq_name} not found or did not respond"}
+                else:
+                    stats[queue_key] = {
+                        'queue_name': dlq_name,
+                        'message_count': queue_counts[0],
+                        'consumer_count': queue_counts[1]
+                    }
                     
-                    try:
-                        method = channel.queue_declare(queue=dlq_name, passive=True)
-                        stats[queue_key] = {
-                            'queue_name': dlq_name,
-                            'message_count': method.method.message_count,
-                            'consumer_count': method.method.consumer_count
-                        }
-                    except Exception as e:
-                        logger.warning(f"Could not get stats for DLQ {dlq_name}: {e}")
-                        stats[queue_key] = {'error': str(e)}
-                        
         except Exception as e:
             logger.error(f"Error getting DLQ stats: {e}")
             stats['error'] = str(e)
@@ -345,17 +443,20 @@ class DeadLetterHandler(MessageHandler):
             True if purged successfully, False otherwise
         """
         try:
-            queue_name = self.config.queue_names.get(queue_key)
-            if not queue_name:
+            names = self.config.routing_map.get(queue_key)
+            if not names:
                 logger.error(f"Unknown queue key: {queue_key}")
                 return False
             
-            dlq_name = f"{queue_name}.dlq"
+            dlq_name = names[1]
+            
+            def purge() -> int:
+                with self.connection.acquire_channel() as channel:
+                    return channel.queue_purge(queue=dlq_name).method.message_count
             
-            with self.connection.channel_context() as channel:
-                method = channel.queue_purge(queue=dlq_name)
-                logger.info(f"Purged {method.method.message_count} messages from DLQ {dlq_name}")
-                return True
+            message_count = self.connection.run_on_io_thread(purge)
+            logger.info(f"Purged {message_count} messages from DLQ {dlq_name}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error purging DLQ for {queue_key}: {e}")
@@ -365,6 +466,8 @@ class DeadLetterHandler(MessageHandler):
 class DeadLetterConsumer(MessageConsumer):
     """Specialized consumer for dead letter queues."""
     
+    __slots__ = ('dead_letter_handler',)
+    
     def __init__(self, connection: MessageQueueConnection, queue_key: str, publisher: MessagePublisher):
         """Initialize dead letter consumer.
         
@@ -373,17 +476,37 @@ class DeadLetterConsumer(MessageConsumer):
             queue_key: Key identifying the main queue
             publisher: Message publisher for retries
         """
-        queue_name = connection.config.queue_names.get(queue_key)
-        if not queue_name:
+        names = connection.config.routing_map.get(queue_key)
+        if not names:
             raise ValueError(f"Unknown queue key: {queue_key}")
         
-        dlq_name = f"{queue_name}.dlq"
-        super().__init__(connection, dlq_name)
+        super().__init__(connection, names[1])
         
         # Register dead letter handler
         self.dead_letter_handler = DeadLetterHandler(connection, publisher)
         self.register_handler(self.dead_letter_handler)
     
+    def start_consuming(
+        self,
+        prefetch_count: int = RETRY_BATCH_SIZE,
+        auto_ack: bool = False,
+        blocking: bool = False
+    ) -> bool:
+        """Start consuming dead-lettered messages.
+        
+        Prefetches a full retry batch by default, so enough handlers run at
+        once for their retries to be published together.
+        
+        Args:
+            prefetch_count: Number of messages to prefetch
+            auto_ack: Whether to auto-acknowledge messages
+            blocking: Consume on the calling thread instead of a consumer thread
+            
+        Returns:
+            True if consuming started successfully, False otherwise
+        """
+        return super().start_consuming(prefetch_count, auto_ack, blocking)
+    
     def register_retry_strategy(self, message_type: MessageType, strategy: Callable[[FailedMessage], bool]) -> None:
         """Register a custom retry strategy.
         
@@ -1,37 +1,100 @@
 """Message publisher for sending messages to queues."""
 
+import functools
+import itertools
 import logging
+import os
+import random
+import threading
 import time
-from typing import Any, Optional, Dict
-from datetime import datetime
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional, Dict, Deque, List, Set, Tuple
+from datetime import datetime, timedelta
 
 import pika
+from pika import spec
+from pika.adapters.blocking_connection import BlockingChannel
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-from .connection import MessageQueueConnection
-from .serialization import MessageSerializer, MessageType, MessageValidator
+from .connection import MessageQueueConnection, RECONNECT_MAX_DELAY_SECONDS, async_channel
+from .serialization import MessageSerializer, MessageType, MessageValidator, msgspec
 from ..config.settings import MessageQueueConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BatchConfig:
+    """Flush thresholds for a MessageBatcher; whichever is reached first wins."""
+    max_size: int = 100
+    max_latency_ms: int = 50
+    max_bytes: int = 1_048_576
+
+
+class _PublishCounters:
+    """One thread's publish counters; get_publish_stats sums them.
+    
+    Each publishing thread only bumps its own instance, so concurrent publishers
+    never race on (or lose) an increment.
+    """
+    __slots__ = ('published', 'failed', 'last_ns')
+    
+    def __init__(self):
+        self.published = 0
+        self.failed = 0
+        self.last_ns = 0
+
+
 class MessagePublisher:
     """Base class for publishing messages to RabbitMQ queues."""
     
-    def __init__(self, connection: MessageQueueConnection):
+    def __init__(self, connection: MessageQueueConnection, batch_config: Optional[BatchConfig] = None):
         """Initialize publisher with connection.
         
         Args:
             connection: Message queue connection instance
+            batch_config: If given, the publish_* helpers queue messages in a
+                MessageBatcher instead of publishing each one immediately
         """
         self.connection = connection
         self.config = connection.config
-        self._publish_stats = {
-            'total_published': 0,
-            'failed_publishes': 0,
-            'last_publish_time': None
-        }
+        # Per-thread state: publish counters and reusable BasicProperties
+        self._local = threading.local()
+        self._thread_counters: Dict[threading.Thread, _PublishCounters] = {}
+        # Totals of threads that have exited, e.g. MessageBatcher timer threads
+        self._retired_counters = _PublishCounters()
+        self._counters_lock = threading.Lock()
+        # Wall-clock/monotonic pair used to turn last_ns back into a datetime
+        self._clock_anchor = (datetime.utcnow(), time.monotonic_ns())
+        # Long-lived channel in confirm mode used by publish_batch; opened lazily
+        # and replaced when it closes. Publish sequence numbers restart with it.
+        # Only used on the connection's I/O thread (see _send_batch)
+        self._confirm_channel: Optional[BlockingChannel] = None
+        self._publish_seq = 0
+        # Sequence numbers the broker has not confirmed yet, and the outcome of
+        # those it has (True for Basic.Ack, False for Basic.Nack)
+        self._unconfirmed: Set[int] = set()
+        self._confirmed: Dict[int, bool] = {}
+        # Notified on every confirm for callers waiting off the I/O thread
+        self._confirm_cond = threading.Condition()
+        self._batcher = MessageBatcher(self, batch_config) if batch_config else None
+        # Message IDs: a per-publisher random prefix plus the pid (for forked
+        # workers), a nanosecond timestamp and a counter; next() on a count is
+        # atomic under the GIL, so no lock or PRNG is needed per message
+        self._id_prefix = f"msg_{uuid.uuid4().hex[:8]}_{os.getpid()}"
+        self._id_seq = itertools.count()
+        # Body format for everything this publisher serializes
+        self._wire_format = self.config.wire_format
+        if self._wire_format == "msgpack" and msgspec is None:
+            logger.warning("msgpack wire format needs msgspec; publishing JSON instead")
+            self._wire_format = "json"
+        if self._wire_format == "msgpack":
+            self._content_type, self._content_encoding = 'application/msgpack', None
+        else:
+            self._content_type, self._content_encoding = 'application/json', 'utf-8'
     
     def publish_message(
         self,
@@ -40,7 +103,8 @@ class MessagePublisher:
         routing_key: str,
         priority: int = 0,
         expiration: Optional[int] = None,
-        retry_count: int = 3
+        retry_count: int = 3,
+        exchange: Optional[str] = None
     ) -> bool:
         """Publish a message to the exchange.
         
@@ -51,41 +115,39 @@ class MessagePublisher:
             priority: Message priority (0-255)
             expiration: Message TTL in milliseconds
             retry_count: Number of retry attempts
+            exchange: Exchange to publish to; defaults to the configured one
             
         Returns:
             True if message published successfully, False otherwise
         """
         for attempt in range(retry_count + 1):
+            if self.connection.breaker_remaining():
+                # Broker known to be down: fail fast instead of retrying against it
+                logger.warning(f"Circuit breaker open; dropping {message_type.value} publish")
+                self._counters().failed += 1
+                return False
+            
             try:
                 # Serialize message
-                serialized_data = MessageSerializer.serialize(message, message_type)
+                serialized_data = MessageSerializer.serialize(message, message_type, self._wire_format)
                 
                 # Prepare message properties
-                properties = pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                    priority=priority,
-                    timestamp=int(time.time()),
-                    message_id=self._generate_message_id(),
-                    content_type='application/json',
-                    content_encoding='utf-8'
-                )
-                
-                if expiration:
-                    properties.expiration = str(expiration)
+                properties = self._message_properties(priority, expiration)
                 
-                # Publish message
-                with self.connection.channel_context() as channel:
-                    channel.basic_publish(
-                        exchange=self.config.exchange_name,
-                        routing_key=routing_key,
-                        body=serialized_data,
-                        properties=properties,
-                        mandatory=True  # Return message if no queue bound
-                    )
+                # Publish message; pika connections are not thread-safe, so the
+                # channel work runs on the thread driving the connection's I/O
+                self.connection.run_on_io_thread(functools.partial(
+                    self._basic_publish,
+                    exchange or self.config.exchange_name,
+                    routing_key,
+                    serialized_data,
+                    properties
+                ))
                 
                 # Update statistics
-                self._publish_stats['total_published'] += 1
-                self._publish_stats['last_publish_time'] = datetime.utcnow()
+                counters = self._counters()
+                counters.published += 1
+                counters.last_ns = time.monotonic_ns()
                 
                 logger.debug(f"Published message of type {message_type.value} with routing key {routing_key}")
                 return True
@@ -93,21 +155,72 @@ class MessagePublisher:
             except (AMQPConnectionError, AMQPChannelError) as e:
                 logger.warning(f"Connection error on publish attempt {attempt + 1}: {e}")
                 if attempt < retry_count:
-                    # Try to reconnect
+                    # Try to reconnect; if that gives up it opens the breaker and
+                    # the next attempt fails fast, so skip the delay
                     self.connection.reconnect_with_backoff(max_retries=2)
-                    time.sleep(0.5 * (attempt + 1))  # Brief delay between retries
+                    if not self.connection.breaker_remaining():
+                        # Exponential delay between retries, jittered so publishers
+                        # that failed together do not retry together
+                        time.sleep(
+                            min(RECONNECT_MAX_DELAY_SECONDS, 0.5 * 2 ** attempt)
+                            + random.uniform(0, 0.25)
+                        )
                 else:
                     logger.error(f"Failed to publish message after {retry_count + 1} attempts")
-                    self._publish_stats['failed_publishes'] += 1
+                    self._counters().failed += 1
                     return False
                     
             except Exception as e:
                 logger.error(f"Unexpected error publishing message: {e}")
-                self._publish_stats['failed_publishes'] += 1
+                self._counters().failed += 1
                 return False
         
         return False
     
+    def _basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: pika.BasicProperties
+    ) -> None:
+        """Publish one message on a pooled channel; runs via run_on_io_thread()."""
+        with self.connection.acquire_channel() as channel:
+            channel.basic_publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+                mandatory=True  # Return message if no queue bound
+            )
+    
+    def _message_properties(self, priority: int, expiration: Optional[int]) -> pika.BasicProperties:
+        """Fill in this thread's reusable properties for one message.
+        
+        pika encodes the properties when basic_publish sends the frame, so each
+        thread can keep one instance instead of constructing one per message.
+        
+        Args:
+            priority: Message priority (0-255)
+            expiration: Message TTL in milliseconds
+            
+        Returns:
+            Properties for the next publish on this thread
+        """
+        properties = getattr(self._local, 'properties', None)
+        if properties is None:
+            properties = self._local.properties = pika.BasicProperties(
+                delivery_mode=2,  # Make message persistent
+                content_type=self._content_type,
+                content_encoding=self._content_encoding
+            )
+        
+        properties.priority = priority
+        properties.timestamp = int(time.time())
+        properties.message_id = self._generate_message_id()
+        properties.expiration = str(expiration) if expiration else None
+        return properties
+    
     def publish_bug_report(self, bug_report: Any) -> bool:
         """Publish a new bug report.
         
@@ -117,7 +230,7 @@ class MessagePublisher:
         Returns:
             True if published successfully, False otherwise
         """
-        return self.publish_message(
+        return self._send(
             message=bug_report,
             message_type=MessageType.BUG_REPORT,
             routing_key="bug_triage.new_bugs",
@@ -136,7 +249,7 @@ class MessagePublisher:
         # Higher priority for critical bugs
         priority = 10 if hasattr(categorized_bug, 'severity') and categorized_bug.severity == 'Critical' else 5
         
-        return self.publish_message(
+        return self._send(
             message=categorized_bug,
             message_type=MessageType.CATEGORIZED_BUG,
             routing_key="bug_triage.triaged_bugs",
@@ -152,7 +265,7 @@ class MessagePublisher:
         Returns:
             True if published successfully, False otherwise
         """
-        return self.publish_message(
+        return self._send(
             message=assignment,
             message_type=MessageType.ASSIGNMENT,
             routing_key="bug_triage.assignments",
@@ -168,7 +281,7 @@ class MessagePublisher:
         Returns:
             True if published successfully, False otherwise
         """
-        return self.publish_message(
+        return self._send(
             message=notification,
             message_type=MessageType.NOTIFICATION,
             routing_key="bug_triage.notifications",
@@ -184,7 +297,7 @@ class MessagePublisher:
         Returns:
             True if published successfully, False otherwise
         """
-        return self.publish_message(
+        return self._send(
             message=status_update,
             message_type=MessageType.DEVELOPER_STATUS_UPDATE,
             routing_key="bug_triage.developer_status",
@@ -201,59 +314,259 @@ class MessagePublisher:
         Returns:
             True if published successfully, False otherwise
         """
-        return self.publish_message(
+        return self._send(
             message=event,
             message_type=MessageType.SYSTEM_EVENT,
             routing_key="bug_triage.system_events",
             priority=priority
         )
     
-    def publish_batch(self, messages: list, routing_key: str) -> Dict[str, int]:
+    def _send(self, message: Any, message_type: MessageType, routing_key: str, priority: int) -> bool:
+        """Publish via the batcher if batching is enabled, else immediately.
+        
+        Returns:
+            True if published (or queued for publishing), False otherwise
+        """
+        if self._batcher is not None:
+            return self._batcher.add(message, message_type, routing_key, priority)
+        return self.publish_message(
+            message=message,
+            message_type=message_type,
+            routing_key=routing_key,
+            priority=priority
+        )
+    
+    def flush(self) -> None:
+        """Publish any messages queued by the batcher."""
+        if self._batcher is not None:
+            self._batcher.flush()
+    
+    def close(self) -> None:
+        """Publish queued messages and stop batching; call on shutdown."""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+    
+    def publish_batch(
+        self,
+        messages: list,
+        routing_key: str,
+        timeout: float = 30.0,
+        priority: int = 0
+    ) -> Dict[str, int]:
         """Publish multiple messages in a batch.
         
+        Messages are streamed on a confirm-mode channel without waiting for each
+        one, then the broker's confirms are collected in bulk, so the batch
+        costs about one round-trip rather than one per message.
+        
         Args:
             messages: List of (message, message_type) tuples
             routing_key: Routing key for all messages
+            timeout: Maximum time to wait for the broker to confirm the batch
+            priority: Message priority (0-255) for all messages
+            
+        Returns:
+            Dictionary with success and failure counts; a message counts as
+            published only once the broker has confirmed it
+        """
+        bodies = []
+        for message, message_type in messages:
+            try:
+                bodies.append(MessageSerializer.serialize(message, message_type, self._wire_format))
+            except Exception as e:
+                logger.error(f"Failed to publish message in batch: {e}")
+        
+        self._counters().failed += len(messages) - len(bodies)
+        success = sum(self._publish_serialized(bodies, routing_key, priority, timeout))
+        return {'success': success, 'failed': len(messages) - success}
+    
+    def publish_raw_batch(
+        self,
+        bodies: List[bytes],
+        routing_key: str,
+        timeout: float = 30.0,
+        priority: int = 0,
+        exchange: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Publish already serialized messages in a batch.
+        
+        Like publish_batch, for producers that hold MessageSerializer.serialize
+        output already and should not pay for serializing again.
+        
+        Args:
+            bodies: Serialized message envelopes
+            routing_key: Routing key for all messages
+            timeout: Maximum time to wait for the broker to confirm the batch
+            priority: Message priority (0-255) for all messages
+            exchange: Exchange to publish to; defaults to the configured one
             
         Returns:
-            Dictionary with success and failure counts
+            Dictionary with success and failure counts, and under 'confirmed'
+            whether the broker confirmed each body, in order
         """
-        results = {'success': 0, 'failed': 0}
+        confirmed = self._publish_serialized(bodies, routing_key, priority, timeout, exchange)
+        success = sum(confirmed)
+        return {'success': success, 'failed': len(bodies) - success, 'confirmed': confirmed}
+    
+    def _publish_serialized(
+        self,
+        bodies: List[bytes],
+        routing_key: str,
+        priority: int,
+        timeout: float,
+        exchange: Optional[str] = None
+    ) -> List[bool]:
+        """Stream serialized messages on the confirm channel and await confirms.
         
+        Args:
+            bodies: Serialized message bodies
+            routing_key: Routing key for all messages
+            priority: Message priority (0-255) for all messages
+            timeout: Maximum time to wait for the broker to confirm them
+            exchange: Exchange to publish to; defaults to the configured one
+            
+        Returns:
+            Whether the broker confirmed each body, in order
+        """
+        batch: List[int] = []
         try:
-            with self.connection.channel_context() as channel:
-                for message, message_type in messages:
-                    try:
-                        serialized_data = MessageSerializer.serialize(message, message_type)
-                        
-                        properties = pika.BasicProperties(
-                            delivery_mode=2,
-                            timestamp=int(time.time()),
-                            message_id=self._generate_message_id(),
-                            content_type='application/json'
-                        )
-                        
-                        channel.basic_publish(
-                            exchange=self.config.exchange_name,
-                            routing_key=routing_key,
-                            body=serialized_data,
-                            properties=properties
-                        )
-                        
-                        results['success'] += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to publish message in batch: {e}")
-                        results['failed'] += 1
-                        
+            # Only streaming and the confirm bookkeeping run on the I/O thread;
+            # waiting for the broker there would hold up a consumer's deliveries
+            channel, batch = self.connection.run_on_io_thread(functools.partial(
+                self._send_batch,
+                bodies,
+                routing_key,
+                priority,
+                exchange or self.config.exchange_name
+            ))
+            if channel is not None:
+                outcomes = self._confirmed
+                # A channel-level error closes the channel; its confirms never come
+                settled = self.connection.wait_until(
+                    lambda: not channel.is_open or all(seq in outcomes for seq in batch),
+                    self._confirm_cond,
+                    timeout
+                )
+                if not settled:
+                    logger.warning(f"Batch of {len(batch)} messages not fully confirmed after {timeout}s")
+            confirmed = self.connection.run_on_io_thread(
+                functools.partial(self._take_confirms, batch)
+            )
         except Exception as e:
             logger.error(f"Batch publish failed: {e}")
-            results['failed'] = len(messages) - results['success']
+            confirmed = []
         
-        self._publish_stats['total_published'] += results['success']
-        self._publish_stats['failed_publishes'] += results['failed']
+        # Bodies never sent because the channel failed count as unconfirmed
+        confirmed.extend([False] * (len(bodies) - len(confirmed)))
+        success = sum(confirmed)
+        counters = self._counters()
+        counters.published += success
+        counters.failed += len(bodies) - success
+        if success:
+            counters.last_ns = time.monotonic_ns()
         
-        return results
+        return confirmed
+    
+    def _send_batch(
+        self,
+        bodies: List[bytes],
+        routing_key: str,
+        priority: int,
+        exchange: str
+    ) -> Tuple[Optional[BlockingChannel], List[int]]:
+        """Stream bodies on the confirm channel without waiting for confirms.
+        
+        Runs via run_on_io_thread(), like _take_confirms() and _on_confirm(),
+        so the confirm channel and its bookkeeping need no lock.
+        
+        Returns:
+            The confirm channel, or None if publishing failed, and the
+            sequence numbers of the bodies sent
+        """
+        batch = []
+        try:
+            channel = self._get_confirm_channel()
+            
+            # The async channel underneath does not wait for the confirm
+            publish = async_channel(channel).basic_publish
+            seq = self._publish_seq
+            
+            for serialized_data in bodies:
+                publish(
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    body=serialized_data,
+                    properties=self._message_properties(priority, None)
+                )
+                seq += 1
+                self._publish_seq = seq
+                batch.append(seq)
+            
+            self._unconfirmed.update(batch)
+            return channel, batch
+            
+        except Exception as e:
+            logger.error(f"Batch publish failed: {e}")
+            self._confirm_channel = None
+            return None, batch
+    
+    def _take_confirms(self, batch: List[int]) -> List[bool]:
+        """Remove a batch's confirm bookkeeping; runs via run_on_io_thread().
+        
+        Args:
+            batch: Sequence numbers returned by _send_batch()
+            
+        Returns:
+            Whether the broker confirmed each one, in order
+        """
+        for seq in batch:
+            self._unconfirmed.discard(seq)
+        return [self._confirmed.pop(seq, False) for seq in batch]
+    
+    def _get_confirm_channel(self) -> BlockingChannel:
+        """Return the confirm-mode channel, opening a new one if needed.
+        
+        Returns:
+            Open channel with publisher confirms enabled
+        """
+        channel = self._confirm_channel
+        if channel is not None and channel.is_open:
+            return channel
+        
+        channel = self.connection.open_channel()
+        # Without a completion callback Confirm.Select is sent nowait; the
+        # first publish is ordered after it on the channel
+        async_channel(channel).confirm_delivery(ack_nack_callback=self._on_confirm)
+        self._confirm_channel = channel
+        self._publish_seq = 0
+        self._unconfirmed.clear()
+        self._confirmed.clear()
+        return channel
+    
+    def _on_confirm(self, method_frame) -> None:
+        """Record a Basic.Ack/Basic.Nack from the broker for published messages.
+        
+        Args:
+            method_frame: Frame carrying the confirm method
+        """
+        method = method_frame.method
+        acked = isinstance(method, spec.Basic.Ack)
+        if method.multiple:
+            tags = [tag for tag in self._unconfirmed if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag]
+        
+        for tag in tags:
+            if tag in self._unconfirmed:
+                self._unconfirmed.discard(tag)
+                self._confirmed[tag] = acked
+        
+        # Wake callers waiting for their batch in connection.wait_until(),
+        # whether on this condition or in process_data_events
+        with self._confirm_cond:
+            self._confirm_cond.notify_all()
+        self.connection.wake()
     
     def _generate_message_id(self) -> str:
         """Generate unique message ID.
@@ -261,10 +574,26 @@ class MessagePublisher:
         Returns:
             Unique message identifier
         """
-        import random
-        timestamp = int(time.time() * 1000000)  # Microsecond precision
-        random_suffix = random.randint(1000, 9999)
-        return f"msg_{timestamp}_{random_suffix}"
+        return f"{self._id_prefix}_{time.time_ns()}_{next(self._id_seq)}"
+    
+    def _counters(self) -> _PublishCounters:
+        """Return the calling thread's counters, registering them on first use."""
+        counters = getattr(self._local, 'counters', None)
+        if counters is None:
+            counters = self._local.counters = _PublishCounters()
+            with self._counters_lock:
+                self._retire_exited_threads()
+                self._thread_counters[threading.current_thread()] = counters
+        return counters
+    
+    def _retire_exited_threads(self) -> None:
+        """Fold counters of exited threads into the retired totals; caller holds the lock."""
+        retired = self._retired_counters
+        for thread in [thread for thread in self._thread_counters if not thread.is_alive()]:
+            counters = self._thread_counters.pop(thread)
+            retired.published += counters.published
+            retired.failed += counters.failed
+            retired.last_ns = max(retired.last_ns, counters.last_ns)
     
     def get_publish_stats(self) -> Dict[str, Any]:
         """Get publishing statistics.
@@ -272,7 +601,21 @@ class MessagePublisher:
         Returns:
             Dictionary with publishing statistics
         """
-        stats = self._publish_stats.copy()
+        with self._counters_lock:
+            self._retire_exited_threads()
+            thread_counters = [self._retired_counters, *self._thread_counters.values()]
+        
+        last_ns = max((counters.last_ns for counters in thread_counters), default=0)
+        last_publish_time = None
+        if last_ns:
+            anchor_time, anchor_ns = self._clock_anchor
+            last_publish_time = anchor_time + timedelta(microseconds=(last_ns - anchor_ns) // 1000)
+        
+        stats = {
+            'total_published': sum(counters.published for counters in thread_counters),
+            'failed_publishes': sum(counters.failed for counters in thread_counters),
+            'last_publish_time': last_publish_time
+        }
         
         # Calculate success rate
         total = stats['total_published'] + stats['failed_publishes']
@@ -285,8 +628,121 @@ class MessagePublisher:
     
     def reset_stats(self) -> None:
         """Reset publishing statistics."""
-        self._publish_stats = {
-            'total_published': 0,
-            'failed_publishes': 0,
-            'last_publish_time': None
-        }
\ No newline at end of file
+        with self._counters_lock:
+            for counters in (self._retired_counters, *self._thread_counters.values()):
+                counters.published = 0
+                counters.failed = 0
+                counters.last_ns = 0
+
+
+class MessageBatcher:
+    """Accumulates messages and publishes them with MessagePublisher.publish_batch.
+    
+    Messages are grouped by routing key and priority. A group is flushed as
+    soon as it reaches ``max_size`` messages or ``max_bytes`` of serialized
+    data; everything still queued is flushed ``max_latency_ms`` after the first
+    message was added. Order is kept within a group, not across groups.
+    
+    The latency flush runs on a daemon timer thread, so it does not depend on
+    anyone servicing the connection; the publisher hands the channel work to
+    the connection's I/O thread (see MessageQueueConnection.run_on_io_thread).
+    Call close() on shutdown so nothing queued is lost.
+    """
+    
+    def __init__(self, publisher: MessagePublisher, config: Optional[BatchConfig] = None):
+        """Initialize batcher.
+        
+        Args:
+            publisher: Publisher used to flush batches
+            config: Flush thresholds; defaults to BatchConfig()
+        """
+        self.publisher = publisher
+        self.config = config or BatchConfig()
+        self._buckets: Dict[Tuple[str, int], Deque[bytes]] = {}
+        self._bucket_bytes: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+    
+    def add(self, message: Any, message_type: MessageType, routing_key: str, priority: int = 0) -> bool:
+        """Queue a message for publishing.
+        
+        Args:
+            message: Message object to publish
+            message_type: Type of the message
+            routing_key: Routing key for message delivery
+            priority: Message priority (0-255)
+            
+        Returns:
+            True if the message was queued, False if it could not be serialized
+            or the batcher is closed
+        """
+        try:
+            serialized_data = MessageSerializer.serialize(
+                message, message_type, self.publisher._wire_format
+            )
+        except Exception as e:
+            logger.error(f"Failed to serialize message for batch: {e}")
+            return False
+        
+        key = (routing_key, priority)
+        with self._lock:
+            if self._closed:
+                return False
+            
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = deque()
+                self._bucket_bytes[key] = 0
+            bucket.append(serialized_data)
+            self._bucket_bytes[key] += len(serialized_data)
+            
+            full = (
+                len(bucket) >= self.config.max_size
+                or self._bucket_bytes[key] >= self.config.max_bytes
+            )
+            if full:
+                bodies = self._take(key)
+            else:
+                bodies = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.config.max_latency_ms / 1000, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        
+        if bodies:
+            self._publish(key, bodies)
+        return True
+    
+    def flush(self) -> None:
+        """Publish every queued message now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            batches = [(key, self._take(key)) for key in list(self._buckets)]
+        
+        for key, bodies in batches:
+            if bodies:
+                self._publish(key, bodies)
+    
+    def close(self) -> None:
+        """Stop accepting messages and publish whatever is still queued."""
+        with self._lock:
+            self._closed = True
+        self.flush()
+    
+    def _take(self, key: Tuple[str, int]) -> List[bytes]:
+        """Remove and return the queued bodies for ``key``; caller holds the lock."""
+        bodies = list(self._buckets.pop(key, ()))
+        self._bucket_bytes.pop(key, None)
+        return bodies
+    
+    def _publish(self, key: Tuple[str, int], bodies: List[bytes]) -> None:
+        """Publish one group of queued messages."""
+        routing_key, priority = key
+        success = sum(self.publisher._publish_serialized(
+            bodies, routing_key, priority, timeout=30.0
+        ))
+        if success < len(bodies):
+            logger.error(f"{len(bodies) - success} of {len(bodies)} batched messages to {routing_key} were not confirmed")
@@ -3,15 +3,72 @@
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, Type, TypeVar
-from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, get_type_hints
+from dataclasses import asdict, fields, is_dataclass
 from enum import Enum
 
 from ..models.common import BugReport, CategorizedBug, Assignment, AssignmentFeedback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 logger = logging.getLogger(__name__)
 
+# Keys every message envelope must carry
+_ENVELOPE_KEYS = frozenset(('type', 'timestamp', 'data'))
+
+# First byte of a MessagePack body. JSON envelopes always start with '{', so
+# consumers can read both formats while producers switch over
+_MSGPACK_PREFIX = b'\x01'
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON message body, straight from bytes when orjson is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any, default: Callable[[Any], Any]) -> bytes:
+    """Encode a message body as UTF-8 JSON, with orjson when it is available.
+    
+    orjson encodes datetimes, enums and dataclasses natively, in the same form
+    ``default`` would produce, so ``default`` only sees other types. Offsets
+    are kept as "+00:00" rather than OPT_UTC_Z's "Z", which
+    datetime.fromisoformat only accepts from Python 3.11.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=default).encode('utf-8')
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as written by datetime.isoformat().
+    
+    A trailing "Z", which datetime.fromisoformat only accepts from Python 3.11,
+    is read as "+00:00". Other formats are rejected with ValueError.
+    """
+    if value[-1:] == 'Z':
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _load_envelope(data: bytes) -> Any:
+    """Parse a message body in either wire format."""
+    if data[:1] == _MSGPACK_PREFIX:
+        if msgspec is None:
+            raise ValueError("Message is MessagePack encoded but msgspec is not installed")
+        return _MSGPACK_DECODER.decode(memoryview(data)[1:])
+    return _json_loads(data)
+
 T = TypeVar('T')
 
 
@@ -26,16 +83,26 @@ class MessageType(Enum):
     SYSTEM_EVENT = "system_event"
 
 
+# Envelope openings MessageSerializer writes, with orjson's and json's separator;
+# 'type' is always the first key
+_TYPE_KEY_PREFIXES = (b'{"type":"', b'{"type": "')
+# Encoded type value -> MessageType, for extract_message_type's byte scan
+_TYPE_BY_BYTES = {message_type.value.encode(): message_type for message_type in MessageType}
+_TYPE_MAX_LEN = max(map(len, _TYPE_BY_BYTES))
+
+
 class MessageSerializer:
     """Handles serialization of messages for queue transmission."""
     
     @staticmethod
-    def serialize(message: Any, message_type: MessageType) -> bytes:
+    def serialize(message: Any, message_type: MessageType, wire_format: str = "json") -> bytes:
         """Serialize a message object to bytes.
         
         Args:
             message: The message object to serialize
             message_type: Type of the message
+            wire_format: "json", or "msgpack" for a prefixed MessagePack body;
+                falls back to JSON when msgspec is not installed
             
         Returns:
             Serialized message as bytes
@@ -45,32 +112,40 @@ class MessageSerializer:
         """
         try:
             # Create message envelope
+            # 'type' goes first so extract_message_type finds it at the start
             envelope = {
                 'type': message_type.value,
-                'timestamp': datetime.utcnow().isoformat(),
+                # Always with microseconds, so every envelope's timestamp has one shape
+                'timestamp': datetime.utcnow().isoformat(timespec='microseconds'),
                 'data': MessageSerializer._serialize_data(message)
             }
             
-            # Convert to JSON and encode
-            json_str = json.dumps(envelope, default=MessageSerializer._json_serializer)
-            return json_str.encode('utf-8')
+            if wire_format == "msgpack" and msgspec is not None:
+                return _MSGPACK_PREFIX + _MSGPACK_ENCODER.encode(envelope)
+            
+            # Convert to JSON bytes
+            return _json_dumps(envelope, MessageSerializer._json_serializer)
             
         except Exception as e:
             logger.error(f"Failed to serialize message of type {message_type}: {e}")
             raise ValueError(f"Serialization failed: {e}")
     
     @staticmethod
-    def _serialize_data(obj: Any) -> Dict[str, Any]:
-        """Convert object to serializable dictionary.
+    def _serialize_data(obj: Any) -> Any:
+        """Convert object to a serializable dictionary.
+        
+        Dataclass instances are returned as they are when orjson is available:
+        it encodes them (and nested dataclasses) straight to a JSON object,
+        without the deep copy asdict makes first.
         
         Args:
             obj: Object to serialize
             
         Returns:
-            Dictionary representation of object
+            Dictionary representation of object, or the dataclass itself
         """
         if is_dataclass(obj):
-            return asdict(obj)
+            return obj if orjson is not None else asdict(obj)
         elif hasattr(obj, '__dict__'):
             return obj.__dict__
         elif isinstance(obj, dict):
@@ -99,10 +174,21 @@ class MessageSerializer:
             return str(obj)
 
 
+# Built once: msgspec encoders and decoders are meant to be reused. Like orjson,
+# msgspec encodes datetimes, enums and dataclasses itself; naive datetimes
+# become the same ISO strings JSON carries
+if msgspec is not None:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=MessageSerializer._json_serializer)
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+else:
+    _MSGPACK_ENCODER = _MSGPACK_DECODER = None
+
+
 class MessageDeserializer:
     """Handles deserialization of messages from queue transmission."""
     
-    # Mapping of message types to their corresponding classes
+    # Mapping of message types to their corresponding classes; the per-type
+    # loaders below are built from it at import
     TYPE_MAPPING = {
         MessageType.BUG_REPORT: BugReport,
         MessageType.CATEGORIZED_BUG: CategorizedBug,
@@ -125,12 +211,11 @@ class MessageDeserializer:
             ValueError: If deserialization fails or type mismatch
         """
         try:
-            # Decode and parse JSON
-            json_str = data.decode('utf-8')
-            envelope = json.loads(json_str)
+            # Decode and parse JSON (or MessagePack)
+            envelope = _load_envelope(data)
             
             # Validate envelope structure
-            if not all(key in envelope for key in ['type', 'timestamp', 'data']):
+            if not (isinstance(envelope, dict) and envelope.keys() >= _ENVELOPE_KEYS):
                 raise ValueError("Invalid message envelope structure")
             
             # Parse message type
@@ -145,7 +230,7 @@ class MessageDeserializer:
             
             # Parse timestamp
             try:
-                timestamp = datetime.fromisoformat(envelope['timestamp'])
+                timestamp = _parse_timestamp(envelope['timestamp'])
             except ValueError:
                 logger.warning("Invalid timestamp format, using current time")
                 timestamp = datetime.utcnow()
@@ -181,69 +266,43 @@ class MessageDeserializer:
         Returns:
             Deserialized object
         """
-        # Get target class for this message type
-        target_class = MessageDeserializer.TYPE_MAPPING.get(message_type)
+        loader = _LOADERS.get(message_type)
+        if loader is None:
+            # For unknown types, return as dictionary
+            return data
         
-        if target_class:
-            try:
-                # Handle datetime fields
-                data = MessageDeserializer._convert_datetime_fields(data)
-                
-                # Create instance of target class
-                if is_dataclass(target_class):
-                    return target_class(**data)
-                else:
-                    # For non-dataclass types, try to create instance
-                    return target_class(**data)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to create {target_class.__name__} instance: {e}")
-                # Fall back to dictionary
-                return data
-        
-        # For unknown types or fallback, return as dictionary
-        return data
-    
-    @staticmethod
-    def _convert_datetime_fields(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert ISO datetime strings back to datetime objects.
-        
-        Args:
-            data: Dictionary potentially containing datetime strings
-            
-        Returns:
-            Dictionary with datetime objects
-        """
-        converted = data.copy()
-        
-        # Common datetime field names
-        datetime_fields = [
-            'created_at', 'updated_at', 'assigned_at', 'timestamp',
-            'last_updated', 'last_activity', 'resolved_at'
-        ]
-        
-        for field in datetime_fields:
-            if field in converted and isinstance(converted[field], str):
-                try:
-                    converted[field] = datetime.fromisoformat(converted[field])
-                except ValueError:
-                    logger.warning(f"Could not parse datetime field {field}: {converted[field]}")
-        
-        return converted
+        try:
+            return loader(data)
+        except Exception as e:
+            target_class = MessageDeserializer.TYPE_MAPPING[message_type]
+            logger.warning(f"Failed to create {target_class.__name__} instance: {e}")
+            # Fall back to dictionary
+            return data
     
     @staticmethod
     def extract_message_type(data: bytes) -> Optional[MessageType]:
         """Extract message type without full deserialization.
         
+        JSON envelopes that open with the 'type' key, as MessageSerializer
+        writes them, are read with a byte scan; anything else is parsed.
+        
         Args:
             data: Serialized message bytes
             
         Returns:
             Message type if extractable, None otherwise
         """
+        for prefix in _TYPE_KEY_PREFIXES:
+            if data.startswith(prefix):
+                start = len(prefix)
+                end = data.find(b'"', start, start + _TYPE_MAX_LEN + 1)
+                message_type = _TYPE_BY_BYTES.get(data[start:end]) if end > 0 else None
+                if message_type is not None:
+                    return message_type
+                break
+        
         try:
-            json_str = data.decode('utf-8')
-            envelope = json.loads(json_str)
+            envelope = _load_envelope(data)
             
             if 'type' in envelope:
                 return MessageType(envelope['type'])
@@ -254,6 +313,52 @@ class MessageDeserializer:
         return None
 
 
+def _datetime_fields(cls: type) -> Tuple[str, ...]:
+    """Names of the fields of a dataclass typed datetime or Optional[datetime]."""
+    if not is_dataclass(cls):
+        return ()
+    hints = get_type_hints(cls)
+    return tuple(
+        f.name for f in fields(cls)
+        if hints.get(f.name) is datetime or datetime in getattr(hints.get(f.name), '__args__', ())
+    )
+
+
+def _make_loader(target_class: type) -> Callable[[Dict[str, Any]], Any]:
+    """Build the function that turns a decoded data dict into ``target_class``.
+    
+    The class's datetime fields are resolved here, once; the returned loader
+    converts their ISO strings in place (the dict was decoded for this message
+    alone) and calls the class.
+    """
+    datetime_fields = _datetime_fields(target_class)
+    
+    def load(data: Dict[str, Any]) -> Any:
+        for field in datetime_fields:
+            value = data.get(field)
+            if type(value) is str:
+                try:
+                    data[field] = _parse_timestamp(value)
+                except ValueError:
+                    logger.warning(f"Could not parse datetime field {field}: {value}")
+        return target_class(**data)
+    
+    return load
+
+
+# Loader per mapped message type and the dataclass types validate_message_data
+# checks against, both built from TYPE_MAPPING at import
+_LOADERS: Dict[MessageType, Callable[[Dict[str, Any]], Any]] = {
+    message_type: _make_loader(cls)
+    for message_type, cls in MessageDeserializer.TYPE_MAPPING.items()
+}
+_DATACLASS_TYPES: Dict[MessageType, type] = {
+    message_type: cls
+    for message_type, cls in MessageDeserializer.TYPE_MAPPING.items()
+    if is_dataclass(cls)
+}
+
+
 class MessageValidator:
     """Validates message content and structure."""
     
@@ -267,10 +372,8 @@ class MessageValidator:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ['type', 'timestamp', 'data']
-        
         # Check required fields
-        if not all(field in envelope for field in required_fields):
+        if not (isinstance(envelope, dict) and envelope.keys() >= _ENVELOPE_KEYS):
             return False
         
         # Validate message type
@@ -281,7 +384,7 @@ class MessageValidator:
         
         # Validate timestamp format
         try:
-            datetime.fromisoformat(envelope['timestamp'])
+            _parse_timestamp(envelope['timestamp'])
         except ValueError:
             return False
         
@@ -303,13 +406,12 @@ class MessageValidator:
             True if valid, False otherwise
         """
         try:
-            target_class = MessageDeserializer.TYPE_MAPPING.get(message_type)
+            target_class = _DATACLASS_TYPES.get(message_type)
             
-            if target_class and is_dataclass(target_class):
+            if target_class is not None and isinstance(data, dict):
                 # Try to create instance to validate
-                if isinstance(data, dict):
-                    target_class(**data)
-                    return True
+                target_class(**data)
+                return True
             
             # For other types, basic validation
             return data is not None
@@ -4,6 +4,7 @@ Classifies bugs into categories like Frontend, Backend, Database, etc.
 """
 
 import pickle
+import re
 import numpy as np
 from typing import Dict, List, Tuple, Any
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -149,7 +150,6 @@ class BugCategoryClassifier:
             score = 0
             for keyword in keywords:
                 # Count occurrences with word boundaries
-                import re
                 matches = len(re.findall(rf'\b{re.escape(keyword)}\b', text_lower))
                 score += matches
             
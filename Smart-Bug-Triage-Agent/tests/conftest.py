@@ -0,0 +1,217 @@
+"""Shared fixtures: an in-process stand-in for pika's BlockingConnection.
+
+The fake keeps the one property of pika's blocking adapter the message queue
+code is built around: only the thread running the I/O loop may touch the
+connection. Callbacks posted with add_callback_threadsafe() or call_later()
+run inside process_data_events(), and any use of the connection or a channel
+from another thread while a consumer drives the loop is recorded in
+``FakeConnection.violations``.
+"""
+
+import itertools
+import queue
+import threading
+from types import SimpleNamespace
+
+import pika
+import pytest
+from pika import spec
+
+from smart_bug_triage.config.settings import MessageQueueConfig
+from smart_bug_triage.message_queue import connection as connection_module
+from smart_bug_triage.message_queue.connection import MessageQueueConnection
+
+
+class FakeChannel:
+    """Records the frames sent on it; deliveries are injected with deliver()."""
+
+    def __init__(self, connection: 'FakeConnection'):
+        self.connection = connection
+        self.is_open = True
+        self._impl = self  # pipelined calls go to the same object
+        self.prefetch_count = None
+        self.consumers = {}
+        self.ready = []
+        self.acks = []
+        self.nacks = []
+        self.published = []
+        self._tags = itertools.count(1)
+        self._confirm_callback = None
+        self._publish_seq = 0
+
+    def _touch(self, what: str) -> None:
+        self.connection._touch(what)
+
+    def basic_qos(self, prefetch_count=0, **kwargs):
+        self._touch('basic_qos')
+        self.prefetch_count = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback, auto_ack=False):
+        self._touch('basic_consume')
+        self.consumers['ctag'] = on_message_callback
+        return 'ctag'
+
+    def basic_cancel(self, consumer_tag):
+        self.consumers.pop(consumer_tag, None)
+
+    def start_consuming(self):
+        connection = self.connection
+        connection._driver = threading.current_thread()
+        try:
+            while self.consumers and self.is_open:
+                connection.process_data_events(time_limit=None)
+        finally:
+            connection._driver = None
+
+    def stop_consuming(self):
+        self._touch('stop_consuming')
+        self.consumers.clear()
+
+    def consume(self, queue, auto_ack=False, inactivity_timeout=None):
+        self._touch('consume')
+        while True:
+            yield self.ready.pop(0) if self.ready else (None, None, None)
+
+    def cancel(self):
+        pass
+
+    def basic_get(self, queue, auto_ack=False):
+        self._touch('basic_get')
+        return self.ready.pop(0) if self.ready else (None, None, None)
+
+    def deliver(self, body: bytes) -> None:
+        """Queue a delivery to this channel's consumer, from any thread."""
+        def dispatch():
+            tag = next(self._tags)
+            self.consumers['ctag'](self, SimpleNamespace(delivery_tag=tag, redelivered=False), None, body)
+        self.connection.add_callback_threadsafe(dispatch)
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self._touch('basic_ack')
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, requeue=True, multiple=False):
+        self._touch('basic_nack')
+        self.nacks.append((delivery_tag, requeue, multiple))
+
+    def confirm_delivery(self, ack_nack_callback=None, callback=None):
+        self._confirm_callback = ack_nack_callback
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        self._touch('basic_publish')
+        self.published.append((exchange, routing_key, body))
+        if self._confirm_callback is not None:
+            self._publish_seq += 1
+            self.connection.confirm_plan(self, self._publish_seq)
+
+    def confirm(self, seq: int, ack: bool = True) -> None:
+        """Queue the broker's confirm for publish ``seq``."""
+        method = spec.Basic.Ack(seq, False) if ack else spec.Basic.Nack(seq, False)
+        callback = self._confirm_callback
+        self.connection.add_callback_threadsafe(lambda: callback(SimpleNamespace(method=method)))
+
+    def exchange_declare(self, **kwargs):
+        self._touch('exchange_declare')
+
+    def queue_declare(self, queue, callback=None, **kwargs):
+        self._touch('queue_declare')
+        result = SimpleNamespace(method=SimpleNamespace(message_count=0, consumer_count=0))
+        if callback is None:
+            return result
+        self.connection.add_callback_threadsafe(lambda: callback(result))
+
+    def queue_bind(self, **kwargs):
+        self._touch('queue_bind')
+
+    def queue_purge(self, queue):
+        self._touch('queue_purge')
+        return SimpleNamespace(method=SimpleNamespace(message_count=0))
+
+    def close(self):
+        self.is_open = False
+
+
+class FakeConnection:
+    """Single-threaded event loop standing in for pika.BlockingConnection."""
+
+    def __init__(self, parameters=None):
+        self.is_closed = False
+        self.channels = []
+        self.violations = []
+        self._callbacks = queue.Queue()
+        self._driver = None
+        # Confirm every publish by default
+        self.confirm_plan = lambda channel, seq: channel.confirm(seq)
+
+    def _touch(self, what: str) -> None:
+        driver = self._driver
+        if driver is not None and driver is not threading.current_thread():
+            self.violations.append((what, threading.current_thread().name))
+
+    def channel(self):
+        self._touch('channel')
+        channel = FakeChannel(self)
+        self.channels.append(channel)
+        return channel
+
+    def add_callback_threadsafe(self, callback):
+        self._callbacks.put(callback)
+
+    def process_data_events(self, time_limit=0):
+        """Run posted callbacks, waiting up to ``time_limit`` for the first one."""
+        self._touch('process_data_events')
+        outer = self._driver
+        self._driver = threading.current_thread()
+        try:
+            try:
+                callback = self._callbacks.get(timeout=time_limit)
+            except queue.Empty:
+                return
+            while True:
+                callback()
+                try:
+                    callback = self._callbacks.get_nowait()
+                except queue.Empty:
+                    return
+        finally:
+            self._driver = outer
+
+    def call_later(self, delay, callback):
+        timer = threading.Timer(delay, self._callbacks.put, args=(callback,))
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def remove_timeout(self, timer):
+        timer.cancel()
+
+    def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def fake_pika(monkeypatch):
+    """Make MessageQueueConnection.connect() open FakeConnection instances.
+
+    Yields the list of FakeConnections opened, in order.
+    """
+    opened = []
+
+    def blocking_connection(parameters):
+        connection = FakeConnection(parameters)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(pika, 'BlockingConnection', blocking_connection)
+    # Every test declares its topology against its own fake broker
+    monkeypatch.setattr(connection_module, '_DECLARED_TOPOLOGIES', set())
+    yield opened
+
+
+@pytest.fixture
+def mq_connection(fake_pika):
+    """A connected MessageQueueConnection backed by a FakeConnection."""
+    connection = MessageQueueConnection(MessageQueueConfig())
+    assert connection.connect()
+    yield connection
+    connection.disconnect()
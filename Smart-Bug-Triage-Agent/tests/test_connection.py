@@ -0,0 +1,108 @@
+"""Tests for MessageQueueConnection's I/O thread handoff."""
+
+import threading
+
+import pytest
+
+from smart_bug_triage.message_queue.connection import ConnectionBusyError
+
+
+def _drive_in_thread(mq_connection):
+    """Drive the connection's I/O loop on a new thread, as a consumer would.
+
+    Returns:
+        (thread, stop event); set the event to make the thread return
+    """
+    started = threading.Event()
+    stop = threading.Event()
+
+    def drive():
+        with mq_connection.driving_io():
+            started.set()
+            while not stop.is_set():
+                mq_connection.process_data_events(time_limit=0.01)
+
+    thread = threading.Thread(target=drive, name='io-driver', daemon=True)
+    thread.start()
+    assert started.wait(2)
+    return thread, stop
+
+
+def test_run_on_io_thread_runs_inline_when_nobody_drives(mq_connection):
+    assert mq_connection.io_thread() is None
+    assert mq_connection.run_on_io_thread(threading.current_thread) is threading.current_thread()
+
+
+def test_run_on_io_thread_hands_work_to_the_driving_thread(mq_connection, fake_pika):
+    thread, stop = _drive_in_thread(mq_connection)
+    try:
+        assert mq_connection.io_thread() is thread
+        assert mq_connection.run_on_io_thread(threading.current_thread) is thread
+        # Channel work from several threads at once is serialized onto the driver
+        results = []
+        workers = [
+            threading.Thread(
+                target=lambda: results.append(mq_connection.run_on_io_thread(mq_connection.open_channel))
+            )
+            for _ in range(8)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(5)
+        assert len(results) == 8
+    finally:
+        stop.set()
+        thread.join(2)
+    assert fake_pika[0].violations == []
+
+
+def test_run_on_io_thread_propagates_exceptions(mq_connection):
+    thread, stop = _drive_in_thread(mq_connection)
+
+    def fail():
+        raise ValueError('boom')
+
+    try:
+        with pytest.raises(ValueError, match='boom'):
+            mq_connection.run_on_io_thread(fail)
+    finally:
+        stop.set()
+        thread.join(2)
+
+
+def test_run_on_io_thread_runs_inline_once_the_driver_stops(mq_connection):
+    thread, stop = _drive_in_thread(mq_connection)
+    stop.set()
+    thread.join(2)
+    assert mq_connection.io_thread() is None
+    assert mq_connection.run_on_io_thread(threading.current_thread) is threading.current_thread()
+
+
+def test_run_on_io_thread_retries_work_the_stopping_driver_never_ran(mq_connection):
+    # The driver leaves the loop without servicing the posted callback, which
+    # must then run on the calling thread instead of hanging
+    release = threading.Event()
+
+    def drive():
+        with mq_connection.driving_io():
+            release.wait(2)
+
+    thread = threading.Thread(target=drive, daemon=True)
+    thread.start()
+    while mq_connection.io_thread() is None:
+        pass
+    threading.Timer(0.05, release.set).start()
+    assert mq_connection.run_on_io_thread(threading.current_thread) is threading.current_thread()
+    thread.join(2)
+
+
+def test_driving_io_refuses_a_second_thread(mq_connection):
+    thread, stop = _drive_in_thread(mq_connection)
+    try:
+        with pytest.raises(ConnectionBusyError):
+            with mq_connection.driving_io():
+                pass
+    finally:
+        stop.set()
+        thread.join(2)
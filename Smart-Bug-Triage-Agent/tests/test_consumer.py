@@ -0,0 +1,253 @@
+"""Tests for MessageConsumer: connection ownership, stopping and ack coalescing."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from smart_bug_triage.config.settings import MessageQueueConfig
+from smart_bug_triage.message_queue import MessageConsumer
+from smart_bug_triage.message_queue.consumer import MessageHandler
+from smart_bug_triage.message_queue.serialization import MessageSerializer, MessageType
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll ``predicate`` until it is true or ``timeout`` seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class RecordingHandler(MessageHandler):
+    """Handles SYSTEM_EVENT messages, optionally blocking on ``gate`` first."""
+
+    def __init__(self, gate=None, on_message=None):
+        self.gate = gate
+        self.on_message = on_message
+        self.handled = []
+
+    def handle_message(self, message_data, message_type, delivery_tag):
+        if self.on_message is not None:
+            self.on_message(delivery_tag)
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.handled.append(message_data['i'])
+        return message_data.get('ok', True)
+
+    def get_supported_message_types(self):
+        return [MessageType.SYSTEM_EVENT]
+
+
+def deliver(consumer, count, **data):
+    """Deliver ``count`` SYSTEM_EVENT messages to a running consumer's channel."""
+    assert wait_for(lambda: consumer._channel is not None and consumer._channel.consumers)
+    for i in range(count):
+        consumer._channel.deliver(
+            MessageSerializer.serialize(dict(data, i=i), MessageType.SYSTEM_EVENT)
+        )
+
+
+def settled(frames, delivered):
+    """Expand ack/nack frames into the set of delivery tags they settle."""
+    done = set()
+    for frame in frames:
+        tag, multiple = frame[0], frame[-1]
+        covered = {t for t in delivered if t <= tag and t not in done} if multiple else {tag}
+        assert covered, f"frame {frame} settles nothing"
+        done |= covered
+    return done
+
+
+def test_consumers_built_from_a_config_get_their_own_connections(fake_pika):
+    config = MessageQueueConfig()
+    first = MessageConsumer(config, 'q1')
+    second = MessageConsumer(config, 'q2')
+    assert first.connection is not second.connection
+
+    try:
+        assert first.start_consuming()
+        assert second.start_consuming()
+        assert wait_for(lambda: first.connection.io_thread() and second.connection.io_thread())
+        assert first.is_consuming() and second.is_consuming()
+    finally:
+        assert first.stop_consuming(timeout=2)
+        assert second.stop_consuming(timeout=2)
+
+    # Each consumer closes the connection it opened
+    assert not first.connection.is_connected()
+    assert not second.connection.is_connected()
+
+
+def test_second_consumer_on_a_driven_connection_fails_fast(mq_connection):
+    first = MessageConsumer(mq_connection, 'q1')
+    second = MessageConsumer(mq_connection, 'q2')
+    assert first.start_consuming()
+    try:
+        assert wait_for(lambda: mq_connection.io_thread() is not None)
+        started = time.monotonic()
+        assert second.start_consuming() is False
+        assert time.monotonic() - started < 1
+        assert not second.is_consuming()
+        assert first.is_consuming()
+    finally:
+        first.stop_consuming(timeout=2)
+    # A consumer handed a connection leaves it open for its owner
+    assert mq_connection.is_connected()
+
+
+def test_consume_loop_losing_the_connection_race_returns(mq_connection):
+    first = MessageConsumer(mq_connection, 'q1')
+    second = MessageConsumer(mq_connection, 'q2')
+    assert first.start_consuming()
+    try:
+        assert wait_for(lambda: mq_connection.io_thread() is not None)
+        # As if second had passed its pre-check just before first took the loop
+        second._executor = first._executor.__class__(1)
+        second._is_consuming = True
+        assert second._consume_loop(1, False) is False
+        assert not second.is_consuming()
+    finally:
+        first.stop_consuming(timeout=2)
+
+
+def test_stop_from_the_io_thread_in_blocking_mode(mq_connection, fake_pika):
+    gate = threading.Event()
+    consumer = MessageConsumer(mq_connection, 'q')
+    handler = RecordingHandler(gate)
+    consumer.register_handler(handler)
+    stop_result = []
+
+    def signal_stop():
+        # What a signal handler running on the consuming thread does
+        deliver(consumer, 4)
+        assert wait_for(lambda: consumer._outstanding == 4)
+        mq_connection.add_callback_threadsafe(
+            lambda: stop_result.append(consumer.stop_consuming(timeout=3))
+        )
+        time.sleep(0.05)
+        gate.set()
+
+    threading.Thread(target=signal_stop, daemon=True).start()
+    assert consumer.start_consuming(prefetch_count=4, blocking=True) is True
+
+    assert stop_result == [True]
+    assert sorted(handler.handled) == [0, 1, 2, 3]
+    # The loop drained the running handlers and settled them before returning
+    assert settled(consumer._channel.acks, range(1, 5)) == {1, 2, 3, 4}
+    assert not consumer.is_consuming()
+    assert fake_pika[0].violations == []
+
+
+def test_stop_from_a_handler_does_not_deadlock(mq_connection, fake_pika):
+    consumer = MessageConsumer(mq_connection, 'q')
+    stop_result = []
+
+    def stop_on_first(delivery_tag):
+        if delivery_tag == 1:
+            stop_result.append(consumer.stop_consuming(timeout=3))
+
+    handler = RecordingHandler(on_message=stop_on_first)
+    consumer.register_handler(handler)
+    assert consumer.start_consuming(prefetch_count=4)
+    deliver(consumer, 1)
+
+    consumer._consumer_thread.join(3)
+    assert not consumer._consumer_thread.is_alive()
+    assert stop_result == [True]
+    assert handler.handled == [0]
+    assert settled(consumer._channel.acks, [1]) == {1}
+    assert not consumer.is_consuming()
+    assert fake_pika[0].violations == []
+
+
+def test_stop_honours_its_timeout(mq_connection):
+    gate = threading.Event()
+    consumer = MessageConsumer(mq_connection, 'q')
+    consumer.register_handler(RecordingHandler(gate))
+    assert consumer.start_consuming(prefetch_count=2)
+    try:
+        deliver(consumer, 2)
+        assert wait_for(lambda: consumer._outstanding == 2)
+        started = time.monotonic()
+        consumer.stop_consuming(timeout=0.3)
+        assert time.monotonic() - started < 1
+        # The loop gave up on the stuck handlers and left their deliveries
+        # unsettled, for the broker to redeliver
+        assert wait_for(lambda: not consumer._consumer_thread.is_alive(), 0.5)
+        assert consumer._channel.acks == [] and consumer._channel.nacks == []
+        assert not consumer.is_consuming()
+    finally:
+        gate.set()
+
+
+def test_settle_coalesces_below_the_lowest_unsettled_tag():
+    frames = []
+
+    def method(delivery_tag, multiple=False):
+        frames.append((delivery_tag, multiple))
+
+    MessageConsumer._settle(method, [5, 1, 3, 2], {4})
+    assert frames == [(3, True), (5, False)]
+
+    frames.clear()
+    MessageConsumer._settle(method, [2, 1, 3], set())
+    assert frames == [(3, True)]
+
+    frames.clear()
+    MessageConsumer._settle(method, [2, 3], {1})
+    assert frames == [(2, False), (3, False)]
+
+
+def test_acks_are_coalesced_and_failures_settled_separately(mq_connection, fake_pika):
+    gate = threading.Event()
+    consumer = MessageConsumer(mq_connection, 'q')
+    consumer.register_handler(RecordingHandler(gate))
+    assert consumer.start_consuming(prefetch_count=8)
+    try:
+        deliver(consumer, 6)
+        # Tag 7 goes to no handler (nack to the DLQ); tag 8's handler fails (requeue)
+        consumer._channel.deliver(MessageSerializer.serialize({'i': 6}, MessageType.NOTIFICATION))
+        consumer._channel.deliver(MessageSerializer.serialize({'i': 7, 'ok': False}, MessageType.SYSTEM_EVENT))
+        assert wait_for(lambda: consumer._counters.total == 8)
+        gate.set()
+        assert wait_for(lambda: consumer._outstanding == 0)
+    finally:
+        assert consumer.stop_consuming(timeout=2)
+
+    channel = consumer._channel
+    dead_lettered = [frame for frame in channel.nacks if not frame[1]]
+    requeued = [frame for frame in channel.nacks if frame[1]]
+    assert settled(channel.acks, range(1, 7)) == {1, 2, 3, 4, 5, 6}
+    assert len(channel.acks) < 6
+    assert dead_lettered in ([(7, False, True)], [(7, False, False)])
+    assert requeued == [(8, True, False)]
+    assert fake_pika[0].violations == []
+
+
+@pytest.mark.parametrize('driven', [False, True])
+def test_consume_single_message_takes_one_message(mq_connection, fake_pika, driven):
+    consumer = MessageConsumer(mq_connection, 'q')
+    body = MessageSerializer.serialize({'i': 1}, MessageType.SYSTEM_EVENT)
+    other = None
+    if driven:
+        other = MessageConsumer(mq_connection, 'other')
+        assert other.start_consuming()
+        assert wait_for(lambda: mq_connection.io_thread() is not None)
+    try:
+        channel = mq_connection.run_on_io_thread(mq_connection.open_channel)
+        channel.ready.append((SimpleNamespace(delivery_tag=1, redelivered=False), None, body))
+        consumer._channel = channel
+        message = consumer.consume_single_message(timeout=0.1)
+    finally:
+        if other is not None:
+            other.stop_consuming(timeout=2)
+
+    assert message['data'] == {'i': 1}
+    if not driven:
+        # The consume() generator must not prefetch more than the one message
+        assert channel.prefetch_count == 1
+    assert fake_pika[0].violations == []
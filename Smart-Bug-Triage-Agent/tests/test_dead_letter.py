@@ -0,0 +1,99 @@
+"""Tests for DeadLetterHandler's batched retry publishing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from smart_bug_triage.message_queue import dead_letter
+from smart_bug_triage.message_queue.dead_letter import DeadLetterHandler
+
+
+class RecordingPublisher:
+    """Stands in for MessagePublisher; nacks the bodies listed in ``nack``."""
+
+    def __init__(self, nack=()):
+        self.nack = set(nack)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def publish_raw_batch(self, bodies, routing_key, priority=0, exchange=None, timeout=30.0):
+        with self.lock:
+            self.calls.append((exchange, routing_key, list(bodies)))
+        confirmed = [body not in self.nack for body in bodies]
+        return {
+            'success': sum(confirmed),
+            'failed': len(bodies) - sum(confirmed),
+            'confirmed': confirmed
+        }
+
+
+def make_handler(mq_connection, publisher, batch_size):
+    handler = DeadLetterHandler(mq_connection, publisher)
+    handler._retry_buffer_size = batch_size
+    return handler
+
+
+def test_concurrent_retries_share_one_publish(mq_connection, monkeypatch):
+    # A long linger: the batch must go out because it filled up, not on time
+    monkeypatch.setattr(dead_letter, 'RETRY_BATCH_LINGER_SECONDS', 5.0)
+    publisher = RecordingPublisher(nack={b'3'})
+    handler = make_handler(mq_connection, publisher, batch_size=6)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(6) as pool:
+        results = list(pool.map(
+            lambda i: handler._retry_messages_bulk('retry.5m', 'rk', str(i).encode()),
+            range(6)
+        ))
+
+    assert time.monotonic() - started < 2
+    assert len(publisher.calls) == 1
+    exchange, routing_key, bodies = publisher.calls[0]
+    assert (exchange, routing_key) == ('retry.5m', 'rk')
+    assert sorted(bodies) == [str(i).encode() for i in range(6)]
+    # Each caller gets its own message's confirm
+    assert results == [i != 3 for i in range(6)]
+
+
+def test_lone_retry_is_published_after_the_linger(mq_connection, monkeypatch):
+    monkeypatch.setattr(dead_letter, 'RETRY_BATCH_LINGER_SECONDS', 0.05)
+    publisher = RecordingPublisher()
+    handler = make_handler(mq_connection, publisher, batch_size=10)
+
+    started = time.monotonic()
+    assert handler._retry_messages_bulk('retry.5m', 'rk', b'only') is True
+    assert 0.04 <= time.monotonic() - started < 1
+    assert publisher.calls == [('retry.5m', 'rk', [b'only'])]
+
+
+def test_retries_are_grouped_by_exchange_and_routing_key(mq_connection, monkeypatch):
+    monkeypatch.setattr(dead_letter, 'RETRY_BATCH_LINGER_SECONDS', 5.0)
+    publisher = RecordingPublisher()
+    handler = make_handler(mq_connection, publisher, batch_size=4)
+    targets = [('retry.5m', 'a'), ('retry.5m', 'b'), ('retry.15m', 'a'), ('retry.5m', 'a')]
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(
+            lambda target: handler._retry_messages_bulk(target[0], target[1], b'x'),
+            targets
+        ))
+
+    assert results == [True] * 4
+    assert sorted((exchange, key, len(bodies)) for exchange, key, bodies in publisher.calls) == [
+        ('retry.15m', 'a', 1), ('retry.5m', 'a', 2), ('retry.5m', 'b', 1)
+    ]
+
+
+def test_a_failed_publish_fails_every_retry_in_the_batch(mq_connection, monkeypatch):
+    monkeypatch.setattr(dead_letter, 'RETRY_BATCH_LINGER_SECONDS', 5.0)
+
+    class FailingPublisher(RecordingPublisher):
+        def publish_raw_batch(self, bodies, routing_key, priority=0, exchange=None, timeout=30.0):
+            raise RuntimeError('channel closed')
+
+    handler = make_handler(mq_connection, FailingPublisher(), batch_size=3)
+    with ThreadPoolExecutor(3) as pool:
+        results = list(pool.map(
+            lambda i: handler._retry_messages_bulk('retry.5m', 'rk', b'x'), range(3)
+        ))
+    assert results == [False] * 3
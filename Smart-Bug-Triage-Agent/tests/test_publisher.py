@@ -0,0 +1,122 @@
+"""Tests for MessagePublisher batch confirms and MessageBatcher flush thresholds."""
+
+import threading
+import time
+
+from smart_bug_triage.message_queue import BatchConfig, MessageBatcher, MessagePublisher
+from smart_bug_triage.message_queue.serialization import MessageSerializer, MessageType
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll ``predicate`` until it is true or ``timeout`` seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class RecordingPublisher:
+    """Stands in for MessagePublisher; records the batches a MessageBatcher flushes."""
+
+    _wire_format = 'json'
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def _publish_serialized(self, bodies, routing_key, priority, timeout, exchange=None):
+        with self.lock:
+            self.batches.append((routing_key, priority, len(bodies)))
+        return [True] * len(bodies)
+
+
+def test_batcher_flushes_a_group_at_max_size():
+    publisher = RecordingPublisher()
+    batcher = MessageBatcher(publisher, BatchConfig(max_size=3, max_latency_ms=10_000))
+    for i in range(2):
+        assert batcher.add({'i': i}, MessageType.NOTIFICATION, 'rk')
+    assert publisher.batches == []
+
+    batcher.add({'i': 2}, MessageType.NOTIFICATION, 'rk')
+    # The add that fills the group publishes it on the calling thread
+    assert publisher.batches == [('rk', 0, 3)]
+    batcher.close()
+    assert publisher.batches == [('rk', 0, 3)]
+
+
+def test_batcher_flushes_a_group_at_max_bytes():
+    size = len(MessageSerializer.serialize({'i': 0}, MessageType.NOTIFICATION))
+    publisher = RecordingPublisher()
+    batcher = MessageBatcher(
+        publisher, BatchConfig(max_size=100, max_latency_ms=10_000, max_bytes=2 * size)
+    )
+    batcher.add({'i': 0}, MessageType.NOTIFICATION, 'rk')
+    assert publisher.batches == []
+    batcher.add({'i': 1}, MessageType.NOTIFICATION, 'rk')
+    assert publisher.batches == [('rk', 0, 2)]
+    batcher.close()
+
+
+def test_batcher_groups_by_routing_key_and_priority():
+    publisher = RecordingPublisher()
+    batcher = MessageBatcher(publisher, BatchConfig(max_size=2, max_latency_ms=10_000))
+    batcher.add({'i': 0}, MessageType.NOTIFICATION, 'a')
+    batcher.add({'i': 1}, MessageType.NOTIFICATION, 'b')
+    batcher.add({'i': 2}, MessageType.NOTIFICATION, 'a', priority=5)
+    assert publisher.batches == []
+
+    batcher.add({'i': 3}, MessageType.NOTIFICATION, 'a')
+    assert publisher.batches == [('a', 0, 2)]
+    batcher.flush()
+    assert sorted(publisher.batches) == [('a', 0, 2), ('a', 5, 1), ('b', 0, 1)]
+
+
+def test_batcher_flushes_after_max_latency():
+    publisher = RecordingPublisher()
+    batcher = MessageBatcher(publisher, BatchConfig(max_size=100, max_latency_ms=50))
+    batcher.add({'i': 0}, MessageType.NOTIFICATION, 'rk')
+    batcher.add({'i': 1}, MessageType.NOTIFICATION, 'rk')
+    assert publisher.batches == []
+    assert wait_for(lambda: publisher.batches == [('rk', 0, 2)], 1.0)
+    batcher.close()
+
+
+def test_batcher_close_flushes_and_rejects_later_messages():
+    publisher = RecordingPublisher()
+    batcher = MessageBatcher(publisher, BatchConfig(max_size=100, max_latency_ms=10_000))
+    batcher.add({'i': 0}, MessageType.NOTIFICATION, 'rk')
+    batcher.close()
+    assert publisher.batches == [('rk', 0, 1)]
+    assert batcher.add({'i': 1}, MessageType.NOTIFICATION, 'rk') is False
+
+
+def test_batched_publisher_flushes_without_anyone_driving_the_connection(mq_connection, fake_pika):
+    publisher = MessagePublisher(mq_connection, BatchConfig(max_size=100, max_latency_ms=50))
+    for i in range(3):
+        assert publisher.publish_notification({'n': i})
+
+    assert wait_for(lambda: publisher.get_publish_stats()['total_published'] == 3)
+    assert len(publisher._confirm_channel.published) == 3
+    publisher.close()
+    assert fake_pika[0].violations == []
+
+
+def test_publish_batch_reports_nacked_messages(mq_connection, fake_pika):
+    raw = fake_pika[0]
+    raw.confirm_plan = lambda channel, seq: channel.confirm(seq, ack=seq != 2)
+    publisher = MessagePublisher(mq_connection)
+    messages = [({'i': i}, MessageType.SYSTEM_EVENT) for i in range(3)]
+
+    result = publisher.publish_batch(messages, 'rk', timeout=2)
+    assert result == {'success': 2, 'failed': 1}
+
+
+def test_publish_batch_gives_up_on_missing_confirms(mq_connection, fake_pika):
+    fake_pika[0].confirm_plan = lambda channel, seq: None
+    publisher = MessagePublisher(mq_connection)
+    started = time.monotonic()
+    result = publisher.publish_batch([({'i': 0}, MessageType.SYSTEM_EVENT)], 'rk', timeout=0.2)
+    assert result == {'success': 0, 'failed': 1}
+    assert time.monotonic() - started < 1